@@ -154,6 +154,8 @@ rst_epilog = """
 
 .. |_MasterShapeTree| replace:: :class:`_MasterShapeTree`
 
+.. |_MemoryBudget| replace:: :class:`._MemoryBudget`
+
 .. |None| replace:: :class:`None`
 
 .. |NotImplementedError| replace:: :exc:`NotImplementedError`
@@ -202,6 +204,10 @@ rst_epilog = """
 
 .. |ShapeCollection| replace:: :class:`.ShapeCollection`
 
+.. |ShapeGeometry| replace:: :class:`.ShapeGeometry`
+
+.. |ShapeSpec| replace:: :class:`.ShapeSpec`
+
 .. |ShapeTree| replace:: :class:`.ShapeTree`
 
 .. |Slide| replace:: :class:`Slide`
@@ -216,12 +222,20 @@ rst_epilog = """
 
 .. |_SlideShapeTree| replace:: :class:`._SlideShapeTree`
 
+.. |SpatialIndex| replace:: :class:`.SpatialIndex`
+
 .. |str| replace:: :class:`str`
 
 .. |Table| replace:: :class:`Table`
 
 .. |TextFrame| replace:: :class:`.TextFrame`
 
+.. |TextIndex| replace:: :class:`.TextIndex`
+
+.. |TextPosition| replace:: :class:`.TextPosition`
+
+.. |TextRecord| replace:: :class:`.TextRecord`
+
 .. |TickLabels| replace:: :class:`.TickLabels`
 
 .. |True| replace:: :class:`True`
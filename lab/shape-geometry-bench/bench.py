@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# bench.py
+#
+
+"""
+Time setting left/top/width/height on a large number of shapes. Exercises
+the simple-type conversions on the ``<a:off>`` and ``<a:ext>`` attribute
+paths.
+
+Usage: python bench.py [shape_count]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+
+from copy import deepcopy
+
+from pptx import Presentation
+from pptx.util import Emu
+
+
+def make_shapes(count):
+    """
+    Clone a single textbox *count* times rather than adding each one so
+    shape-id allocation does not dominate the setup time.
+    """
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    textbox = slide.shapes.add_textbox(0, 0, Emu(914400), Emu(914400))
+    sp, spTree = textbox._element, slide.shapes._spTree
+    for _ in range(count-1):
+        spTree.append(deepcopy(sp))
+    return list(slide.shapes)
+
+
+def set_geometry(shapes):
+    for idx, shape in enumerate(shapes):
+        shape.left = idx
+        shape.top = idx
+        shape.width = idx + 914400
+        shape.height = idx + 457200
+
+
+def get_geometry(shapes):
+    for shape in shapes:
+        shape.left, shape.top, shape.width, shape.height
+
+
+def timed(label, func, *args):
+    start = time.time()
+    func(*args)
+    elapsed = time.time() - start
+    print('%-24s %8.3f sec' % (label, elapsed))
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print('building %d shapes ...' % count)
+    shapes = make_shapes(count)
+    timed('set left/top/width/height', set_geometry, shapes)
+    timed('get left/top/width/height', get_geometry, shapes)
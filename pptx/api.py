@@ -34,6 +34,17 @@ class Presentation(object):
         """
         return self._package.core_properties
 
+    @property
+    def memory_budget(self):
+        """
+        |_MemoryBudget| object for this presentation. Assigning an integer to
+        its ``max_parsed_slides`` property limits the number of slides
+        held in memory as parsed XML, which is useful when generating very
+        large presentations. A slide counts against the limit until it is
+        passed to the budget's ``release()`` method.
+        """
+        return self._package.memory_budget
+
     @property
     def slide_layouts(self):
         """
@@ -124,9 +135,12 @@ class Presentation(object):
         """
         return self._presentation.slides
 
-    def save(self, file):
+    def save(self, file, minify=False):
         """
         Save this presentation to *file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. When *minify* is |True|,
+        non-significant whitespace and redundant namespace declarations are
+        removed from the XML of each part, producing a smaller file that is
+        faster to parse.
         """
-        return self._package.save(file)
+        return self._package.save(file, minify)
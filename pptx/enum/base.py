@@ -191,8 +191,15 @@ class XmlEnumeration(Enumeration):
     @classmethod
     def to_xml(cls, enum_val):
         """
-        Return the XML value of the enumeration value *enum_val*.
+        Return the XML value of the enumeration value *enum_val*. Every
+        XML-mapped member is a valid setting, so a hit in the mapping needs
+        no further validation; anything else is validated the long way to
+        raise the appropriate exception.
         """
+        try:
+            return cls._member_to_xml[enum_val]
+        except (KeyError, TypeError):
+            pass
         cls.validate(enum_val)
         return cls._member_to_xml[enum_val]
 
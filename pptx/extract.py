@@ -0,0 +1,368 @@
+# encoding: utf-8
+
+"""
+Read-only extraction of text and structure from a .pptx package. Slide XML
+is streamed with ``iterparse()`` straight out of the physical package, so no
+custom element classes or shape proxies are constructed and only one slide
+part is held in memory at a time. |TextIndex| builds on this to search the
+text of many decks.
+"""
+
+from __future__ import absolute_import
+
+import gzip
+import json
+import re
+
+from lxml import etree
+
+from .compat import BytesIO, is_string, to_unicode
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI
+from .opc.phys_pkg import PhysPkgReader
+from .opc.pkgreader import PackageReader
+from .oxml.ns import qn
+
+
+def iter_text_records(pkg_file):
+    """
+    Generate a |TextRecord| for each paragraph in the slides of the package
+    at *pkg_file*, in slide order and then in document order within each
+    slide. *pkg_file* can be a path to a .pptx file, a path to a directory
+    containing an expanded package, or a file-like object.
+    """
+    phys_reader = PhysPkgReader(pkg_file)
+    try:
+        extractor = _TextExtractor(phys_reader)
+        for record in extractor.iter_records():
+            yield record
+    finally:
+        phys_reader.close()
+
+
+class TextIndex(object):
+    """
+    Inverted index from each term in the slide text of one or more decks to
+    the paragraphs containing it, for finding the slides mentioning a term
+    without opening the decks again. A term is a run of letters, digits, and
+    underscores, compared case-insensitively. An index can be saved to
+    a compact gzipped file and loaded again with :meth:`load`.
+    """
+    _version = 1
+    _term_re = re.compile(r'\w+', re.UNICODE)
+
+    def __init__(self, decks=None, postings=None):
+        super(TextIndex, self).__init__()
+        self._decks = [] if decks is None else decks
+        self._postings = {} if postings is None else postings
+
+    def add(self, pkg_file, name=None):
+        """
+        Add the text of the deck in *pkg_file* to this index, where it is
+        identified by *name*. *pkg_file* can be anything accepted by
+        :func:`iter_text_records`. *name* defaults to *pkg_file* when that is
+        a path, and is required when it is a file-like object. Raises
+        |ValueError| if a deck named *name* is already indexed. The index is
+        left unchanged if the deck cannot be read, so adding it can be
+        retried.
+        """
+        if name is None:
+            if not is_string(pkg_file):
+                raise ValueError('name is required for a file-like object')
+            name = pkg_file
+        if name in self._decks:
+            raise ValueError("deck '%s' is already indexed" % name)
+        deck_idx = len(self._decks)
+        deck_postings = {}
+        for record in iter_text_records(pkg_file):
+            shape_id = -1 if record.shape_id is None else record.shape_id
+            position = (
+                deck_idx, record.slide_idx, shape_id, record.paragraph_idx
+            )
+            for term in set(self._terms(record.text)):
+                deck_postings.setdefault(term, []).extend(position)
+        self._decks.append(name)
+        postings = self._postings
+        for term, positions in deck_postings.items():
+            postings.setdefault(term, []).extend(positions)
+
+    @property
+    def decks(self):
+        """
+        Sequence of the names of the decks in this index, in the order they
+        were added.
+        """
+        return tuple(self._decks)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Return a |TextIndex| loaded from the file at *path*, previously
+        written by :meth:`save`. Raises |ValueError| if the file was written
+        by an incompatible version.
+        """
+        with gzip.open(path, 'rb') as f:
+            index = json.loads(f.read().decode('utf-8'))
+        if index.get('version') != cls._version:
+            raise ValueError('unsupported text index version')
+        return cls(index['decks'], index['postings'])
+
+    def save(self, path):
+        """
+        Write this index to a gzipped JSON file at *path*. The positions of
+        each term are stored as a flat list of integers.
+        """
+        index = {
+            'version': self._version,
+            'decks': self._decks,
+            'postings': self._postings,
+        }
+        with gzip.open(path, 'wb') as f:
+            f.write(json.dumps(index, separators=(',', ':')).encode('utf-8'))
+
+    def search(self, query):
+        """
+        Return a sorted list of |TextPosition| objects locating each
+        paragraph containing every term in *query*. The postings of the
+        rarest term are intersected with those of the others, so the cost
+        depends on how often the terms occur, not on the size of the index.
+        """
+        terms = set(self._terms(query))
+        if not terms:
+            return []
+        flat_postings = sorted(
+            (self._postings.get(term, []) for term in terms), key=len
+        )
+        positions = set(self._positions(flat_postings[0]))
+        for flat_positions in flat_postings[1:]:
+            if not positions:
+                break
+            positions.intersection_update(self._positions(flat_positions))
+        decks = self._decks
+        return [
+            TextPosition(
+                decks[deck_idx], slide_idx,
+                None if shape_id == -1 else shape_id, paragraph_idx
+            )
+            for deck_idx, slide_idx, shape_id, paragraph_idx
+            in sorted(positions)
+        ]
+
+    @staticmethod
+    def _positions(flat_positions):
+        """
+        Generate a (deck_idx, slide_idx, shape_id, paragraph_idx) 4-tuple for
+        each position in *flat_positions*, the form in which the positions
+        of a term are stored.
+        """
+        for idx in range(0, len(flat_positions), 4):
+            yield tuple(flat_positions[idx:idx+4])
+
+    @classmethod
+    def _terms(cls, text):
+        """
+        Return a list of the lower-cased terms in *text*, in order.
+        """
+        return [term.lower() for term in cls._term_re.findall(text)]
+
+
+class TextPosition(tuple):
+    """
+    Value object locating a paragraph found by :meth:`TextIndex.search`.
+    """
+    def __new__(cls, deck, slide_idx, shape_id, paragraph_idx):
+        return tuple.__new__(cls, (deck, slide_idx, shape_id, paragraph_idx))
+
+    @property
+    def deck(self):
+        """
+        Name of the deck containing the paragraph, as given to
+        :meth:`TextIndex.add`.
+        """
+        return self[0]
+
+    @property
+    def paragraph_idx(self):
+        """
+        Zero-based position of the paragraph within its shape, as in
+        |TextRecord|.
+        """
+        return self[3]
+
+    @property
+    def shape_id(self):
+        """
+        Integer id of the shape containing the paragraph, |None| if the
+        shape has no valid id.
+        """
+        return self[2]
+
+    @property
+    def slide_idx(self):
+        """
+        Zero-based position of the slide containing the paragraph.
+        """
+        return self[1]
+
+
+class TextRecord(tuple):
+    """
+    Value object describing a single paragraph of slide text and the shape
+    it appears in.
+    """
+    def __new__(cls, slide_idx, shape_id, shape_name, paragraph_idx, text):
+        return tuple.__new__(
+            cls, (slide_idx, shape_id, shape_name, paragraph_idx, text)
+        )
+
+    @property
+    def paragraph_idx(self):
+        """
+        Zero-based position of this paragraph within its shape. Paragraphs
+        in each cell of a table are counted in sequence across the table.
+        """
+        return self[3]
+
+    @property
+    def shape_id(self):
+        """
+        Integer id of the shape containing this paragraph, |None| if the
+        shape has no valid id.
+        """
+        return self[1]
+
+    @property
+    def shape_name(self):
+        """
+        Name of the shape containing this paragraph, e.g. 'Title 1'.
+        """
+        return self[2]
+
+    @property
+    def slide_idx(self):
+        """
+        Zero-based position of the slide containing this paragraph in the
+        slide sequence of the presentation.
+        """
+        return self[0]
+
+    @property
+    def text(self):
+        """
+        Unicode text of this paragraph. Line breaks appear as a line feed
+        character ('\\\\n').
+        """
+        return self[4]
+
+
+class _TextExtractor(object):
+    """
+    Walks the presentation part and slide parts of a physical package,
+    streaming paragraph text out of each slide.
+    """
+    _shape_tags = (
+        qn('p:sp'), qn('p:grpSp'), qn('p:graphicFrame'), qn('p:cxnSp'),
+        qn('p:pic'), qn('p:contentPart')
+    )
+
+    def __init__(self, phys_reader):
+        super(_TextExtractor, self).__init__()
+        self._phys_reader = phys_reader
+
+    def iter_records(self):
+        """
+        Generate a |TextRecord| for each paragraph in each slide of the
+        package, in slide order.
+        """
+        for slide_idx, partname in enumerate(self._iter_slide_partnames()):
+            blob = self._phys_reader.blob_for(partname)
+            for record in self._iter_slide_records(slide_idx, blob):
+                yield record
+
+    def _iter_slide_partnames(self):
+        """
+        Generate the partname of each slide in the presentation, in the
+        order specified by its ``<p:sldIdLst>`` element.
+        """
+        prs_partname = self._partname_related_by(
+            PACKAGE_URI, RT.OFFICE_DOCUMENT
+        )
+        slide_partnames = dict(
+            (srel.rId, srel.target_partname)
+            for srel in PackageReader.srels_for(
+                self._phys_reader, prs_partname
+            )
+            if not srel.is_external and srel.reltype == RT.SLIDE
+        )
+        prs_blob = self._phys_reader.blob_for(prs_partname)
+        sldId_tag, rId_attr = qn('p:sldId'), qn('r:id')
+        for event, sldId in etree.iterparse(
+                BytesIO(prs_blob), tag=sldId_tag):
+            rId = sldId.get(rId_attr)
+            sldId.clear()
+            if rId in slide_partnames:
+                yield slide_partnames[rId]
+
+    def _iter_slide_records(self, slide_idx, blob):
+        """
+        Generate a |TextRecord| for each paragraph in the slide XML in
+        *blob*. Each paragraph and shape element is cleared as soon as it has
+        been processed so memory use does not grow with slide size.
+        """
+        cNvPr_tag, p_tag = qn('p:cNvPr'), qn('a:p')
+        t_tag, br_tag = qn('a:t'), qn('a:br')
+        shape_tags = self._shape_tags
+        tags = (cNvPr_tag, p_tag) + shape_tags
+
+        shape_id, shape_name, paragraph_idx = None, None, 0
+        events = etree.iterparse(
+            BytesIO(blob), events=('start', 'end'), tag=tags
+        )
+        for event, elm in events:
+            tag = elm.tag
+            if event == 'start':
+                if tag == cNvPr_tag:
+                    shape_id = self._shape_id(elm.get('id'))
+                    shape_name = elm.get('name')
+                    paragraph_idx = 0
+                continue
+            if tag == p_tag:
+                text = u''.join(
+                    u'\n' if t.tag == br_tag else (t.text or u'')
+                    for t in elm.iter(t_tag, br_tag)
+                )
+                yield TextRecord(
+                    slide_idx, shape_id, shape_name, paragraph_idx,
+                    to_unicode(text)
+                )
+                paragraph_idx += 1
+                elm.clear()
+            elif tag in shape_tags:
+                elm.clear()
+                while elm.getprevious() is not None:
+                    del elm.getparent()[0]
+
+    def _partname_related_by(self, source_uri, reltype):
+        """
+        Return the partname of the part related to *source_uri* by
+        a relationship of *reltype*. Raises |KeyError| if no such
+        relationship is present.
+        """
+        for srel in PackageReader.srels_for(self._phys_reader, source_uri):
+            if srel.is_external:
+                continue
+            if srel.reltype == reltype:
+                return srel.target_partname
+        raise KeyError("no relationship of type '%s' from '%s'" % (
+            reltype, source_uri
+        ))
+
+    @staticmethod
+    def _shape_id(id_str):
+        """
+        Return the integer value of *id_str*, or |None| if it is missing or
+        not a valid integer.
+        """
+        if id_str is None or not id_str.isdigit():
+            return None
+        return int(id_str)
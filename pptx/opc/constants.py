@@ -339,6 +339,9 @@ class NAMESPACE(object):
         'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDraw'
         'ing'
     )
+    MARKUP_COMPATIBILITY = (
+        'http://schemas.openxmlformats.org/markup-compatibility/2006'
+    )
     OFC_RELATIONSHIPS = (
         'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
     )
@@ -351,6 +354,7 @@ class NAMESPACE(object):
     WML_MAIN = (
         'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
     )
+    XML = 'http://www.w3.org/XML/1998/namespace'
 
 
 class RELATIONSHIP_TARGET_MODE(object):
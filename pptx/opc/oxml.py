@@ -9,6 +9,8 @@ the package related custom element classes.
 
 from __future__ import absolute_import
 
+from copy import deepcopy
+
 from lxml import etree
 
 from .constants import NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM
@@ -27,6 +29,13 @@ nsmap = {
     'r':  NS.OFC_RELATIONSHIPS,
 }
 
+_MC_PREFIX_ATTR_NAMES = tuple(
+    '{%s}%s' % (NS.MARKUP_COMPATIBILITY, local_name)
+    for local_name in ('Ignorable', 'MustUnderstand', 'ProcessContent')
+)
+_MC_CHOICE_TAG = '{%s}Choice' % NS.MARKUP_COMPATIBILITY
+_XML_SPACE_ATTR_NAME = '{%s}space' % NS.XML
+
 
 def oxml_tostring(elm, encoding=None, pretty_print=False, standalone=None):
     return etree.tostring(
@@ -35,11 +44,85 @@ def oxml_tostring(elm, encoding=None, pretty_print=False, standalone=None):
     )
 
 
-def serialize_part_xml(part_elm):
+def serialize_part_xml(part_elm, minify=False):
+    """
+    Return the XML for *part_elm* as bytes, complete with an XML declaration,
+    suitable for storing as a part in the package. When *minify* is |True|,
+    non-significant whitespace and redundant namespace declarations are
+    left out. *part_elm* itself is not changed.
+    """
+    if minify:
+        part_elm = _minified(part_elm)
     xml = etree.tostring(part_elm, encoding='UTF-8', standalone=True)
     return xml
 
 
+def _minified(root_elm):
+    """
+    Return a copy of the tree rooted at *root_elm* with whitespace-only text
+    and tails that cannot be significant removed, along with namespace
+    declarations below the root that are redundant or unused. Whitespace
+    within an element marked ``xml:space="preserve"`` is kept. Declarations
+    on the root element are retained, as are those for prefixes named in
+    markup-compatibility attributes such as ``mc:Ignorable`` and the
+    ``Requires`` attribute of ``mc:Choice``, since these refer to a
+    namespace by prefix rather than using it.
+    """
+    root_elm = deepcopy(root_elm)
+    preserving_elms = set()
+    for elm in root_elm.iter():
+        # a tail is content of the parent, so the parent's setting applies
+        parent_preserves = elm.getparent() in preserving_elms
+        space = elm.get(_XML_SPACE_ATTR_NAME)
+        preserves = (
+            parent_preserves if space is None else space == 'preserve'
+        )
+        if preserves:
+            preserving_elms.add(elm)
+        text, tail = elm.text, elm.tail
+        if not preserves and text is not None and len(elm) and (
+                not text.strip()):
+            elm.text = None
+        if not parent_preserves and tail is not None and not tail.strip():
+            elm.tail = None
+    root_nsmap = root_elm.nsmap
+    keep_ns_prefixes = set(prefix for prefix in root_nsmap if prefix)
+    keep_ns_prefixes.update(_mc_prefixes(root_elm))
+    try:
+        etree.cleanup_namespaces(
+            root_elm, top_nsmap=root_nsmap,
+            keep_ns_prefixes=sorted(keep_ns_prefixes)
+        )
+    except TypeError:
+        # lxml < 3.5 lacks these options, unused declarations only, and
+        # can't leave those used by markup-compatibility attributes
+        if keep_ns_prefixes.issubset(root_nsmap):
+            for child in root_elm:
+                etree.cleanup_namespaces(child)
+    return root_elm
+
+
+def _mc_prefixes(root_elm):
+    """
+    Return the set of namespace prefixes referred to by markup-compatibility
+    attributes in the tree rooted at *root_elm*.
+    """
+    prefixes = set()
+    for elm in root_elm.iter(etree.Element):
+        attrib = elm.attrib
+        if not attrib:
+            continue
+        for attr_name in _MC_PREFIX_ATTR_NAMES:
+            value = attrib.get(attr_name)
+            if value:
+                prefixes.update(
+                    qname.split(':')[0] for qname in value.split()
+                )
+        if elm.tag == _MC_CHOICE_TAG:
+            prefixes.update(attrib.get('Requires', '').split())
+    return prefixes
+
+
 class CT_Default(BaseOxmlElement):
     """
     ``<Default>`` element, specifying the default content type to be applied
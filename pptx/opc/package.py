@@ -40,14 +40,15 @@ class OpcPackage(object):
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_parts(source, visited=list()):
+        def walk_parts(source, visited=None):
+            visited = set() if visited is None else visited
             for rel in source.rels.values():
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
                 new_source = part
                 for part in walk_parts(new_source, visited):
@@ -62,7 +63,7 @@ class OpcPackage(object):
         performing a depth-first traversal of the rels graph.
         """
         def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
+            visited = set() if visited is None else visited
             for rel in source.rels.values():
                 yield rel
                 if rel.is_external:
@@ -70,7 +71,7 @@ class OpcPackage(object):
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 new_source = part
                 for rel in walk_rels(new_source, visited):
                     yield rel
@@ -106,7 +107,7 @@ class OpcPackage(object):
         containing a single replacement item, a '%d' to be used to insert the
         integer portion of the partname. Example: '/ppt/slides/slide%d.xml'
         """
-        partnames = [part.partname for part in self.iter_parts()]
+        partnames = set(part.partname for part in self.iter_parts())
         for n in range(1, len(partnames)+2):
             candidate_partname = tmpl % n
             if candidate_partname not in partnames:
@@ -156,14 +157,16 @@ class OpcPackage(object):
         """
         return RelationshipCollection(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, minify=False):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. When *minify* is |True|,
+        non-significant whitespace and redundant namespace declarations are
+        removed from the XML of each part as it is written.
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(pkg_file, self.rels, self.parts, minify)
 
 
 class Part(object):
@@ -241,6 +244,16 @@ class Part(object):
         """
         return self.rels.add_relationship(reltype, target, rId, is_external)
 
+    @property
+    def minified_blob(self):
+        """
+        Contents of this part as written when a package is saved minified.
+        The same as :attr:`blob`, since the markup of a part this library
+        has not parsed, such as an SVG image or custom XML data, may depend
+        on whitespace. |XmlPart| overrides this to minify its XML.
+        """
+        return self.blob
+
     @property
     def package(self):
         """
@@ -350,6 +363,14 @@ class XmlPart(Part):
         element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
+    @property
+    def minified_blob(self):
+        """
+        XML of this part serialized without non-significant whitespace or
+        redundant namespace declarations.
+        """
+        return serialize_part_xml(self._element, minify=True)
+
     @property
     def part(self):
         """
@@ -393,6 +414,13 @@ class RelationshipCollection(dict):
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
 
+    def __delitem__(self, rId):
+        """
+        Remove the relationship identified by *rId*, e.g. ``del rels[rId]``.
+        """
+        super(RelationshipCollection, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
         Return a newly added |_Relationship| instance.
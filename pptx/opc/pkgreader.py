@@ -31,7 +31,7 @@ class PackageReader(object):
         """
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+        pkg_srels = PackageReader.srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
             phys_reader, pkg_srels, content_types
         )
@@ -57,6 +57,18 @@ class PackageReader(object):
             for srel in spart.srels:
                 yield (spart.partname, srel)
 
+    @staticmethod
+    def srels_for(phys_reader, source_uri):
+        """
+        Return |_SerializedRelationshipCollection| instance populated with
+        relationships for source identified by *source_uri* in the package
+        read by *phys_reader*. Lets the relationships of a single part be
+        read without loading the rest of the package.
+        """
+        rels_xml = phys_reader.rels_xml_for(source_uri)
+        return _SerializedRelationshipCollection.load_from_xml(
+            source_uri.baseURI, rels_xml)
+
     @staticmethod
     def _load_serialized_parts(phys_reader, pkg_srels, content_types):
         """
@@ -72,16 +84,6 @@ class PackageReader(object):
             sparts.append(spart)
         return tuple(sparts)
 
-    @staticmethod
-    def _srels_for(phys_reader, source_uri):
-        """
-        Return |_SerializedRelationshipCollection| instance populated with
-        relationships for source identified by *source_uri*.
-        """
-        rels_xml = phys_reader.rels_xml_for(source_uri)
-        return _SerializedRelationshipCollection.load_from_xml(
-            source_uri.baseURI, rels_xml)
-
     @staticmethod
     def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
         """
@@ -97,7 +99,7 @@ class PackageReader(object):
             if partname in visited_partnames:
                 continue
             visited_partnames.append(partname)
-            part_srels = PackageReader._srels_for(phys_reader, partname)
+            part_srels = PackageReader.srels_for(phys_reader, partname)
             try:
                 blob = phys_reader.blob_for(partname)
             except KeyError: # if not find
@@ -23,16 +23,17 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, minify=False):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. The XML of each part is written without
+        non-significant whitespace when *minify* is |True|.
         """
         phys_writer = PhysPkgWriter(pkg_file)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        PackageWriter._write_parts(phys_writer, parts, minify)
         phys_writer.close()
 
     @staticmethod
@@ -47,13 +48,15 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, content_types_blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, minify=False):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. The
+        minified blob of each part is written when *minify* is |True|.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            blob = part.minified_blob if minify else part.blob
+            phys_writer.write(part.partname, blob)
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
@@ -130,7 +130,16 @@ def qn(namespace_prefixed_tag):
     Return a Clark-notation qualified tag name corresponding to
     *namespace_prefixed_tag*, a string like 'p:body'. 'qn' stands for
     *qualified name*. As an example, ``qn('p:cSld')`` returns
-    ``'{http://schemas.../main}cSld'``.
+    ``'{http://schemas.../main}cSld'``. Results are memoized since the
+    same few dozen tags are looked up on every element access.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    try:
+        return _qn_cache[namespace_prefixed_tag]
+    except KeyError:
+        pass
+    clark_name = NamespacePrefixedTag(namespace_prefixed_tag).clark_name
+    _qn_cache[namespace_prefixed_tag] = clark_name
+    return clark_name
+
+
+_qn_cache = {}
@@ -6,12 +6,22 @@ Custom element classes for presentation-related XML elements.
 
 from __future__ import absolute_import
 
+from lxml import etree
+
+from ..ns import _nsmap
 from ..simpletypes import ST_SlideId, ST_SlideSizeCoordinate, XsdString
 from ..xmlchemy import (
     BaseOxmlElement, RequiredAttribute, ZeroOrOne, ZeroOrMore
 )
 
 
+# compiled once, and returning plain strings, since it is evaluated every
+# time a slide is added
+_sldId_id_xpath = etree.XPath(
+    './p:sldId/@id', namespaces=_nsmap, smart_strings=False
+)
+
+
 class CT_Presentation(BaseOxmlElement):
     """
     ``<p:presentation>`` element, root of the Presentation part stored as
@@ -54,8 +64,8 @@ class CT_SlideIdList(BaseOxmlElement):
         Return the next available slide ID as an int. Valid slide IDs start
         at 256. Unused ids in the sequences starting from 256 are used first.
         """
-        id_str_lst = self.xpath('./p:sldId/@id')
-        used_ids = [int(id_str) for id_str in id_str_lst]
+        id_str_lst = _sldId_id_xpath(self)
+        used_ids = set(int(id_str) for id_str in id_str_lst)
         for n in range(256, 258+len(used_ids)):
             if n not in used_ids:
                 return n
@@ -124,11 +124,28 @@ class CT_Shape(BaseShapeElement):
         """
         Return a new ``<p:sp>`` element tree configured as a base auto shape.
         """
-        tmpl = CT_Shape._autoshape_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height, prst)
+        xml = CT_Shape.new_autoshape_sp_xml(
+            id_, name, prst, left, top, width, height, nsdecls('a', 'p')
+        )
         sp = parse_xml(xml)
         return sp
 
+    @staticmethod
+    def new_autoshape_sp_xml(id_, name, prst, left, top, width, height,
+                             nsdecls_str='', fill_xml='', text_xml=''):
+        """
+        Return the XML for a new ``<p:sp>`` element configured as a base auto
+        shape. *fill_xml* is inserted as the fill of the shape and
+        *text_xml* as the content of its paragraph. Namespace declarations
+        are only included when provided in *nsdecls_str*, allowing many shapes
+        to be parsed at once under a single declaring parent.
+        """
+        tmpl = CT_Shape._autoshape_sp_tmpl()
+        return tmpl % (
+            nsdecls_str, id_, name, left, top, width, height, prst, fill_xml,
+            text_xml
+        )
+
     @staticmethod
     def new_placeholder_sp(id_, name, ph_type, orient, sz, idx):
         """
@@ -162,11 +179,27 @@ class CT_Shape(BaseShapeElement):
         Return a new ``<p:sp>`` element tree configured as a base textbox
         shape.
         """
-        tmpl = CT_Shape._textbox_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height)
+        xml = CT_Shape.new_textbox_sp_xml(
+            id_, name, left, top, width, height, nsdecls('a', 'p')
+        )
         sp = parse_xml(xml)
         return sp
 
+    @staticmethod
+    def new_textbox_sp_xml(id_, name, left, top, width, height,
+                           nsdecls_str='', fill_xml='<a:noFill/>',
+                           text_xml=''):
+        """
+        Return the XML for a new ``<p:sp>`` element configured as a base
+        textbox shape. The parameters are the same as for
+        :meth:`new_autoshape_sp_xml`.
+        """
+        tmpl = CT_Shape._textbox_sp_tmpl()
+        return tmpl % (
+            nsdecls_str, id_, name, left, top, width, height, fill_xml,
+            text_xml
+        )
+
     @property
     def prst(self):
         """
@@ -191,18 +224,19 @@ class CT_Shape(BaseShapeElement):
         return (
             '<p:sp %s>\n'
             '  <p:nvSpPr>\n'
-            '    <p:cNvPr id="%s" name="%s"/>\n'
+            '    <p:cNvPr id="%d" name="%s"/>\n'
             '    <p:cNvSpPr/>\n'
             '    <p:nvPr/>\n'
             '  </p:nvSpPr>\n'
             '  <p:spPr>\n'
             '    <a:xfrm>\n'
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
+            '      <a:off x="%d" y="%d"/>\n'
+            '      <a:ext cx="%d" cy="%d"/>\n'
             '    </a:xfrm>\n'
             '    <a:prstGeom prst="%s">\n'
             '      <a:avLst/>\n'
             '    </a:prstGeom>\n'
+            '    %s\n'
             '  </p:spPr>\n'
             '  <p:style>\n'
             '    <a:lnRef idx="1">\n'
@@ -222,11 +256,10 @@ class CT_Shape(BaseShapeElement):
             '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
             '    <a:lstStyle/>\n'
             '    <a:p>\n'
-            '      <a:pPr algn="ctr"/>\n'
+            '      <a:pPr algn="ctr"/>%s\n'
             '    </a:p>\n'
             '  </p:txBody>\n'
-            '</p:sp>' %
-            (nsdecls('a', 'p'), '%d', '%s', '%d', '%d', '%d', '%d', '%s')
+            '</p:sp>'
         )
 
     def _new_txBody(self):
@@ -252,29 +285,28 @@ class CT_Shape(BaseShapeElement):
         return (
             '<p:sp %s>\n'
             '  <p:nvSpPr>\n'
-            '    <p:cNvPr id="%s" name="%s"/>\n'
+            '    <p:cNvPr id="%d" name="%s"/>\n'
             '    <p:cNvSpPr txBox="1"/>\n'
             '    <p:nvPr/>\n'
             '  </p:nvSpPr>\n'
             '  <p:spPr>\n'
             '    <a:xfrm>\n'
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
+            '      <a:off x="%d" y="%d"/>\n'
+            '      <a:ext cx="%d" cy="%d"/>\n'
             '    </a:xfrm>\n'
             '    <a:prstGeom prst="rect">\n'
             '      <a:avLst/>\n'
             '    </a:prstGeom>\n'
-            '    <a:noFill/>\n'
+            '    %s\n'
             '  </p:spPr>\n'
             '  <p:txBody>\n'
             '    <a:bodyPr wrap="none">\n'
             '      <a:spAutoFit/>\n'
             '    </a:bodyPr>\n'
             '    <a:lstStyle/>\n'
-            '    <a:p/>\n'
+            '    <a:p>%s</a:p>\n'
             '  </p:txBody>\n'
-            '</p:sp>' %
-            (nsdecls('a', 'p'), '%d', '%s', '%d', '%d', '%d', '%d')
+            '</p:sp>'
         )
 
 
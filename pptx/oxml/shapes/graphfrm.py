@@ -129,6 +129,22 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         )
         return graphicFrame
 
+    @classmethod
+    def new_table_graphicFrame_from_text(cls, id_, name, text_rows, x, y,
+                                         cx, cy, col_weights=None):
+        """
+        Return a ``<p:graphicFrame>`` element tree populated with a table
+        element containing the unicode cell text in *text_rows*. The table
+        is sized to fill the graphic frame, see
+        :meth:`.CT_Table.new_tbl_from_text`.
+        """
+        graphicFrame = cls.new_graphicFrame(id_, name, x, y, cx, cy)
+        graphicFrame.graphic.graphicData.uri = GRAPHIC_DATA_URI_TABLE
+        graphicFrame.graphic.graphicData.append(
+            CT_Table.new_tbl_from_text(text_rows, cx, cy, col_weights)
+        )
+        return graphicFrame
+
     @classmethod
     def _graphicFrame_tmpl(cls):
         return (
@@ -6,9 +6,10 @@ lxml custom element classes for shape tree-related XML elements.
 
 from __future__ import absolute_import
 
+from .. import parse_xml
 from .autoshape import CT_Shape
 from .graphfrm import CT_GraphicalObjectFrame
-from ..ns import qn
+from ..ns import nsdecls, qn
 from .picture import CT_Picture
 from .shared import BaseShapeElement
 from ..xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
@@ -56,6 +57,26 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
+    def add_shapes_from_xml(self, shape_xmls):
+        """
+        Append a shape element for each XML string in *shape_xmls*, parsing
+        them all at once. The strings must not contain namespace
+        declarations; the ``a:``, ``p:`` and ``r:`` prefixes are declared on
+        a temporary parent. Return a list of the new shape elements, in
+        order.
+        """
+        xml = '<p:spTree %s>%s</p:spTree>' % (
+            nsdecls('a', 'p', 'r'), ''.join(shape_xmls)
+        )
+        shape_elms = list(parse_xml(xml))
+        extLst = self.find(qn('p:extLst'))
+        if extLst is None:
+            self.extend(shape_elms)
+        else:
+            for shape_elm in shape_elms:
+                extLst.addprevious(shape_elm)
+        return shape_elms
+
     def add_table(self, id_, name, rows, cols, x, y, cx, cy):
         """
         Append a ``<p:graphicFrame>`` shape containing a table as specified
@@ -67,6 +88,21 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(graphicFrame, 'p:extLst')
         return graphicFrame
 
+    def add_table_from_text(self, id_, name, text_rows, x, y, cx, cy,
+                            col_weights=None):
+        """
+        Append a ``<p:graphicFrame>`` shape containing a table filled with
+        the unicode cell text in *text_rows*.
+        """
+        new_graphicFrame = (
+            CT_GraphicalObjectFrame.new_table_graphicFrame_from_text
+        )
+        graphicFrame = new_graphicFrame(
+            id_, name, text_rows, x, y, cx, cy, col_weights
+        )
+        self.insert_element_before(graphicFrame, 'p:extLst')
+        return graphicFrame
+
     def add_textbox(self, id_, name, x, y, cx, cy):
         """
         Append a newly-created textbox ``<p:sp>`` shape having the specified
@@ -83,6 +119,24 @@ class CT_GroupShape(BaseShapeElement):
         """
         return self.grpSpPr.get_or_add_xfrm()
 
+    def iter_all_shape_elms(self):
+        """
+        Generate each shape element in this shape tree, including those
+        nested in group shapes at any depth, in document order. A group shape
+        element is generated just before the shapes it contains. Shape
+        elements in any other container, such as an
+        ``<mc:AlternateContent>`` element, are skipped, as they are by
+        :meth:`iter_shape_elms`.
+        """
+        grpSp_tag = qn('p:grpSp')
+        containers = set([self])
+        for elm in self.iterdescendants(*self._shape_tags):
+            if elm.getparent() not in containers:
+                continue
+            if elm.tag == grpSp_tag:
+                containers.add(elm)
+            yield elm
+
     def iter_shape_elms(self):
         """
         Generate each child of this ``<p:spTree>`` element that corresponds
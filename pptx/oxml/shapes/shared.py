@@ -6,8 +6,10 @@ Common shape-related oxml objects
 
 from __future__ import absolute_import
 
+from lxml import etree
+
 from ...enum.shapes import PP_PLACEHOLDER
-from ..ns import qn
+from ..ns import nsmap, qn
 from ..simpletypes import (
     ST_Angle, ST_Coordinate, ST_Direction, ST_DrawingElementId, ST_LineWidth,
     ST_PlaceholderSize, ST_PositiveCoordinate, XsdString, XsdUnsignedInt
@@ -19,6 +21,10 @@ from ..xmlchemy import (
 )
 
 
+# compiled once since placeholder lookups evaluate it for every shape
+_ph_xpath = etree.XPath('./*[1]/p:nvPr/p:ph', namespaces=nsmap('p'))
+
+
 class BaseShapeElement(BaseOxmlElement):
     """
     Provides common behavior for shape element classes like CT_Shape,
@@ -61,7 +67,7 @@ class BaseShapeElement(BaseOxmlElement):
         """
         The ``<p:ph>`` descendant element if there is one, None otherwise.
         """
-        ph_elms = self.xpath('./*[1]/p:nvPr/p:ph')
+        ph_elms = _ph_xpath(self)
         if len(ph_elms) == 0:
             return None
         return ph_elms[0]
@@ -340,8 +346,10 @@ class CT_Transform2D(BaseOxmlElement):
     Custom element class for <a:xfrm> element.
     """
     rot = OptionalAttribute('rot', ST_Angle, default=0.0)
-    off = ZeroOrOne('a:off', successors=('a:ext',))
-    ext = ZeroOrOne('a:ext', successors=())
+    off = ZeroOrOne('a:off', successors=('a:ext', 'a:chOff', 'a:chExt'))
+    ext = ZeroOrOne('a:ext', successors=('a:chOff', 'a:chExt'))
+    chOff = ZeroOrOne('a:chOff', successors=('a:chExt',))
+    chExt = ZeroOrOne('a:chExt', successors=())
 
     @property
     def x(self):
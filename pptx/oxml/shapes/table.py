@@ -8,9 +8,9 @@ from __future__ import absolute_import, division
 
 from .. import parse_xml
 from ...enum.text import MSO_VERTICAL_ANCHOR
-from ..ns import nsdecls
+from ..ns import nsdecls, qn
 from ..simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean
-from ..text import CT_TextBody
+from ..text import CT_TextBody, CT_TextParagraph
 from ..xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OptionalAttribute,
     RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
@@ -116,45 +116,125 @@ class CT_Table(BaseOxmlElement):
     @classmethod
     def new_tbl(cls, rows, cols, width, height, tableStyleId=None):
         """
-        Return a new ``<p:tbl>`` element tree
+        Return a new ``<a:tbl>`` element tree having *rows* rows and *cols*
+        columns. *width* is divided evenly between the columns and *height*
+        between the rows, with the last column and row absorbing any
+        remainder.
         """
-        # working hypothesis is this is the default table style GUID
-        if tableStyleId is None:
-            tableStyleId = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
+        col_widths = _distribute(width, [1] * cols)
+        row_heights = _distribute(height, [1] * rows)
+        return cls._new_tbl((), col_widths, row_heights, tableStyleId)
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
+    @classmethod
+    def new_tbl_from_text(cls, text_rows, width, height, col_weights=None,
+                          tableStyleId=None):
+        """
+        Return a new ``<a:tbl>`` element tree having a row for each sequence
+        of unicode cell text in *text_rows* and as many columns as the
+        longest of them; shorter rows are padded with empty cells. *height*
+        is divided evenly between the rows. *width* is divided between the
+        columns in proportion to the numbers in *col_weights* if provided,
+        otherwise evenly.
+        """
+        cols = max([len(texts) for texts in text_rows] or [0])
+        if col_weights is None:
+            col_weights = [1] * cols
+        return cls._new_tbl(
+            text_rows, _distribute(width, col_weights),
+            _distribute(height, [1] * len(text_rows)), tableStyleId
+        )
 
-        # add specified number of rows and columns
-        rowheight = height//rows
-        colwidth = width//cols
+    def replace_cell_text(self, text_rows):
+        """
+        Replace the text in the cells of this table with the unicode strings
+        in *text_rows*, a sequence of row sequences, starting with the top,
+        left cell. Cells not covered by *text_rows* are left unchanged. The
+        paragraph XML for all the cells is generated and parsed in a single
+        operation. Each cell ends up with a single paragraph that keeps its
+        paragraph properties, the same result as assigning to ``cell.text``.
+        """
+        tcs, p_xmls = [], []
+        for tr, texts in zip(self.tr_lst, text_rows):
+            for tc, text in zip(tr.tc_lst, texts):
+                tcs.append(tc)
+                p_xmls.append(
+                    '<a:p>%s</a:p>' % CT_TextParagraph.content_xml(text)
+                )
+        if not tcs:
+            return
+        new_ps = parse_xml(
+            '<a:txBody %s>%s</a:txBody>' % (nsdecls('a'), ''.join(p_xmls))
+        )
+        for tc, new_p in zip(tcs, new_ps):
+            tc.get_or_add_txBody().replace_text(new_p)
 
-        for col in range(cols):
-            # adjust width of last col to absorb any div error
-            if col == cols-1:
-                colwidth = width - ((cols-1) * colwidth)
-            tbl.tblGrid.add_gridCol(width=colwidth)
+    def text_rows(self):
+        """
+        Return a list containing a list of the text in each ``<a:tc>``
+        element of each ``<a:tr>`` element of this table, gathered in
+        a single pass over its descendants. Paragraphs within a cell are
+        separated by a line feed, as are the lines within a paragraph
+        separated by a line break.
+        """
+        tr_tag, tc_tag, p_tag = qn('a:tr'), qn('a:tc'), qn('a:p')
+        t_tag, br_tag = qn('a:t'), qn('a:br')
+
+        rows, row, parts, p_count = [], [], [], 0
+        for elm in self.iter(tr_tag, tc_tag, p_tag, t_tag, br_tag):
+            tag = elm.tag
+            if tag == t_tag:
+                parts.append(elm.text or u'')
+            elif tag == br_tag:
+                parts.append(u'\n')
+            elif tag == p_tag:
+                if p_count:
+                    parts.append(u'\n')
+                p_count += 1
+            elif tag == tc_tag:
+                parts, p_count = [], 0
+                row.append(parts)
+            else:
+                row = []
+                rows.append(row)
+        return [[u''.join(parts) for parts in row] for row in rows]
 
-        for row in range(rows):
-            # adjust height of last row to absorb any div error
-            if row == rows-1:
-                rowheight = height - ((rows-1) * rowheight)
-            tr = tbl.add_tr(height=rowheight)
-            for col in range(cols):
-                tr.add_tc()
+    @classmethod
+    def _new_tbl(cls, text_rows, col_widths, row_heights, tableStyleId):
+        """
+        Return a new ``<a:tbl>`` element tree having the specified column
+        widths and row heights, with cell text from *text_rows*. The XML for
+        the whole table is generated as a single string and parsed once.
+        """
+        # working hypothesis is this is the default table style GUID
+        if tableStyleId is None:
+            tableStyleId = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
 
-        return tbl
+        xml_parts = [
+            '<a:tbl %s><a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>%s'
+            '</a:tableStyleId></a:tblPr><a:tblGrid>' % (
+                nsdecls('a'), tableStyleId
+            )
+        ]
+        for width in col_widths:
+            xml_parts.append('<a:gridCol w="%d"/>' % width)
+        xml_parts.append('</a:tblGrid>')
+
+        empty_texts = [u''] * len(col_widths)
+        for row_idx, height in enumerate(row_heights):
+            texts = (
+                text_rows[row_idx] if row_idx < len(text_rows) else ()
+            )
+            xml_parts.append('<a:tr h="%d">' % height)
+            for text in list(texts) + empty_texts[len(texts):]:
+                xml_parts.append(
+                    '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p>%s</a:p>'
+                    '</a:txBody><a:tcPr/></a:tc>' %
+                    CT_TextParagraph.content_xml(text)
+                )
+            xml_parts.append('</a:tr>')
+        xml_parts.append('</a:tbl>')
 
-    @classmethod
-    def _tbl_tmpl(cls):
-        return (
-            '<a:tbl %s>\n'
-            '  <a:tblPr firstRow="1" bandRow="1">\n'
-            '    <a:tableStyleId>%s</a:tableStyleId>\n'
-            '  </a:tblPr>\n'
-            '  <a:tblGrid/>\n'
-            '</a:tbl>' % (nsdecls('a'), '%s')
-        )
+        return parse_xml(''.join(xml_parts))
 
 
 class CT_TableCell(BaseOxmlElement):
@@ -344,3 +424,16 @@ class CT_TableRow(BaseOxmlElement):
 
     def _new_tc(self):
         return CT_TableCell.new()
+
+
+def _distribute(total, weights):
+    """
+    Return a list of integers, one for each number in *weights*, dividing
+    *total* between them in proportion to their weight. The last item
+    absorbs any rounding remainder so the items always sum to *total*.
+    """
+    weight_sum = sum(weights)
+    sizes = [total * weight // weight_sum for weight in weights[:-1]]
+    if weights:
+        sizes.append(total - sum(sizes))
+    return sizes
@@ -147,14 +147,29 @@ class XsdAnyUri(BaseStringType):
 
 class XsdBoolean(BaseSimpleType):
 
+    _xml_to_bool = {'1': True, '0': False, 'true': True, 'false': False}
+
+    @classmethod
+    def to_xml(cls, value):
+        """
+        Identity checks on |True| and |False| skip validation for the
+        overwhelmingly common case.
+        """
+        if value is True:
+            return '1'
+        if value is False:
+            return '0'
+        return super(XsdBoolean, cls).to_xml(value)
+
     @classmethod
     def convert_from_xml(cls, str_value):
-        if str_value not in ('1', '0', 'true', 'false'):
+        try:
+            return cls._xml_to_bool[str_value]
+        except (KeyError, TypeError):
             raise InvalidXmlError(
                 "value must be one of '1', '0', 'true' or 'false', got '%s'"
                 % str_value
             )
-        return str_value in ('1', 'true')
 
     @classmethod
     def convert_to_xml(cls, value):
@@ -303,11 +318,25 @@ class ST_ContentType(XsdString):
 
 class ST_Coordinate(BaseSimpleType):
 
+    @classmethod
+    def to_xml(cls, value):
+        """
+        In-range integer fast path; shape position is set on every shape
+        added so this is a hot path.
+        """
+        if (isinstance(value, int) and
+                -27273042329600 <= value <= 27273042316900):
+            return str(value)
+        return super(ST_Coordinate, cls).to_xml(value)
+
     @classmethod
     def convert_from_xml(cls, str_value):
-        if 'i' in str_value or 'm' in str_value or 'p' in str_value:
-            return ST_UniversalMeasure.convert_from_xml(str_value)
-        return Emu(int(str_value))
+        try:
+            return Emu(int(str_value))
+        except ValueError:
+            if 'i' in str_value or 'm' in str_value or 'p' in str_value:
+                return ST_UniversalMeasure.convert_from_xml(str_value)
+            raise
 
     @classmethod
     def convert_to_xml(cls, value):
@@ -322,11 +351,20 @@ class ST_Coordinate32(BaseSimpleType):
     """
     xsd:union of ST_Coordinate32Unqualified, ST_UniversalMeasure
     """
+    @classmethod
+    def to_xml(cls, value):
+        if isinstance(value, int) and -2147483648 <= value <= 2147483647:
+            return str(value)
+        return super(ST_Coordinate32, cls).to_xml(value)
+
     @classmethod
     def convert_from_xml(cls, str_value):
-        if 'i' in str_value or 'm' in str_value or 'p' in str_value:
-            return ST_UniversalMeasure.convert_from_xml(str_value)
-        return ST_Coordinate32Unqualified.convert_from_xml(str_value)
+        try:
+            return Emu(int(str_value))
+        except ValueError:
+            if 'i' in str_value or 'm' in str_value or 'p' in str_value:
+                return ST_UniversalMeasure.convert_from_xml(str_value)
+            raise
 
     @classmethod
     def convert_to_xml(cls, value):
@@ -525,6 +563,12 @@ class ST_PlaceholderSize(XsdTokenEnumeration):
 
 class ST_PositiveCoordinate(XsdLong):
 
+    @classmethod
+    def to_xml(cls, value):
+        if isinstance(value, int) and 0 <= value <= 27273042316900:
+            return str(value)
+        return super(ST_PositiveCoordinate, cls).to_xml(value)
+
     @classmethod
     def validate(cls, value):
         cls.validate_int_in_range(value, 0, 27273042316900)
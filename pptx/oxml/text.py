@@ -6,6 +6,10 @@ lxml custom element classes for text-related XML elements.
 
 from __future__ import absolute_import
 
+import re
+
+from xml.sax.saxutils import escape
+
 from . import parse_xml
 from ..compat import to_unicode
 from ..enum.text import (
@@ -14,7 +18,8 @@ from ..enum.text import (
 )
 from .ns import nsdecls
 from .simpletypes import (
-    ST_Coordinate32, ST_TextFontScalePercentOrPercentString, ST_TextFontSize,
+    ST_Coordinate32, ST_HexColorRGB, ST_TextFontScalePercentOrPercentString,
+    ST_TextFontSize,
     ST_TextIndentLevelType, ST_TextSpacingPercentOrPercentString,
     ST_TextSpacingPoint, ST_TextTypeface, ST_TextWrappingType, XsdBoolean,
     XsdString
@@ -26,6 +31,9 @@ from .xmlchemy import (
 )
 
 
+_INVALID_XML_CHARS = re.compile(u'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
 class CT_Hyperlink(BaseOxmlElement):
     """
     Custom element class for <a:hlinkClick> elements.
@@ -119,6 +127,50 @@ class CT_TextBody(BaseOxmlElement):
         txPr = parse_xml(xml)
         return txPr
 
+    def replace_paragraphs(self, p_xml):
+        """
+        Replace all the paragraphs in this text body with the ``<a:p>``
+        elements in *p_xml*, a string of paragraph XML without namespace
+        declarations such as that produced by :meth:`CT_TextParagraph.p_xml`.
+        All the paragraphs are parsed in a single step, before the existing
+        paragraphs are removed, so this text body is unchanged if *p_xml*
+        cannot be parsed. A single empty paragraph is added when *p_xml*
+        contains none, since a text body must contain at least one
+        paragraph.
+        """
+        txBody = parse_xml(
+            u'<a:txBody %s>%s</a:txBody>' % (nsdecls('a'), p_xml)
+        )
+        for p in self.p_lst:
+            self.remove(p)
+        if len(txBody) == 0:
+            self._add_p()
+            return
+        self.extend(list(txBody))
+
+    def replace_text(self, p):
+        """
+        Replace the content of this text body with the runs and line breaks
+        in ``<a:p>`` element *p*, which are moved here. Only the first
+        paragraph is kept, retaining its paragraph properties and any
+        ``<a:endParaRPr>`` element. A paragraph is added when this text body
+        has none.
+        """
+        p_lst = self.p_lst
+        if not p_lst:
+            p_lst = [self._add_p()]
+        for extra_p in p_lst[1:]:
+            self.remove(extra_p)
+        first_p = p_lst[0]
+        for elm in first_p.content_children:
+            first_p.remove(elm)
+        endParaRPr = first_p.endParaRPr
+        if endParaRPr is None:
+            first_p.extend(list(p))
+            return
+        for elm in list(p):
+            endParaRPr.addprevious(elm)
+
     @classmethod
     def _a_txBody_tmpl(cls):
         return (
@@ -223,6 +275,42 @@ class CT_TextCharacterProperties(BaseOxmlElement):
     i = OptionalAttribute('i', XsdBoolean)
     u = OptionalAttribute('u', MSO_TEXT_UNDERLINE_TYPE)
 
+    @staticmethod
+    def rPr_xml(sz=None, b=None, i=None, u=None, typeface=None,
+                srgbClr=None):
+        """
+        Return the XML for an ``<a:rPr>`` element having the attributes *sz*,
+        *b*, *i*, and *u*, a ``<a:solidFill>`` child of the hex RGB color
+        *srgbClr*, and a ``<a:latin>`` child naming *typeface*, each only if
+        not |None|. The empty string is returned when all are |None|. No
+        namespace declarations are included, like
+        :meth:`CT_TextParagraph.content_xml`.
+        """
+        attrs = []
+        if sz is not None:
+            attrs.append(u' sz="%s"' % ST_TextFontSize.to_xml(sz))
+        if b is not None:
+            attrs.append(u' b="%s"' % XsdBoolean.to_xml(b))
+        if i is not None:
+            attrs.append(u' i="%s"' % XsdBoolean.to_xml(i))
+        if u is not None:
+            attrs.append(u' u="%s"' % MSO_TEXT_UNDERLINE_TYPE.to_xml(u))
+        children = []
+        if srgbClr is not None:
+            children.append(
+                u'<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' %
+                ST_HexColorRGB.to_xml(srgbClr)
+            )
+        if typeface is not None:
+            children.append(u'<a:latin typeface="%s"/>' % _escape_xml(
+                ST_TextTypeface.to_xml(typeface), {u'"': u'&quot;'}
+            ))
+        if not (attrs or children):
+            return u''
+        if not children:
+            return u'<a:rPr%s/>' % u''.join(attrs)
+        return u'<a:rPr%s>%s</a:rPr>' % (u''.join(attrs), u''.join(children))
+
     def add_hlinkClick(self, rId):
         """
         Add an <a:hlinkClick> child element with r:id attribute set to *rId*.
@@ -325,6 +413,54 @@ class CT_TextParagraph(BaseOxmlElement):
         text_types = (CT_RegularTextRun, CT_TextLineBreak, CT_TextField)
         return tuple(elm for elm in self if isinstance(elm, text_types))
 
+    @staticmethod
+    def content_xml(text):
+        """
+        Return the XML for the ``<a:r>`` and ``<a:br>`` elements that
+        represent *text*, the same content :meth:`append_text` would produce.
+        No namespace declarations are included, so the result is suitable
+        for including in a larger XML string that declares the ``a:``
+        prefix. Useful for generating many paragraphs in a single parse.
+        Raises |ValueError| if *text* contains a character not allowed in
+        XML.
+        """
+        xml_parts = []
+        for idx, line in enumerate(to_unicode(text).split(u'\n')):
+            if idx:
+                xml_parts.append(u'<a:br/>')
+            if line:
+                xml_parts.append(
+                    u'<a:r><a:t>%s</a:t></a:r>' % _escape_xml(line)
+                )
+        return u''.join(xml_parts)
+
+    @staticmethod
+    def p_xml(runs, lvl=0):
+        """
+        Return the XML for an ``<a:p>`` element at indentation level *lvl*
+        containing *runs*, a sequence of (text, rPr_xml) pairs where
+        *rPr_xml* is run properties XML like that produced by
+        :meth:`CT_TextCharacterProperties.rPr_xml`. Line feed characters in
+        *text* become ``<a:br>`` elements having the same run properties. No
+        namespace declarations are included, like :meth:`content_xml`.
+        Raises |ValueError| if *text* contains a character not allowed in
+        XML.
+        """
+        ST_TextIndentLevelType.validate(lvl)
+        xml_parts = [u'<a:p>']
+        if lvl:
+            xml_parts.append(u'<a:pPr lvl="%d"/>' % lvl)
+        for text, rPr_xml in runs:
+            for idx, line in enumerate(to_unicode(text).split(u'\n')):
+                if idx:
+                    xml_parts.append(u'<a:br>%s</a:br>' % rPr_xml)
+                if line:
+                    xml_parts.append(u'<a:r>%s<a:t>%s</a:t></a:r>' % (
+                        rPr_xml, _escape_xml(line)
+                    ))
+        xml_parts.append(u'</a:p>')
+        return u''.join(xml_parts)
+
     def _new_r(self):
         r_xml = '<a:r %s><a:t/></a:r>' % nsdecls('a')
         return parse_xml(r_xml)
@@ -508,3 +644,22 @@ class _ParagraphTextAppender(object):
         if text:
             self._p.add_r(text)
         del self._bfr[:]
+
+
+def _escape_xml(text, entities=None):
+    """
+    Return *text* escaped for inclusion in XML, replacing any characters in
+    dict *entities* as well. A carriage return is written as a character
+    reference, as lxml does, since the XML parser would otherwise turn it
+    into a line feed. Raises |ValueError| if *text* contains a character
+    not allowed in XML, as assigning it to an element's text would.
+    """
+    if _INVALID_XML_CHARS.search(text):
+        raise ValueError(
+            'All strings must be XML compatible: Unicode or ASCII, no NULL '
+            'bytes or control characters'
+        )
+    xml_entities = {u'\r': u'&#13;'}
+    if entities:
+        xml_entities.update(entities)
+    return escape(text, xml_entities)
@@ -9,11 +9,14 @@ from __future__ import absolute_import
 
 import os
 
+from collections import OrderedDict
+
 from .opc.constants import RELATIONSHIP_TYPE as RT
 from .opc.package import OpcPackage
 from .opc.packuri import PackURI
 from .parts.coreprops import CoreProperties
 from .parts.image import Image, ImagePart
+from .parts.slide import Slide
 from .util import lazyproperty
 
 
@@ -65,6 +68,15 @@ class Package(OpcPackage):
         """
         return self._image_parts.get_or_add_image_part(image_file)
 
+    @lazyproperty
+    def memory_budget(self):
+        """
+        |_MemoryBudget| object controlling how many slide parts in this
+        package keep their XML parsed in memory at once, and counting the
+        evictions and re-parses that result.
+        """
+        return _MemoryBudget(self)
+
     def next_image_partname(self, ext):
         """
         Return a |PackURI| instance representing the next available image
@@ -113,7 +125,7 @@ class _ImageParts(object):
         """
         Generate a reference to each |ImagePart| object in the package.
         """
-        image_parts = []
+        image_parts = set()
         for rel in self._package.iter_rels():
             if rel.is_external:
                 continue
@@ -122,7 +134,7 @@ class _ImageParts(object):
             image_part = rel.target_part
             if image_part in image_parts:
                 continue
-            image_parts.append(image_part)
+            image_parts.add(image_part)
             yield image_part
 
     def get_or_add_image_part(self, image_file):
@@ -149,3 +161,122 @@ class _ImageParts(object):
             if image_part.sha1 == sha1:
                 return image_part
         return None
+
+
+class _MemoryBudget(object):
+    """
+    Limits the number of slide parts in a package whose XML is held as a
+    parsed element tree. Only a slide the caller has released can be
+    evicted, since shape and text objects obtained from a slide would
+    silently stop writing to it once its element tree is dropped. When the
+    limit is exceeded, the released slides are evicted in the order they
+    were released, their XML retained as compressed bytes and transparently
+    re-parsed the next time they are accessed. No limit is applied by
+    default.
+    """
+    def __init__(self, package):
+        super(_MemoryBudget, self).__init__()
+        self._package = package
+        self._max_parsed_slides = None
+        self._parsed_slides = set()
+        self._released_slides = OrderedDict()
+        self._evictions = 0
+        self._reparses = 0
+
+    def discard(self, slide):
+        """
+        Stop tracking *slide*, for example because it has been removed from
+        the presentation. Does nothing if *slide* is not tracked.
+        """
+        self._parsed_slides.discard(slide)
+        self._released_slides.pop(slide, None)
+
+    @property
+    def evictions(self):
+        """
+        Count of slide element trees evicted to stay within the budget.
+        """
+        return self._evictions
+
+    @property
+    def max_parsed_slides(self):
+        """
+        Read/write. Maximum number of slides that can have their XML parsed
+        at the same time, or |None| (the default) for no limit. Slides
+        accessed after a value is assigned count against the limit but are
+        evicted only once passed to :meth:`release`. Slides already parsed
+        when the value is assigned are treated as released, and those beyond
+        that number are evicted immediately; shape and text objects obtained
+        from them before then should be looked up again from the slide.
+        """
+        return self._max_parsed_slides
+
+    @max_parsed_slides.setter
+    def max_parsed_slides(self, value):
+        if value is not None and value < 1:
+            raise ValueError(
+                'max_parsed_slides must be None or a positive integer, got '
+                '%s' % value
+            )
+        self._max_parsed_slides = value
+        self._parsed_slides.clear()
+        self._released_slides.clear()
+        if value is None:
+            return
+        for part in self._package.iter_parts():
+            if isinstance(part, Slide) and not part.is_evicted:
+                self._parsed_slides.add(part)
+                self._released_slides[part] = None
+        self._evict_overflow()
+
+    def note_reparse(self):
+        """
+        Called by a slide when its XML is re-parsed after eviction.
+        """
+        self._reparses += 1
+
+    def release(self, slide):
+        """
+        Mark *slide* as no longer in use, allowing its element tree to be
+        evicted when more than the maximum number of slides are parsed. Shape
+        and text objects obtained from *slide* must not be used after it is
+        released; accessing the slide again puts it back in use until it is
+        next released. Does nothing if no limit is set.
+        """
+        if slide not in self._parsed_slides:
+            return
+        self._released_slides.pop(slide, None)
+        self._released_slides[slide] = None
+        self._evict_overflow()
+
+    @property
+    def reparses(self):
+        """
+        Count of evicted slides whose XML has been parsed again on access.
+        """
+        return self._reparses
+
+    def touch(self, slide):
+        """
+        Mark *slide* as parsed and in use, evicting the earliest released
+        slide if the budget is exceeded.
+        """
+        if self._max_parsed_slides is None:
+            return
+        self._parsed_slides.add(slide)
+        self._released_slides.pop(slide, None)
+        self._evict_overflow()
+
+    def _evict_overflow(self):
+        """
+        Evict released slides, earliest released first, until no more than
+        the maximum number remain parsed or none remain released.
+        """
+        parsed_slides, released_slides = (
+            self._parsed_slides, self._released_slides
+        )
+        while len(parsed_slides) > self._max_parsed_slides and released_slides:
+            slide, _ = released_slides.popitem(last=False)
+            parsed_slides.discard(slide)
+            slide.evict()
+            self._evictions += 1
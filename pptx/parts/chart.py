@@ -6,6 +6,8 @@ Chart part objects, including Chart and Charts
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from copy import deepcopy
+
 from ..chart.chart import Chart
 from .embeddedpackage import EmbeddedXlsxPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
@@ -41,6 +43,30 @@ class ChartPart(XmlPart):
         """
         return Chart(self._element, self)
 
+    def clone(self, package):
+        """
+        Return a new |ChartPart| object added to *package* that is a copy of
+        this one, including a copy of its embedded Excel workbook. The XML
+        is deep-copied rather than serialized and parsed again. Other
+        related parts are shared rather than copied, and each relationship
+        keeps its rId so no rId in the chart XML needs to change.
+        """
+        partname = package.next_partname(self.partname_template)
+        chart_part = ChartPart(
+            partname, self.content_type, deepcopy(self._element), package
+        )
+        for rel in self.rels.values():
+            if rel.is_external:
+                chart_part.rels.add_relationship(
+                    rel.reltype, rel.target_ref, rel.rId, is_external=True
+                )
+                continue
+            target = rel.target_part
+            if rel.reltype == RT.PACKAGE:
+                target = EmbeddedXlsxPart.new(target.blob, package)
+            chart_part.rels.add_relationship(rel.reltype, target, rel.rId)
+        return chart_part
+
     @lazyproperty
     def chart_workbook(self):
         """
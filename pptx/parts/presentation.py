@@ -8,6 +8,7 @@ from __future__ import absolute_import
 
 from warnings import warn
 
+from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from .slide import SlideCollection
 from ..util import lazyproperty
@@ -18,6 +19,23 @@ class PresentationPart(XmlPart):
     Top level class in object model, represents the contents of the /ppt
     directory of a .pptx file.
     """
+    def before_marshal(self):
+        """
+        Drop any slide relationship no longer referenced from the
+        presentation XML, for example after a ``<p:sldId>`` element has been
+        removed directly, so the orphaned slide and the parts only it uses
+        are not saved. Hyperlinks to slides no longer in the presentation are
+        dropped too, since PowerPoint reports a slide part outside the slide
+        list as needing repair. Slide partnames are then renumbered to follow
+        the slide sequence.
+        """
+        referenced_rIds = set(self._element.xpath('//@r:id'))
+        for rId, rel in list(self.rels.items()):
+            if rel.reltype == RT.SLIDE and rId not in referenced_rIds:
+                del self.rels[rId]
+        self._drop_links_to_removed_slides()
+        self.slides.rename_slides()
+
     @property
     def sldMasterIdLst(self):
         """
@@ -81,6 +99,39 @@ class PresentationPart(XmlPart):
         slides.rename_slides()  # start from known state
         return slides
 
+    def _drop_links_to_removed_slides(self):
+        """
+        Remove each ``<a:hlinkClick>`` and ``<a:hlinkHover>`` element in the
+        package that links to a slide not in this presentation's slide
+        collection, along with the relationship once nothing else refers to
+        it. Each part is checked as it is reached, so a removed slide reached
+        only through such links is not visited, and the XML of a part is read
+        only when it has a relationship to a removed slide. A relationship
+        not used by a hyperlink, like that of a notes slide to its slide, is
+        left in place.
+        """
+        package = self.package
+        if package is None:
+            return
+        listed_slides = set(self.slides)
+        for part in package.iter_parts():
+            for rId, rel in list(part.rels.items()):
+                if rel.is_external or rel.reltype != RT.SLIDE:
+                    continue
+                if rel.target_part in listed_slides:
+                    continue
+                if not isinstance(part, XmlPart):
+                    continue
+                hlinks = part._element.xpath(
+                    '//a:hlinkClick[@r:id="%s"] | //a:hlinkHover[@r:id="%s"]'
+                    % (rId, rId)
+                )
+                if not hlinks:
+                    continue
+                for hlink in hlinks:
+                    hlink.getparent().remove(hlink)
+                part.drop_rel(rId)
+
 
 class _SlideMasters(object):
     """
@@ -6,21 +6,31 @@ Slide and related objects.
 
 from __future__ import absolute_import
 
+import re
+import zlib
+
+from copy import deepcopy
 from warnings import warn
 
 from .chart import ChartPart
+from .image import ImagePart
 from ..enum.shapes import PP_PLACEHOLDER
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from ..opc.oxml import serialize_part_xml
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
+from ..oxml import parse_xml
 from ..oxml.ns import qn
-from ..oxml.simpletypes import ST_Direction
+from ..oxml.simpletypes import ST_Direction, ST_HexColorRGB
 from ..oxml.parts.slide import CT_Slide
+from ..oxml.shapes.autoshape import CT_Shape
 from ..oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from ..oxml.text import CT_TextParagraph
 from ..shapes.autoshape import AutoShapeType
 from ..shapes.placeholder import BasePlaceholder, BasePlaceholders
 from ..shapes.shapetree import BaseShapeFactory, BaseShapeTree
-from ..util import lazyproperty
+from ..shapes.table import text_rows_from_data
+from ..util import Inches, lazyproperty
 
 
 class BaseSlide(XmlPart):
@@ -81,6 +91,74 @@ class Slide(BaseSlide):
         rId = self.relate_to(chart_part, RT.CHART)
         return rId
 
+    @property
+    def blob(self):
+        """
+        The XML of this slide as bytes. An evicted slide produces its
+        retained XML without being parsed again.
+        """
+        if self._sld is None:
+            return zlib.decompress(self._sld_zblob)
+        return super(Slide, self).blob
+
+    def clone_rels_from(self, slide):
+        """
+        Give this slide, a copy of *slide*, the same relationships as
+        *slide*, using the same rIds so the rIds in the copied XML remain
+        valid. Related chart parts are cloned, along with their embedded
+        workbooks, since a chart belongs to a single slide. The slide layout,
+        images, media and other related parts are shared. Notes and comments
+        relationships are not copied. This slide must already be related to
+        the presentation so partnames of cloned parts are allocated
+        correctly.
+        """
+        for rel in slide.rels.values():
+            if rel.reltype in (RT.NOTES_SLIDE, RT.COMMENTS):
+                continue
+            if rel.is_external:
+                self.rels.add_relationship(
+                    rel.reltype, rel.target_ref, rel.rId, is_external=True
+                )
+                continue
+            target = rel.target_part
+            if rel.reltype == RT.CHART:
+                target = target.clone(self.package)
+            self.rels.add_relationship(rel.reltype, target, rel.rId)
+
+    def evict(self):
+        """
+        Drop the element tree of this slide, retaining its XML as compressed
+        bytes from which it is re-parsed the next time it is accessed. Shape
+        and text objects obtained from this slide before eviction no longer
+        refer to the slide XML and should not be used afterward.
+        """
+        if self._sld is None:
+            return
+        self._sld_zblob = zlib.compress(serialize_part_xml(self._sld))
+        self._sld = None
+        self.__dict__.pop('_placeholders', None)
+        self.__dict__.pop('_shapes', None)
+
+    @property
+    def is_evicted(self):
+        """
+        |True| if the element tree of this slide has been dropped to reduce
+        memory use, |False| if its XML is currently parsed.
+        """
+        return self._sld is None
+
+    @property
+    def minified_blob(self):
+        """
+        XML of this slide serialized without non-significant whitespace or
+        redundant namespace declarations. An evicted slide is parsed for
+        this purpose without being restored.
+        """
+        if self._sld is None:
+            sld = parse_xml(zlib.decompress(self._sld_zblob))
+            return serialize_part_xml(sld, minify=True)
+        return super(Slide, self).minified_blob
+
     @lazyproperty
     def placeholders(self):
         """
@@ -116,6 +194,38 @@ class Slide(BaseSlide):
         warn(msg, UserWarning, stacklevel=2)
         return self.slide_layout
 
+    @property
+    def _element(self):
+        """
+        The ``<p:sld>`` root element of this slide, parsed again from its
+        retained XML if the slide has been evicted.
+        """
+        memory_budget = self._memory_budget
+        if self._sld is None:
+            self._sld = parse_xml(zlib.decompress(self._sld_zblob))
+            self._sld_zblob = None
+            if memory_budget is not None:
+                memory_budget.note_reparse()
+        if memory_budget is not None:
+            memory_budget.touch(self)
+        return self._sld
+
+    @_element.setter
+    def _element(self, sld):
+        self._sld = sld
+        self._sld_zblob = None
+
+    @property
+    def _memory_budget(self):
+        """
+        The |_MemoryBudget| object of the package this slide belongs to, or
+        |None| if the slide does not (yet) belong to a package.
+        """
+        package = self._package
+        if package is None:
+            return None
+        return package.memory_budget
+
 
 class SlideCollection(object):
     """
@@ -127,6 +237,9 @@ class SlideCollection(object):
         super(SlideCollection, self).__init__()
         self._sldIdLst = sldIdLst
         self._prs = prs
+        self._rIds_by_slide = {}
+        self._rename_pending = False
+        self._unlisted_count = 0
 
     def __getitem__(self, idx):
         """
@@ -162,27 +275,318 @@ class SlideCollection(object):
         self._sldIdLst.add_sldId(rId)
         return slide
 
+    def duplicate(self, slide):
+        """
+        Return a new slide appended to this collection that is a copy of
+        *slide*. The slide XML is deep-copied rather than serialized and
+        parsed again. Charts on the slide are copied; the slide layout,
+        images and other media are shared with *slide*. Notes and comments
+        are not copied.
+        """
+        partname = self._next_partname
+        package = self._prs.package
+        new_slide = Slide(
+            partname, slide.content_type, deepcopy(slide._element), package
+        )
+        rId = self._prs.relate_to(new_slide, RT.SLIDE)
+        new_slide.clone_rels_from(slide)
+        self._sldIdLst.add_sldId(rId)
+        return new_slide
+
+    def import_from(self, prs, indexes=None):
+        """
+        Append a copy of slides of *prs*, another |Presentation| object, to
+        this collection and return a list of the new slides. *indexes* is
+        a sequence of the positions in *prs* of the slides to import, all of
+        them when |None|. Each imported slide uses the layout in this
+        presentation having the same name as its original layout, or the
+        first layout when there is no such layout. Images already present in
+        this presentation are reused. Notes and comments are not imported.
+        """
+        source_slides = prs.slides
+        if indexes is None:
+            indexes = range(len(source_slides))
+        package = self._prs.package
+        importer = _SlideImporter(self._prs)
+        slide_pairs = []
+        for idx in indexes:
+            slide = source_slides[idx]
+            new_slide = Slide(
+                self._next_partname, slide.content_type,
+                deepcopy(slide._element), package
+            )
+            rId = self._prs.relate_to(new_slide, RT.SLIDE)
+            self._sldIdLst.add_sldId(rId)
+            importer.add_slide(slide, new_slide)
+            slide_pairs.append((slide, new_slide))
+        # relationships are copied once all the slides exist, so a link from
+        # one imported slide to another can be pointed at its copy
+        for slide, new_slide in slide_pairs:
+            importer.copy_rels(slide, new_slide)
+        return [new_slide for _, new_slide in slide_pairs]
+
+    def move(self, slide, new_idx):
+        """
+        Move *slide* to position *new_idx* in the slide sequence, where 0 is
+        the first position. Only the ``<p:sldId>`` element of *slide* is
+        moved; no slide XML is touched. Raises |ValueError| if *slide* is not
+        in this collection and |IndexError| if *new_idx* is out of range.
+        """
+        sldIdLst = self._sldIdLst
+        if not 0 <= new_idx < len(sldIdLst):
+            raise IndexError('slide index out of range')
+        sldId = self._sldId_for(slide)
+        sldIdLst.remove(sldId)
+        sldIdLst.insert(new_idx, sldId)
+
+    def remove(self, slide):
+        """
+        Remove *slide* from this collection. Its relationship to the
+        presentation is dropped, so the slide part and any parts used only by
+        it, such as charts and notes, are not written when the presentation
+        is saved. Hyperlinks to it from other slides are removed when the
+        presentation is saved. The remaining slides are renamed only when
+        a slide is next added or the presentation is saved, so removing many
+        slides takes time proportional to their number. Raises |ValueError|
+        if *slide* is not in this collection.
+        """
+        sldId = self._sldId_for(slide)
+        self._prs.drop_rel(sldId.rId)
+        self._sldIdLst.remove(sldId)
+        self._rIds_by_slide.pop(slide, None)
+        self._prs.package.memory_budget.discard(slide)
+        self._rename_pending = True
+
     def rename_slides(self):
         """
         Assign partnames like ``/ppt/slides/slide9.xml`` to all slides in the
         collection. The name portion is always ``slide``. The number part
         forms a continuous sequence starting at 1 (e.g. 1, 2, 3, ...). The
-        extension is always ``.xml``.
-        """
-        for idx, slide in enumerate(self):
+        extension is always ``.xml``. A slide removed from the collection
+        that is still reachable from another part, such as through a
+        hyperlink, is saved too, so any such slides are numbered after those
+        in the collection to keep every partname unique.
+        """
+        slides = list(self)
+        listed_count = len(slides)
+        slides.extend(self._iter_unlisted_slides(slides))
+        for idx, slide in enumerate(slides):
             partname_str = '/ppt/slides/slide%d.xml' % (idx+1)
             slide.partname = PackURI(partname_str)
+        self._rename_pending = False
+        self._unlisted_count = len(slides) - listed_count
+
+    def _iter_unlisted_slides(self, slides):
+        """
+        Generate each slide part in the package that is not in *slides*,
+        such as a removed slide still reached through a hyperlink.
+        """
+        package = self._prs.package
+        if package is None:
+            return
+        listed_slides = set(slides)
+        for part in package.iter_parts():
+            if isinstance(part, Slide) and part not in listed_slides:
+                yield part
 
     @property
     def _next_partname(self):
         """
         Return |PackURI| instance containing the partname for a slide to be
         appended to this slide collection, e.g. ``/ppt/slides/slide9.xml``
-        for a slide collection containing 8 slides.
-        """
-        partname_str = '/ppt/slides/slide%d.xml' % (len(self)+1)
+        for a slide collection containing 8 slides. Slides are renamed first
+        if any have been removed since they were last renamed. Numbers taken
+        by removed slides still in the package are skipped.
+        """
+        if self._rename_pending:
+            self.rename_slides()
+        partname_str = '/ppt/slides/slide%d.xml' % (
+            len(self) + self._unlisted_count + 1
+        )
         return PackURI(partname_str)
 
+    def _rId_for(self, slide):
+        """
+        Return the rId of the presentation's relationship to *slide*, or
+        |None| if there is none. The rIds are looked up in a map from part
+        to rId, rebuilt from the presentation relationships when it has no
+        entry for *slide* or the entry is out of date.
+        """
+        related_parts = self._prs.related_parts
+        rId = self._rIds_by_slide.get(slide)
+        if rId is None or related_parts.get(rId) is not slide:
+            self._rIds_by_slide = dict(
+                (part, rId) for rId, part in related_parts.items()
+            )
+            rId = self._rIds_by_slide.get(slide)
+        return rId
+
+    def _sldId_for(self, slide):
+        """
+        Return the ``<p:sldId>`` element referring to *slide*. Raises
+        |ValueError| if *slide* is not in this collection.
+        """
+        rId = self._rId_for(slide)
+        if rId is None:
+            raise ValueError('slide not in collection')
+        sldIds = self._sldIdLst.xpath('./p:sldId[@r:id="%s"]' % rId)
+        if not sldIds:
+            raise ValueError('slide not in collection')
+        return sldIds[0]
+
+
+class _SlideImporter(object):
+    """
+    Copies slides from another presentation into the presentation part
+    *prs_part*, along with the parts they depend on. A part used by several
+    imported slides is copied only once, images are matched by SHA1 hash
+    against those already in the package, and partnames are allocated from
+    a set collected once rather than by walking the package for each part
+    added.
+    """
+    _skipped_reltypes = (RT.NOTES_SLIDE, RT.COMMENTS)
+
+    def __init__(self, prs_part):
+        super(_SlideImporter, self).__init__()
+        self._prs_part = prs_part
+        self._package = prs_part.package
+        self._copies = {}
+        self._next_idxs = {}
+
+    def add_slide(self, slide, new_slide):
+        """
+        Record *new_slide* as the copy of *slide*, so links to *slide* from
+        other imported slides are pointed at *new_slide*.
+        """
+        self._copies[slide] = new_slide
+        self._partnames.add(new_slide.partname)
+
+    def copy_rels(self, source, target):
+        """
+        Give *target*, the copy of part *source*, the relationships of
+        *source* using the same rIds, copying related parts as required.
+        """
+        for rel in source.rels.values():
+            if rel.reltype in self._skipped_reltypes:
+                continue
+            if rel.is_external:
+                target.rels.add_relationship(
+                    rel.reltype, rel.target_ref, rel.rId, is_external=True
+                )
+                continue
+            part = self._part_for(rel.reltype, rel.target_part, target)
+            target.rels.add_relationship(rel.reltype, part, rel.rId)
+
+    def _copy_of(self, part):
+        """
+        Return a new part in the target package having the content of
+        *part*, with its relationships copied.
+        """
+        partname = self._next_partname(part.partname)
+        if isinstance(part, XmlPart):
+            copy = type(part)(
+                partname, part.content_type, deepcopy(part._element),
+                self._package
+            )
+        else:
+            copy = type(part).load(
+                partname, part.content_type, part.blob, self._package
+            )
+        self._copies[part] = copy
+        self.copy_rels(part, copy)
+        return copy
+
+    def _image_part_for(self, image_part):
+        """
+        Return the image part in the target package containing the same
+        image as *image_part*, newly added if there is none.
+        """
+        image_parts = self._image_parts_by_sha1
+        sha1 = image_part.sha1
+        if sha1 not in image_parts:
+            image_parts[sha1] = ImagePart(
+                self._next_partname(image_part.partname),
+                image_part.content_type, image_part.blob, self._package
+            )
+        return image_parts[sha1]
+
+    @lazyproperty
+    def _image_parts_by_sha1(self):
+        """
+        dict mapping the SHA1 hash of each image in the target package to
+        its image part.
+        """
+        image_parts = {}
+        for part in self._package.iter_parts():
+            if isinstance(part, ImagePart):
+                image_parts.setdefault(part.sha1, part)
+        return image_parts
+
+    def _layout_like(self, slide_layout):
+        """
+        Return the slide layout in the target presentation having the same
+        name as *slide_layout*, or its first layout if there is none.
+        """
+        layouts_by_name = self._layouts_by_name
+        if slide_layout.name in layouts_by_name:
+            return layouts_by_name[slide_layout.name]
+        return self._prs_part.slide_masters[0].slide_layouts[0]
+
+    @lazyproperty
+    def _layouts_by_name(self):
+        """
+        dict mapping the name of each slide layout in the target
+        presentation to the layout, the first one where names are repeated.
+        """
+        layouts_by_name = {}
+        for slide_master in self._prs_part.slide_masters:
+            for slide_layout in slide_master.slide_layouts:
+                layouts_by_name.setdefault(slide_layout.name, slide_layout)
+        return layouts_by_name
+
+    def _next_partname(self, partname):
+        """
+        Return an unused partname in the target package formed like
+        *partname*, e.g. '/ppt/charts/chart7.xml' for '/ppt/charts/chart2.xml'
+        when charts 1 to 6 are already present.
+        """
+        tmpl = re.sub(r'\d*(\.\w+)$', r'%d\1', partname.replace('%', '%%'))
+        partnames = self._partnames
+        idx = self._next_idxs.get(tmpl, 1)
+        while tmpl % idx in partnames:
+            idx += 1
+        self._next_idxs[tmpl] = idx + 1
+        new_partname = PackURI(tmpl % idx)
+        partnames.add(new_partname)
+        return new_partname
+
+    def _part_for(self, reltype, part, importing_part):
+        """
+        Return the part in the target package that *importing_part* should
+        relate to in place of *part*, the target of a relationship of
+        *reltype* from the original of *importing_part*.
+        """
+        if part in self._copies:
+            return self._copies[part]
+        if reltype == RT.SLIDE_LAYOUT:
+            return self._layout_like(part)
+        if reltype == RT.SLIDE:
+            # a link to a slide that is not being imported becomes a link to
+            # the slide containing it
+            return importing_part
+        if reltype == RT.IMAGE:
+            image_part = self._image_part_for(part)
+            self._copies[part] = image_part
+            return image_part
+        return self._copy_of(part)
+
+    @lazyproperty
+    def _partnames(self):
+        """
+        Set of the partnames in use in the target package.
+        """
+        return set(part.partname for part in self._package.iter_parts())
+
 
 class _SlideShapeTree(BaseShapeTree):
     """
@@ -190,6 +594,10 @@ class _SlideShapeTree(BaseShapeTree):
     is the backmost in z-order and the last shape is topmost. Supports indexed
     access, len(), index(), and iteration.
     """
+    def __init__(self, slide):
+        super(_SlideShapeTree, self).__init__(slide)
+        self._shape_names = None
+
     def add_chart(self, chart_type, x, y, cx, cy, chart_data):
         """
         Add a new chart of *chart_type* to the slide, positioned at (*x*,
@@ -205,6 +613,21 @@ class _SlideShapeTree(BaseShapeTree):
         graphic_frame = self._add_chart_graphic_frame(rId, x, y, cx, cy)
         return graphic_frame
 
+    def add_many(self, specs):
+        """
+        Add an auto shape or text box for each |ShapeSpec| in *specs*, in
+        order, and return a list of the integer ids of the new shapes. No
+        shape objects are created; use :meth:`by_id` to get one.
+        """
+        specs = list(specs)
+        shape_ids = self._next_shape_ids(len(specs))
+        shape_xmls = [
+            self._sp_xml_from_spec(id_, spec)
+            for id_, spec in zip(shape_ids, specs)
+        ]
+        self._spTree.add_shapes_from_xml(shape_xmls)
+        return shape_ids
+
     def add_picture(self, image_file, left, top, width=None, height=None):
         """
         Add picture shape displaying image in *image_file*, where
@@ -215,7 +638,7 @@ class _SlideShapeTree(BaseShapeTree):
         pic = self._add_pic_from_image_part(
             image_part, rId, left, top, width, height
         )
-        picture = self._shape_factory(pic)
+        picture = self._shape_proxy(pic)
         return picture
 
     def add_shape(self, autoshape_type_id, left, top, width, height):
@@ -227,7 +650,7 @@ class _SlideShapeTree(BaseShapeTree):
         sp = self._add_sp_from_autoshape_type(
             autoshape_type, left, top, width, height
         )
-        shape = self._shape_factory(sp)
+        shape = self._shape_proxy(sp)
         return shape
 
     def add_table(self, rows, cols, left, top, width, height):
@@ -242,15 +665,41 @@ class _SlideShapeTree(BaseShapeTree):
         graphicFrame = self._add_graphicFrame_containing_table(
             rows, cols, left, top, width, height
         )
-        graphic_frame = self._shape_factory(graphicFrame)
+        graphic_frame = self._shape_proxy(graphicFrame)
         return graphic_frame
 
+    def add_table_from_data(self, data, left, top, width, height=None,
+                            formats=None, autofit=False):
+        """
+        Add a |GraphicFrame| object containing a table filled with the
+        values in *data*, a sequence of row sequences. The table has a row
+        for each row in *data* and as many columns as the longest of them.
+        Values are converted to text as described for :meth:`.Table.write`,
+        using *formats* if provided. *height* is evenly distributed between
+        the rows and defaults to 0.4 inches per row. *width* is evenly
+        distributed between the columns unless *autofit* is True, in which
+        case each column gets a share proportional to the longest line of
+        text it contains. Raises |ValueError| if *data* contains no values.
+        """
+        text_rows = text_rows_from_data(data, formats)
+        if not any(text_rows):
+            raise ValueError('data must contain at least one value')
+        if height is None:
+            height = Inches(0.4) * len(text_rows)
+        col_weights = self._autofit_col_weights(text_rows) if autofit else None
+        id_ = self._next_shape_id()
+        name = 'Table %d' % (id_-1)
+        graphicFrame = self._spTree.add_table_from_text(
+            id_, name, text_rows, left, top, width, height, col_weights
+        )
+        return self._shape_proxy(graphicFrame)
+
     def add_textbox(self, left, top, width, height):
         """
         Add text box shape of specified size at specified position on slide.
         """
         sp = self._add_textbox_sp(left, top, width, height)
-        textbox = self._shape_factory(sp)
+        textbox = self._shape_proxy(sp)
         return textbox
 
     def clone_layout_placeholders(self, slide_layout):
@@ -289,7 +738,7 @@ class _SlideShapeTree(BaseShapeTree):
         """
         for elm in self._spTree.iter_shape_elms():
             if elm.ph_idx == 0:
-                return self._shape_factory(elm)
+                return self._shape_proxy(elm)
         return None
 
     def _add_chart_graphicFrame(self, rId, x, y, cx, cy):
@@ -298,7 +747,7 @@ class _SlideShapeTree(BaseShapeTree):
         specified position and size and referring to the chart part
         identified by *rId*.
         """
-        shape_id = self._next_shape_id
+        shape_id = self._next_shape_id()
         name = 'Chart %d' % (shape_id-1)
         graphicFrame = CT_GraphicalObjectFrame.new_chart_graphicFrame(
             shape_id, name, rId, x, y, cx, cy
@@ -312,7 +761,7 @@ class _SlideShapeTree(BaseShapeTree):
         and referring to the chart part identified by *rId*.
         """
         graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
-        graphic_frame = self._shape_factory(graphicFrame)
+        graphic_frame = self._shape_proxy(graphicFrame)
         return graphic_frame
 
     def _add_graphicFrame_containing_table(self, rows, cols, x, y, cx, cy):
@@ -320,7 +769,7 @@ class _SlideShapeTree(BaseShapeTree):
         Return a newly added ``<p:graphicFrame>`` element containing a table
         as specified by the parameters.
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = 'Table %d' % (id_-1)
         graphicFrame = self._spTree.add_table(
             id_, name, rows, cols, x, y, cx, cy
@@ -334,7 +783,7 @@ class _SlideShapeTree(BaseShapeTree):
         *cx*, and *cy*. The element is appended to the shape tree, causing it
         to be displayed first in z-order on the slide.
         """
-        id = self._next_shape_id
+        id = self._next_shape_id()
         name = 'Picture %d' % (id-1)
         desc = image_part._desc
         scaled_cx, scaled_cy = image_part.scale(cx, cy)
@@ -350,7 +799,7 @@ class _SlideShapeTree(BaseShapeTree):
         Return a newly-added ``<p:sp>`` element for a shape of
         *autoshape_type* at position (x, y) and of size (cx, cy).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = '%s %d' % (autoshape_type.basename, id_-1)
         sp = self._spTree.add_autoshape(
             id_, name, autoshape_type.prst, x, y, cx, cy
@@ -362,17 +811,32 @@ class _SlideShapeTree(BaseShapeTree):
         Return a newly-added textbox ``<p:sp>`` element at position (x, y)
         and of size (cx, cy).
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         name = 'TextBox %d' % (id_-1)
         sp = self._spTree.add_textbox(id_, name, x, y, cx, cy)
         return sp
 
+    @staticmethod
+    def _autofit_col_weights(text_rows):
+        """
+        Return a list containing the relative width of each column of a
+        table having the cell text in *text_rows*, the length of the longest
+        line of text in the column plus two characters for cell margins.
+        """
+        col_weights = [2] * max(len(texts) for texts in text_rows)
+        for texts in text_rows:
+            for idx, text in enumerate(texts):
+                weight = max(len(line) for line in text.split('\n')) + 2
+                if weight > col_weights[idx]:
+                    col_weights[idx] = weight
+        return col_weights
+
     def _clone_layout_placeholder(self, layout_placeholder):
         """
         Add a new placeholder shape based on the slide layout placeholder
         *layout_ph*.
         """
-        id_ = self._next_shape_id
+        id_ = self._next_shape_id()
         ph_type = layout_placeholder.ph_type
         orient = layout_placeholder.orient
         name = self._next_ph_name(ph_type, id_, orient)
@@ -389,7 +853,8 @@ class _SlideShapeTree(BaseShapeTree):
         _next_ph_name(ST_PlaceholderType.TBL, 4, 'horz') ==>
         'Table Placeholder 3'. The number is incremented as necessary to make
         the name unique within the collection. If *orient* is ``'vert'``, the
-        placeholder name is prefixed with ``'Vertical '``.
+        placeholder name is prefixed with ``'Vertical '``. The name returned
+        is reserved, so a second call does not return the same name.
         """
         basename = {
             # BODY is named 'Notes Placeholder' in a notes master
@@ -417,13 +882,14 @@ class _SlideShapeTree(BaseShapeTree):
 
         # increment numpart as necessary to make name unique
         numpart = id - 1
-        names = self._spTree.xpath('//p:cNvPr/@name')
+        names = self._used_shape_names
         while True:
             name = '%s %d' % (basename, numpart)
             if name not in names:
                 break
             numpart += 1
 
+        names.add(name)
         return name
 
     def _shape_factory(self, shape_elm):
@@ -433,6 +899,52 @@ class _SlideShapeTree(BaseShapeTree):
         """
         return _SlideShapeFactory(shape_elm, self)
 
+    @staticmethod
+    def _sp_xml_from_spec(id_, spec):
+        """
+        Return the XML for a ``<p:sp>`` element having id *id_* and as
+        described by |ShapeSpec| *spec*, without namespace declarations.
+        """
+        text_xml = (
+            '' if spec.text is None else
+            CT_TextParagraph.content_xml(spec.text)
+        )
+        fill_xml = (
+            None if spec.fill is None else
+            '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' %
+            ST_HexColorRGB.to_xml(str(spec.fill))
+        )
+        left, top, width, height = spec.left, spec.top, spec.width, spec.height
+
+        if spec.autoshape_type_id is None:
+            return CT_Shape.new_textbox_sp_xml(
+                id_, 'TextBox %d' % (id_-1), left, top, width, height,
+                fill_xml=fill_xml or '<a:noFill/>', text_xml=text_xml
+            )
+
+        autoshape_type = AutoShapeType(spec.autoshape_type_id)
+        return CT_Shape.new_autoshape_sp_xml(
+            id_, '%s %d' % (autoshape_type.basename, id_-1),
+            autoshape_type.prst, left, top, width, height,
+            fill_xml=fill_xml or '', text_xml=text_xml
+        )
+
+    @property
+    def _used_shape_names(self):
+        """
+        Set of the shape names used in this slide, read from the XML once
+        and then maintained as placeholder names are handed out. Names
+        generated for other shapes, like 'TextBox 3', can never collide with
+        a placeholder name so they need not be recorded. A shape renamed
+        after the set is built is not noticed, which at worst produces
+        a duplicate name; PowerPoint tolerates those.
+        """
+        spTree = self._spTree
+        if self._shape_names is None or self._shape_names[0] is not spTree:
+            names = set(spTree.xpath('//p:cNvPr/@name'))
+            self._shape_names = (spTree, names)
+        return self._shape_names[1]
+
 
 def _SlideShapeFactory(shape_elm, parent):
     """
@@ -450,6 +962,8 @@ class _SlidePlaceholder(BasePlaceholder):
     Placeholder shape on a slide. Inherits shape properties from its
     corresponding slide layout placeholder.
     """
+    __slots__ = ()
+
     @property
     def height(self):
         """
@@ -105,6 +105,8 @@ class _LayoutPlaceholder(BasePlaceholder):
     from the master placeholder having the same type, when a matching one
     exists.
     """
+    __slots__ = ()
+
     @property
     def height(self):
         """
@@ -211,12 +213,15 @@ class _LayoutPlaceholders(BasePlaceholders):
     def get(self, idx, default=None):
         """
         Return the first placeholder shape with matching *idx* value, or
-        *default* if not found.
-        """
-        for placeholder in self:
-            if placeholder.idx == idx:
-                return placeholder
-        return default
+        *default* if not found. The placeholders are indexed by idx the
+        first time this is called, and again only after shapes are added to
+        or removed from the layout, so later calls take constant time, even
+        for an idx that is not present.
+        """
+        shape_elm = self._shape_elm_having('ph_idx', idx)
+        if shape_elm is None:
+            return default
+        return self._shape_proxy(shape_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -145,6 +145,7 @@ class _MasterPlaceholder(BasePlaceholder):
     """
     Placeholder shape on a slide master.
     """
+    __slots__ = ()
 
 
 class _MasterPlaceholders(BasePlaceholders):
@@ -156,12 +157,15 @@ class _MasterPlaceholders(BasePlaceholders):
         """
         Return the first placeholder shape with type *ph_type* (e.g. 'body'),
         or *default* if no such placeholder shape is present in the
-        collection.
-        """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        collection. The placeholders are indexed by type the first time this
+        is called, and again only after shapes are added to or removed from
+        the master, so later calls take constant time, even for a type that
+        is not present.
+        """
+        shape_elm = self._shape_elm_having('ph_type', ph_type)
+        if shape_elm is None:
+            return default
+        return self._shape_proxy(shape_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -277,6 +277,8 @@ class Shape(BaseShape):
     that can appear in any of the slide-type parts (slide, slideLayout,
     slideMaster, notesPage, notesMaster, handoutMaster).
     """
+    __slots__ = ('_sp', '_adjustments', '_fill', '_line', '_text_frame')
+
     def __init__(self, sp, parent):
         super(Shape, self).__init__(sp, parent)
         self._sp = sp
@@ -387,7 +389,7 @@ class Shape(BaseShape):
     def text(self, text):
         self.text_frame.text = text
 
-    @property
+    @lazyproperty
     def text_frame(self):
         """
         |TextFrame| instance for this shape, containing the text of the shape
@@ -10,6 +10,7 @@ from __future__ import absolute_import
 from ..enum.shapes import MSO_SHAPE_TYPE
 from .shape import BaseShape
 from .table import Table
+from ..util import lazyproperty
 
 
 class GraphicFrame(BaseShape):
@@ -17,6 +18,8 @@ class GraphicFrame(BaseShape):
     Container shape for table, chart, smart art, and media objects.
     Corresponds to a ``<p:graphicFrame>`` element in the shape tree.
     """
+    __slots__ = ('_table',)
+
     @property
     def chart(self):
         """
@@ -67,7 +70,7 @@ class GraphicFrame(BaseShape):
         else:
             return None
 
-    @property
+    @lazyproperty
     def table(self):
         """
         The |Table| object contained in this graphic frame. Raises
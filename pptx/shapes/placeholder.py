@@ -29,6 +29,8 @@ class BasePlaceholder(Shape):
     Base class for placeholder subclasses that differentiate the varying
     behaviors of placeholders on a master, layout, and slide.
     """
+    __slots__ = ()
+
     @property
     def idx(self):
         """
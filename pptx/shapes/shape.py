@@ -14,6 +14,8 @@ class BaseShape(object):
     Base class for shape objects, including |Shape|, |Picture|, and
     |GraphicFrame|.
     """
+    __slots__ = ('_element', '_parent')
+
     def __init__(self, shape_elm, parent):
         super(BaseShape, self).__init__()
         self._element = shape_elm
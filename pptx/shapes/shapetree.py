@@ -4,11 +4,16 @@
 The shape tree, the structure that holds a slide's shapes.
 """
 
+from heapq import heappop, heappush
+
 from .autoshape import Shape
 from .graphfrm import GraphicFrame
 from ..oxml.ns import qn
+from ..oxml.shapes.shared import BaseShapeElement
 from .picture import Picture
 from .shape import BaseShape
+from .spatial import SpatialIndex
+from ..util import Emu, ProxyCache
 
 
 class BaseShapeTree(object):
@@ -19,24 +24,29 @@ class BaseShapeTree(object):
     def __init__(self, slide):
         super(BaseShapeTree, self).__init__()
         self._slide = slide
+        self._proxies = ProxyCache()
+        self._id_allocator = None
+        self._shape_index = None
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
         try:
-            shape_elm = shape_elms[idx]
+            shape_elm = self._index.shape_elm_at(idx)
+            if shape_elm is None:
+                self._shape_index = None
+                shape_elm = self._index.shape_elm_at(idx)
         except IndexError:
             raise IndexError('shape index out of range')
-        return self._shape_factory(shape_elm)
+        return self._shape_proxy(shape_elm)
 
     def __iter__(self):
         """
         Generate a reference to each shape in the collection, in sequence.
         """
         for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+            yield self._shape_proxy(shape_elm)
 
     def __len__(self):
         """
@@ -44,8 +54,52 @@ class BaseShapeTree(object):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._index.shape_elms)
+
+    def by_id(self, shape_id):
+        """
+        Return the shape in this collection having integer id *shape_id*.
+        Raises |KeyError| if no such shape is present.
+        """
+        shape_elm = self._find_shape_elm('shape_id', shape_id)
+        return self._shape_proxy(shape_elm)
+
+    def by_name(self, name):
+        """
+        Return the first shape in this collection named *name*, e.g.
+        'Title 1'. Raises |KeyError| if no such shape is present.
+        """
+        shape_elm = self._find_shape_elm('shape_name', name)
+        return self._shape_proxy(shape_elm)
+
+    def iter_all(self, geometry=False):
+        """
+        Generate each shape in this collection, including the shapes nested
+        in group shapes at any depth, in document order. A group shape is
+        generated just before the shapes it contains. When *geometry* is
+        |True|, each item is a ``(shape, geometry)`` pair, where *geometry*
+        is a |ShapeGeometry| object giving the position and size of the shape
+        on the slide, after the offset and scaling of each containing group
+        is applied. The rotation and flipping of groups is not taken into
+        account.
+        """
+        spTree = self._spTree
+        transforms = {spTree: _IDENTITY_TRANSFORM}
+        grpSp_tag = qn('p:grpSp')
+        for shape_elm in spTree.iter_all_shape_elms():
+            if geometry:
+                transform = transforms[shape_elm.getparent()]
+                if shape_elm.tag == grpSp_tag:
+                    transforms[shape_elm] = _child_transform(
+                        shape_elm, transform
+                    )
+            if not self._is_member_elm(shape_elm):
+                continue
+            shape = self._shape_proxy(shape_elm)
+            if not geometry:
+                yield shape
+                continue
+            yield shape, _shape_geometry(shape_elm, transform)
 
     @property
     def part(self):
@@ -55,6 +109,65 @@ class BaseShapeTree(object):
         """
         return self._slide
 
+    def spatial_index(self):
+        """
+        Return a |SpatialIndex| object over the shapes in this collection,
+        for finding the shapes at a position, the shapes that overlap, and
+        the shapes that extend beyond the slide. The effective position and
+        size of each shape is used, so a placeholder inheriting them from
+        its layout is indexed at the inherited position. A group shape is
+        indexed as a whole; pass ``shapes.iter_all(geometry=True)`` to
+        |SpatialIndex| to index the shapes in groups individually. The index
+        is a snapshot; get a new one after shapes are added or moved.
+        """
+        return SpatialIndex(
+            (shape, ShapeGeometry(
+                shape.left, shape.top, shape.width, shape.height
+            ))
+            for shape in self
+        )
+
+    def _find_shape_elm(self, attr_name, value):
+        """
+        Return the first member shape element whose *attr_name* property is
+        *value*, raising |KeyError| if there is none. A miss rebuilds the
+        index once before giving up, so a shape renamed after the index was
+        built is still found.
+        """
+        shape_elm = self._shape_elm_having(attr_name, value)
+        if shape_elm is None:
+            self._shape_index = None
+            shape_elm = self._index.shape_elm_having(attr_name, value)
+        if shape_elm is None:
+            raise KeyError('no shape with %s %r' % (attr_name, value))
+        return shape_elm
+
+    def _id_allocator_for(self, spTree):
+        """
+        Return the |_ShapeIdAllocator| for *spTree*, creating it if this
+        shape tree does not yet have one for that element.
+        """
+        allocator = self._id_allocator
+        if allocator is None or allocator.spTree is not spTree:
+            allocator = _ShapeIdAllocator.from_spTree(spTree)
+            self._id_allocator = allocator
+        return allocator
+
+    @property
+    def _index(self):
+        """
+        The |_ShapeIndex| for this shape tree, rebuilt when the shape tree
+        has been modified since it was last built. Proxies cached for shapes
+        that have since been removed are discarded at the same time.
+        """
+        spTree = self._spTree
+        index = self._shape_index
+        if index is None or not index.is_current_for(spTree):
+            index = _ShapeIndex(spTree, list(self._iter_member_elms()))
+            self._shape_index = index
+            self._proxies.prune()
+        return index
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -73,19 +186,40 @@ class BaseShapeTree(object):
             if self._is_member_elm(shape_elm):
                 yield shape_elm
 
-    @property
     def _next_shape_id(self):
         """
-        Next available positive integer drawing object id in shape tree,
-        starting from 1 and making use of any gaps in numbering. In practice,
-        the minimum id is 2 because the spTree element is always assigned
-        id="1".
+        Return the next available positive integer drawing object id in the
+        shape tree, starting from 1 and making use of any gaps in numbering.
+        In practice, the minimum id is 2 because the spTree element is always
+        assigned id="1". The id is reserved, so each call returns a different
+        id; call it once per shape added.
         """
-        id_str_lst = self._spTree.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids)+2):
-            if n not in used_ids:
-                return n
+        return self._id_allocator_for(self._spTree).allocate()
+
+    def _next_shape_ids(self, count):
+        """
+        Return a list of the next *count* available shape ids, as though
+        produced by calling :meth:`_next_shape_id` *count* times. Use it when
+        the shapes are added to the tree together after all their ids are
+        known.
+        """
+        return self._id_allocator_for(self._spTree).allocate_many(count)
+
+    def _shape_elm_having(self, attr_name, value):
+        """
+        Return the first member shape element whose *attr_name* property is
+        *value*, or |None| if the index has no such element. A hit on an
+        element that has since been removed or changed rebuilds the index
+        once.
+        """
+        shape_elm = self._index.shape_elm_having(attr_name, value)
+        if shape_elm is None:
+            return None
+        if (shape_elm.getparent() is not self._spTree or
+                getattr(shape_elm, attr_name) != value):
+            self._shape_index = None
+            shape_elm = self._index.shape_elm_having(attr_name, value)
+        return shape_elm
 
     def _shape_factory(self, shape_elm):
         """
@@ -94,6 +228,13 @@ class BaseShapeTree(object):
         """
         return BaseShapeFactory(shape_elm, self)
 
+    def _shape_proxy(self, shape_elm):
+        """
+        Return the shape proxy for *shape_elm*, the same object each time
+        *shape_elm* is accessed through this shape tree.
+        """
+        return self._proxies.get_or_add(shape_elm, self._shape_factory)
+
     @property
     def _spTree(self):
         """
@@ -114,3 +255,362 @@ def BaseShapeFactory(shape_elm, parent):
     if tag_name == qn('p:graphicFrame'):
         return GraphicFrame(shape_elm, parent)
     return BaseShape(shape_elm, parent)
+
+
+class ShapeGeometry(tuple):
+    """
+    Value object giving the position and size of a shape on its slide, in
+    English Metric Units (EMU), as generated by
+    :meth:`~.BaseShapeTree.iter_all`. Each value is |None| when the shape
+    has no position or size of its own, like a placeholder inheriting
+    them from its layout.
+    """
+    def __new__(cls, left, top, width, height):
+        return tuple.__new__(cls, (left, top, width, height))
+
+    @property
+    def height(self):
+        """
+        Height of the shape on the slide.
+        """
+        return self[3]
+
+    @property
+    def left(self):
+        """
+        Distance of the left edge of the shape from the left edge of the
+        slide.
+        """
+        return self[0]
+
+    @property
+    def top(self):
+        """
+        Distance of the top edge of the shape from the top edge of the
+        slide.
+        """
+        return self[1]
+
+    @property
+    def width(self):
+        """
+        Width of the shape on the slide.
+        """
+        return self[2]
+
+
+class ShapeSpec(tuple):
+    """
+    Value object describing a shape to be added using
+    :meth:`~._SlideShapeTree.add_many`. *autoshape_type_id* is a member of
+    :ref:`MsoAutoShapeType` like ``MSO_SHAPE.RECTANGLE``, or |None| for
+    a text box. *text*, if provided, becomes the text of the shape and
+    *fill*, an |RGBColor| value, its solid fill color.
+    """
+    def __new__(cls, autoshape_type_id, left, top, width, height, text=None,
+                fill=None):
+        return tuple.__new__(
+            cls, (autoshape_type_id, left, top, width, height, text, fill)
+        )
+
+    @property
+    def autoshape_type_id(self):
+        """
+        Member of :ref:`MsoAutoShapeType` identifying the kind of auto shape
+        to add, or |None| to add a text box.
+        """
+        return self[0]
+
+    @property
+    def fill(self):
+        """
+        |RGBColor| value for the solid fill of the shape, or |None| to use
+        the default fill.
+        """
+        return self[6]
+
+    @property
+    def height(self):
+        """
+        Height of the shape in English Metric Units (EMU).
+        """
+        return self[4]
+
+    @property
+    def left(self):
+        """
+        Distance of the left edge of the shape from the left edge of the
+        slide, in EMU.
+        """
+        return self[1]
+
+    @property
+    def text(self):
+        """
+        Text of the shape, or |None| to leave it empty. A line feed character
+        ('\\n') becomes a line break.
+        """
+        return self[5]
+
+    @property
+    def top(self):
+        """
+        Distance of the top edge of the shape from the top edge of the
+        slide, in EMU.
+        """
+        return self[2]
+
+    @property
+    def width(self):
+        """
+        Width of the shape in EMU.
+        """
+        return self[3]
+
+
+# (x scale, x offset, y scale, y offset) mapping the coordinates of the
+# shapes in a group to slide coordinates
+_IDENTITY_TRANSFORM = (1.0, 0.0, 1.0, 0.0)
+
+
+def _child_transform(grpSp, transform):
+    """
+    Return the transform mapping the coordinates of the shapes in *grpSp* to
+    slide coordinates, where *transform* is the transform that applies to
+    *grpSp* itself. The child offset and extents of the group map onto its
+    offset and extents.
+    """
+    xfrm = grpSp.xfrm
+    if xfrm is None or xfrm.off is None or xfrm.ext is None:
+        return transform
+    chOff, chExt = xfrm.chOff, xfrm.chExt
+    ch_x, ch_y = (xfrm.x, xfrm.y) if chOff is None else (chOff.x, chOff.y)
+    ch_cx, ch_cy = (
+        (xfrm.cx, xfrm.cy) if chExt is None else (chExt.cx, chExt.cy)
+    )
+    kx = float(xfrm.cx) / ch_cx if ch_cx else 1.0
+    ky = float(xfrm.cy) / ch_cy if ch_cy else 1.0
+    sx, tx, sy, ty = transform
+    return (
+        sx * kx, sx * (xfrm.x - ch_x * kx) + tx,
+        sy * ky, sy * (xfrm.y - ch_y * ky) + ty,
+    )
+
+
+def _shape_geometry(shape_elm, transform):
+    """
+    Return a |ShapeGeometry| object for *shape_elm* in slide coordinates,
+    where *transform* maps the coordinates of its containing group.
+    """
+    x, y = getattr(shape_elm, 'x', None), getattr(shape_elm, 'y', None)
+    cx, cy = getattr(shape_elm, 'cx', None), getattr(shape_elm, 'cy', None)
+    sx, tx, sy, ty = transform
+    return ShapeGeometry(
+        None if x is None else Emu(int(round(sx * x + tx))),
+        None if y is None else Emu(int(round(sy * y + ty))),
+        None if cx is None else Emu(int(round(sx * cx))),
+        None if cy is None else Emu(int(round(sy * cy))),
+    )
+
+
+class _ShapeIndex(object):
+    """
+    Snapshot of the member shape elements of a shape tree, providing
+    constant-time positional access and lookup by id or name. Any shape
+    added to or removed from the ``<p:spTree>`` element changes its child
+    count or its last child, which is how the index detects it is out of
+    date. Both are found by lxml in C, very much faster than constructing
+    the element proxies needed to scan the tree in Python. Shapes can also
+    be moved, or removed and others inserted in their place, without
+    changing either, so each element the index returns is first checked to
+    still be where it was found.
+    """
+    def __init__(self, spTree, shape_elms):
+        super(_ShapeIndex, self).__init__()
+        self._spTree = spTree
+        self._child_count = len(spTree)
+        self._last_child = spTree[-1] if len(spTree) else None
+        self._shape_elms = shape_elms
+        self._lookups = {}
+        child_idxs = dict((elm, idx) for idx, elm in enumerate(spTree))
+        self._child_idxs = [child_idxs[elm] for elm in shape_elms]
+
+    def is_current_for(self, spTree):
+        """
+        True if this index was built from *spTree* and neither the number of
+        its children nor its last child has changed since.
+        """
+        if spTree is not self._spTree or len(spTree) != self._child_count:
+            return False
+        return not self._child_count or spTree[-1] is self._last_child
+
+    def shape_elm_at(self, idx):
+        """
+        Return the member shape element at *idx*, or |None| if the element
+        found there when the index was built is no longer at the same place
+        in the ``<p:spTree>`` element. Raises |IndexError| if *idx* is out of
+        range.
+        """
+        shape_elm = self._shape_elms[idx]
+        child_idx = self._child_idxs[idx]
+        # ---lxml locates a child by walking from the nearer end---
+        if child_idx > self._child_count // 2:
+            child_idx -= self._child_count
+        if self._spTree[child_idx] is not shape_elm:
+            return None
+        return shape_elm
+
+    def shape_elm_having(self, attr_name, value):
+        """
+        Return the first shape element whose *attr_name* property, e.g.
+        'shape_id', is *value*, or |None| if there is none. The lookup table
+        for each property is built the first time it is needed.
+        """
+        lookup = self._lookups.get(attr_name)
+        if lookup is None:
+            lookup = {}
+            for shape_elm in self._shape_elms:
+                if not isinstance(shape_elm, BaseShapeElement):
+                    continue
+                lookup.setdefault(getattr(shape_elm, attr_name), shape_elm)
+            self._lookups[attr_name] = lookup
+        return lookup.get(value)
+
+    @property
+    def shape_elms(self):
+        """
+        List of the member shape elements, in document order.
+        """
+        return self._shape_elms
+
+
+class _ShapeIdAllocator(object):
+    """
+    Hands out the lowest unused shape id in a shape tree. The used ids are
+    read from the XML when the allocator is constructed; after that,
+    allocating or releasing an id is amortized constant time, so adding
+    shapes to a slide is linear rather than quadratic in the shape count.
+    Each id handed out is expected to become one new child of the
+    ``<p:spTree>`` element. When the child count shows the tree was changed
+    some other way, such as a copied shape being inserted or a shape being
+    removed directly in the XML, the ids are read again and those of shapes
+    no longer present are released for reuse. A change that leaves the
+    child count as expected, like replacing one shape with another, is not
+    detected.
+    """
+    def __init__(self, spTree, used_ids):
+        super(_ShapeIdAllocator, self).__init__()
+        self._spTree = spTree
+        self._used_ids = set(used_ids)
+        self._next_id = 1
+        self._released_ids = []
+        self._tree_ids = set(self._used_ids)
+        self._pending_ids = set()
+        self._synced_child_count = self._child_count
+
+    @classmethod
+    def from_spTree(cls, spTree):
+        """
+        Return a new allocator seeded with the ids already used in the
+        document containing *spTree*.
+        """
+        return cls(spTree, cls._ids_in(spTree))
+
+    def allocate(self):
+        """
+        Return the lowest positive integer id not yet in use and mark it as
+        used.
+        """
+        return self.allocate_many(1)[0]
+
+    def allocate_many(self, count):
+        """
+        Return a list of the *count* lowest positive integer ids not yet in
+        use and mark them as used. Use this rather than repeated calls to
+        :meth:`allocate` when the shapes are added to the tree only after all
+        their ids are known.
+        """
+        if self._tree_was_changed:
+            self._sync()
+        return [self._allocate_one() for _ in range(count)]
+
+    def release(self, shape_id):
+        """
+        Mark *shape_id* as no longer in use so it can be allocated again.
+        Ids at or above the scan position are found again by the scan, so
+        only lower ids need to be remembered.
+        """
+        if shape_id not in self._used_ids:
+            return
+        self._used_ids.remove(shape_id)
+        if shape_id < self._next_id:
+            heappush(self._released_ids, shape_id)
+
+    @property
+    def spTree(self):
+        """
+        The ``<p:spTree>`` element this allocator was seeded from.
+        """
+        return self._spTree
+
+    def _allocate_one(self):
+        """
+        Return the lowest id not in use after marking it used.
+        """
+        used_ids, released_ids = self._used_ids, self._released_ids
+        while released_ids:
+            shape_id = heappop(released_ids)
+            if shape_id not in used_ids:
+                break
+        else:
+            while self._next_id in used_ids:
+                self._next_id += 1
+            shape_id = self._next_id
+        used_ids.add(shape_id)
+        self._pending_ids.add(shape_id)
+        return shape_id
+
+    @property
+    def _child_count(self):
+        """
+        The number of children of the ``<p:spTree>`` element, 0 if this
+        allocator has none.
+        """
+        return 0 if self._spTree is None else len(self._spTree)
+
+    @staticmethod
+    def _ids_in(spTree):
+        """
+        Return a list of the integer ids used in the document containing
+        *spTree*.
+        """
+        id_str_lst = spTree.xpath('//@id')
+        return [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+
+    def _sync(self):
+        """
+        Read the used ids from the XML again. An id found in the XML last
+        time and missing now is released. An id handed out but not yet seen
+        in the XML stays reserved, since its shape may still be added.
+        """
+        tree_ids = set(self._ids_in(self._spTree))
+        for shape_id in self._tree_ids - tree_ids - self._pending_ids:
+            self.release(shape_id)
+        self._used_ids.update(tree_ids)
+        self._tree_ids = tree_ids
+        self._pending_ids = set()
+        self._synced_child_count = self._child_count
+
+    @property
+    def _tree_was_changed(self):
+        """
+        True if the child count of the ``<p:spTree>`` element is other than
+        expected from the ids handed out since the last sync, meaning shapes
+        were inserted or removed other than by this allocator's client.
+        """
+        if self._spTree is None:
+            return False
+        expected_child_count = (
+            self._synced_child_count + len(self._pending_ids)
+        )
+        return self._child_count != expected_child_count
@@ -0,0 +1,209 @@
+# encoding: utf-8
+
+"""
+Spatial index over the bounding boxes of shapes, for hit-testing and
+overlap queries.
+"""
+
+from __future__ import absolute_import
+
+from math import ceil, sqrt
+
+
+class SpatialIndex(object):
+    """
+    Index of the bounding boxes of a collection of shapes, answering queries
+    about their positions without comparing every shape with every other.
+    *items* is a sequence of ``(shape, geometry)`` pairs, like those
+    generated by ``shapes.iter_all(geometry=True)``, where *geometry* is
+    a ``(left, top, width, height)`` sequence in EMU. A shape having |None|
+    for any of these values is not indexed. Two boxes overlap only when the
+    area they share is greater than zero; boxes that merely touch do not.
+    Shapes are returned in the order they appear in *items*.
+    """
+    def __init__(self, items):
+        super(SpatialIndex, self).__init__()
+        boxes = []
+        for seq, (shape, geometry) in enumerate(items):
+            left, top, width, height = geometry
+            if None in (left, top, width, height):
+                continue
+            boxes.append(
+                _Box(left, top, left + width, top + height, seq, shape)
+            )
+        self._boxes = boxes
+        self._tree = _BoxTree(boxes)
+
+    def __len__(self):
+        """
+        Number of shapes in this index.
+        """
+        return len(self._boxes)
+
+    def intersecting(self, left, top, width, height):
+        """
+        Return a list of the shapes that overlap the rectangle at (*left*,
+        *top*) having size (*width*, *height*). Only the groups of boxes
+        whose bounds overlap the rectangle are searched.
+        """
+        hits = self._tree.overlapping(left, top, left + width, top + height)
+        return [box.shape for box in sorted(hits, key=_seq)]
+
+    def outside(self, width, height):
+        """
+        Return a list of the shapes that extend beyond a slide of size
+        (*width*, *height*), such as ``(prs.slide_width,
+        prs.slide_height)``.
+        """
+        hits = [
+            box for box in self._boxes
+            if box.left < 0 or box.top < 0 or box.right > width or
+            box.bottom > height
+        ]
+        return [box.shape for box in sorted(hits, key=_seq)]
+
+    def overlapping_pairs(self):
+        """
+        Return a list of ``(shape, other_shape)`` pairs, one for each pair of
+        shapes that overlap, where *shape* appears before *other_shape*. Each
+        box is looked up in the index, so it is compared only with boxes
+        near it.
+        """
+        overlapping = self._tree.overlapping
+        pairs = []
+        for box in self._boxes:
+            for other in overlapping(box.left, box.top, box.right, box.bottom):
+                if other.seq > box.seq:
+                    pairs.append((box, other))
+        pairs.sort(key=lambda pair: (pair[0].seq, pair[1].seq))
+        return [(box.shape, other.shape) for box, other in pairs]
+
+
+class _Box(tuple):
+    """
+    Bounding box of an indexed shape, along with the shape and its position
+    in the indexed sequence.
+    """
+    def __new__(cls, left, top, right, bottom, seq, shape):
+        return tuple.__new__(cls, (left, seq, top, right, bottom, shape))
+
+    @property
+    def bottom(self):
+        return self[4]
+
+    @property
+    def left(self):
+        return self[0]
+
+    @property
+    def right(self):
+        return self[3]
+
+    @property
+    def seq(self):
+        return self[1]
+
+    @property
+    def shape(self):
+        return self[5]
+
+    @property
+    def top(self):
+        return self[2]
+
+
+class _BoxTree(object):
+    """
+    Static R-tree over a sequence of boxes, packed bottom-up in the
+    Sort-Tile-Recursive manner: the entries of each level are sorted into
+    vertical slices by their horizontal center, and each slice is cut into
+    nodes of up to :attr:`_node_size` entries by vertical center. Nodes
+    therefore cover compact, mostly disjoint areas, so a query visits only
+    the few nodes near the rectangle it asks about.
+    """
+    _node_size = 16
+
+    def __init__(self, boxes):
+        super(_BoxTree, self).__init__()
+        entries, is_leaf = list(boxes), True
+        while len(entries) > self._node_size:
+            entries, is_leaf = self._pack(entries, is_leaf), False
+        self._root = _Node(entries, is_leaf) if entries else None
+
+    def overlapping(self, left, top, right, bottom):
+        """
+        Return a list of the boxes sharing a positive area with the
+        rectangle bounded by *left*, *top*, *right*, and *bottom*.
+        """
+        hits = []
+        if self._root is None:
+            return hits
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            entries = [
+                entry for entry in node.entries
+                if entry.left < right and entry.right > left and
+                entry.top < bottom and entry.bottom > top
+            ]
+            if node.is_leaf:
+                hits.extend(entries)
+            else:
+                nodes.extend(entries)
+        return hits
+
+    @classmethod
+    def _pack(cls, entries, is_leaf):
+        """
+        Return a list of |_Node| objects, each holding up to
+        :attr:`_node_size` of *entries*, which are boxes when *is_leaf* is
+        |True| and nodes otherwise.
+        """
+        node_size = cls._node_size
+        node_count = int(ceil(len(entries) / float(node_size)))
+        slice_len = int(ceil(sqrt(node_count))) * node_size
+        entries = sorted(entries, key=_x_center)
+        nodes = []
+        for start in range(0, len(entries), slice_len):
+            slice_ = sorted(entries[start:start+slice_len], key=_y_center)
+            for idx in range(0, len(slice_), node_size):
+                nodes.append(_Node(slice_[idx:idx+node_size], is_leaf))
+        return nodes
+
+
+class _Node(object):
+    """
+    Node of a |_BoxTree|, holding boxes when it is a leaf and other nodes
+    otherwise, and bounded by the smallest rectangle enclosing them.
+    """
+    __slots__ = ('left', 'top', 'right', 'bottom', 'entries', 'is_leaf')
+
+    def __init__(self, entries, is_leaf):
+        self.left = min(entry.left for entry in entries)
+        self.top = min(entry.top for entry in entries)
+        self.right = max(entry.right for entry in entries)
+        self.bottom = max(entry.bottom for entry in entries)
+        self.entries = entries
+        self.is_leaf = is_leaf
+
+
+def _seq(box):
+    """
+    Sort key putting boxes in the order their shapes were indexed.
+    """
+    return box.seq
+
+
+def _x_center(entry):
+    """
+    Sort key ordering boxes or nodes by horizontal center, then by vertical
+    center.
+    """
+    return (entry.left + entry.right, entry.top + entry.bottom)
+
+
+def _y_center(entry):
+    """
+    Sort key ordering boxes or nodes by vertical center.
+    """
+    return entry.top + entry.bottom
@@ -9,10 +9,11 @@ from __future__ import absolute_import, print_function
 from warnings import warn
 
 from . import Subshape
-from ..compat import is_integer, to_unicode
+from ..compat import is_integer, is_string, to_unicode
 from ..dml.fill import FillFormat
+from ..oxml.ns import qn
 from ..text.text import TextFrame
-from ..util import lazyproperty
+from ..util import lazyproperty, ProxyCache
 
 
 class Table(object):
@@ -20,18 +21,31 @@ class Table(object):
     A table shape. Not intended to be constructed directly, use
     :meth:`.Slide.shapes.add_table` to add a table to a slide.
     """
+    __slots__ = (
+        '_tbl', '_graphic_frame', '_columns', '_rows', '_cell_grid',
+        '_cell_proxies'
+    )
+
     def __init__(self, tbl, graphic_frame):
         super(Table, self).__init__()
         self._tbl = tbl
         self._graphic_frame = graphic_frame
+        self._cell_grid = None
+        self._cell_proxies = ProxyCache()
 
     def cell(self, row_idx, col_idx):
         """
         Return table cell at *row_idx*, *col_idx* location. Indexes are
-        zero-based, e.g. cell(0, 0) is the top, left cell.
+        zero-based, e.g. cell(0, 0) is the top, left cell. The cell elements
+        are located once and kept in a grid, so access takes constant time
+        no matter the size of the table. Raises |IndexError| if either index
+        is out of range.
         """
-        row = self.rows[row_idx]
-        return row.cells[col_idx]
+        tc = self._grid.tc(row_idx, col_idx)
+        if tc is None:
+            self._cell_grid = None
+            tc = self._grid.tc(row_idx, col_idx)
+        return self._cell_proxies.get_or_add(tc, self._new_cell)
 
     @lazyproperty
     def columns(self):
@@ -136,7 +150,15 @@ class Table(object):
         table's rows. |_Row| objects are accessed using list notation, e.g.
         ``col = tbl.rows[0]``.
         """
-        return _RowCollection(self._tbl, self)
+        return _RowCollection(self._tbl, self, self._cell_proxies)
+
+    def to_rows(self):
+        """
+        Return a list containing a list of the text in each cell of each row
+        of this table, as it would be returned by ``cell.text_frame.text``.
+        No row or cell objects are created.
+        """
+        return self._tbl.text_rows()
 
     @property
     def vert_banding(self):
@@ -150,11 +172,61 @@ class Table(object):
     def vert_banding(self, value):
         self._tbl.bandCol = value
 
+    def write(self, rows, formats=None):
+        """
+        Replace the text in the cells of this table with the values in
+        *rows*, a sequence of row sequences such as a list of lists or
+        tuples, starting with the top, left cell. An object having
+        a ``tolist()`` method, such as a 2-D :class:`memoryview` or array,
+        can also be used. Cells not covered by *rows* are left unchanged.
+        String values are used as-is and |None| produces an empty cell.
+        Other values are converted to text using the built-in
+        :func:`format` function. If provided, *formats* is a sequence
+        containing a format spec for each column, like ``',.2f'``, or |None|
+        to use the default for that column, so a header row of strings can
+        be written along with the formatted values. Raises |ValueError| if
+        *rows* has more rows or columns than this table.
+        """
+        tbl = self._tbl
+        row_count = len(tbl.tr_lst)
+        col_count = len(tbl.tblGrid.gridCol_lst)
+        text_rows = text_rows_from_data(rows, formats)
+        if len(text_rows) > row_count or any(
+                len(texts) > col_count for texts in text_rows):
+            raise ValueError(
+                'data does not fit in a table of %d rows and %d columns' %
+                (row_count, col_count)
+            )
+        tbl.replace_cell_text(text_rows)
+
+    @property
+    def _grid(self):
+        """
+        The |_CellGrid| for this table, rebuilt when rows have been added or
+        removed since it was last built. Proxies cached for cells that have
+        since been removed are discarded at the same time.
+        """
+        tbl = self._tbl
+        grid = self._cell_grid
+        if grid is None or not grid.is_current_for(tbl):
+            grid = _CellGrid(tbl)
+            self._cell_grid = grid
+            self._cell_proxies.prune()
+        return grid
+
+    def _new_cell(self, tc):
+        """
+        Return a new |_Cell| object proxying *tc*.
+        """
+        return _Cell(tc, self)
+
 
 class _Cell(Subshape):
     """
     Table cell
     """
+    __slots__ = ('_tc', '_fill', '_text_frame')
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(parent)
         self._tc = tc
@@ -231,7 +303,7 @@ class _Cell(Subshape):
     #: values are converted to unicode assuming UTF-8 encoding.
     text = property(None, text)
 
-    @property
+    @lazyproperty
     def text_frame(self):
         """
         |TextFrame| instance containing the text that appears in the cell.
@@ -282,10 +354,95 @@ class _Cell(Subshape):
             raise TypeError(tmpl % margin_value)
 
 
+class _CellGrid(object):
+    """
+    Snapshot of the ``<a:tc>`` elements of a table, arranged by row, giving
+    constant-time access to the cell element at any row and column. Adding
+    or removing a row changes the child count of the ``<a:tbl>`` element,
+    which is how the grid detects it is out of date. The cells of a row are
+    re-read when the child count of its ``<a:tr>`` element changes. Rows and
+    cells can also be moved without changing a count, so each cell element
+    the grid returns is first checked to still be where it was found.
+    """
+    def __init__(self, tbl):
+        super(_CellGrid, self).__init__()
+        self._tbl = tbl
+        self._child_count = len(tbl)
+        self._rows = [
+            self._row_entry(tr, child_idx)
+            for child_idx, tr in self._iter_children(tbl, qn('a:tr'))
+        ]
+
+    def is_current_for(self, tbl):
+        """
+        True if this grid was built from *tbl* and the number of its children
+        has not changed since.
+        """
+        return tbl is self._tbl and len(tbl) == self._child_count
+
+    def tc(self, row_idx, col_idx):
+        """
+        Return the ``<a:tc>`` element at *row_idx*, *col_idx*, or |None| if
+        the row found there when the grid was built is no longer at the same
+        place in the ``<a:tbl>`` element. Raises |IndexError| if either index
+        is out of range.
+        """
+        rows = self._rows
+        if row_idx < 0 or row_idx >= len(rows):
+            raise IndexError('row index [%d] out of range' % row_idx)
+        tr, child_idx, child_count, tc_entries = rows[row_idx]
+        if self._tbl[child_idx] is not tr:
+            return None
+        if len(tr) != child_count:
+            tc_entries = self._refresh_row(row_idx)
+        if col_idx < 0 or col_idx >= len(tc_entries):
+            raise IndexError('cell index [%d] out of range' % col_idx)
+        tc, tc_child_idx = tc_entries[col_idx]
+        if tr[tc_child_idx] is not tc:
+            tc_entries = self._refresh_row(row_idx)
+            tc = tc_entries[col_idx][0]
+        return tc
+
+    @staticmethod
+    def _iter_children(parent, tag):
+        """
+        Generate a ``(child_idx, child)`` 2-tuple for each child of *parent*
+        having *tag*, where *child_idx* is its position among all the
+        children.
+        """
+        for child_idx, child in enumerate(parent):
+            if child.tag == tag:
+                yield child_idx, child
+
+    def _refresh_row(self, row_idx):
+        """
+        Re-read the cells of the row at *row_idx* and return its new list of
+        ``(tc, child_idx)`` pairs.
+        """
+        tr, child_idx = self._rows[row_idx][:2]
+        entry = self._rows[row_idx] = self._row_entry(tr, child_idx)
+        return entry[3]
+
+    @classmethod
+    def _row_entry(cls, tr, child_idx):
+        """
+        Return a ``(tr, child_idx, child_count, tc_entries)`` 4-tuple
+        recording the position of *tr* and its current cells, each as a
+        ``(tc, child_idx)`` pair.
+        """
+        tc_entries = [
+            (tc, tc_child_idx)
+            for tc_child_idx, tc in cls._iter_children(tr, qn('a:tc'))
+        ]
+        return (tr, child_idx, len(tr), tc_entries)
+
+
 class _Column(Subshape):
     """
     Table column
     """
+    __slots__ = ('_gridCol',)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -305,19 +462,23 @@ class _Column(Subshape):
 
 class _Row(Subshape):
     """
-    Table row
+    Table row. The cell proxies of a row in a table are shared with the
+    table, so a cell is the same object however it is reached.
     """
-    def __init__(self, tr, parent):
+    __slots__ = ('_tr', '_cell_proxies', '_cells')
+
+    def __init__(self, tr, parent, cell_proxies=None):
         super(_Row, self).__init__(parent)
         self._tr = tr
+        self._cell_proxies = cell_proxies
 
-    @property
+    @lazyproperty
     def cells(self):
         """
         Read-only reference to collection of cells in row. An individual cell
         is referenced using list notation, e.g. ``cell = row.cells[0]``.
         """
-        return _CellCollection(self._tr, self)
+        return _CellCollection(self._tr, self, self._cell_proxies)
 
     @property
     def height(self):
@@ -336,9 +497,12 @@ class _CellCollection(Subshape):
     """
     "Horizontal" sequence of row cells
     """
-    def __init__(self, tr, parent):
+    __slots__ = ('_tr', '_proxies')
+
+    def __init__(self, tr, parent, proxies=None):
         super(_CellCollection, self).__init__(parent)
         self._tr = tr
+        self._proxies = ProxyCache() if proxies is None else proxies
 
     def __getitem__(self, idx):
         """
@@ -347,7 +511,8 @@ class _CellCollection(Subshape):
         if idx < 0 or idx >= len(self._tr.tc_lst):
             msg = "cell index [%d] out of range" % idx
             raise IndexError(msg)
-        return _Cell(self._tr.tc_lst[idx], self)
+        tc = self._tr.tc_lst[idx]
+        return self._proxies.get_or_add(tc, self._new_cell)
 
     def __len__(self):
         """
@@ -355,11 +520,19 @@ class _CellCollection(Subshape):
         """
         return len(self._tr.tc_lst)
 
+    def _new_cell(self, tc):
+        """
+        Return a new |_Cell| object proxying *tc*.
+        """
+        return _Cell(tc, self)
+
 
 class _ColumnCollection(Subshape):
     """
     Sequence of table columns.
     """
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_ColumnCollection, self).__init__(parent)
         self._tbl = tbl
@@ -390,9 +563,13 @@ class _RowCollection(Subshape):
     """
     Sequence of table rows.
     """
-    def __init__(self, tbl, parent):
+    __slots__ = ('_tbl', '_proxies', '_cell_proxies')
+
+    def __init__(self, tbl, parent, cell_proxies=None):
         super(_RowCollection, self).__init__(parent)
         self._tbl = tbl
+        self._proxies = ProxyCache()
+        self._cell_proxies = cell_proxies
 
     def __getitem__(self, idx):
         """
@@ -401,7 +578,8 @@ class _RowCollection(Subshape):
         if idx < 0 or idx >= len(self):
             msg = "row index [%d] out of range" % idx
             raise IndexError(msg)
-        return _Row(self._tbl.tr_lst[idx], self)
+        tr = self._tbl.tr_lst[idx]
+        return self._proxies.get_or_add(tr, self._new_row)
 
     def __len__(self):
         """
@@ -414,3 +592,40 @@ class _RowCollection(Subshape):
         Called by a row when its height changes. Pass along to parent.
         """
         self._parent.notify_height_changed()
+
+    def _new_row(self, tr):
+        """
+        Return a new |_Row| object proxying *tr*.
+        """
+        return _Row(tr, self, self._cell_proxies)
+
+
+def text_rows_from_data(rows, formats=None):
+    """
+    Return a list containing a list of unicode cell text for each row
+    sequence in *rows*, as described for :meth:`Table.write`.
+    """
+    if hasattr(rows, 'tolist'):
+        rows = rows.tolist()
+    formats = [] if formats is None else list(formats)
+    text_rows = []
+    for row in rows:
+        row = list(row)
+        specs = formats + [None] * (len(row) - len(formats))
+        text_rows.append([
+            _cell_text(value, spec) for value, spec in zip(row, specs)
+        ])
+    return text_rows
+
+
+def _cell_text(value, format_spec):
+    """
+    Return the unicode text to display in a cell for *value*. A string
+    value is used as-is; other values are formatted according to
+    *format_spec* when it is not |None|.
+    """
+    if value is None:
+        return u''
+    if is_string(value):
+        return to_unicode(value)
+    return to_unicode(format(value, format_spec or ''))
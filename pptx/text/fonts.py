@@ -6,43 +6,71 @@ Objects related to system font file lookup.
 
 from __future__ import absolute_import, print_function
 
+import json
+import mmap
 import os
 import sys
 
-from struct import calcsize, unpack_from
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+from struct import error as struct_error, unpack_from
+from threading import RLock
 
-from ..util import lazyproperty
+from ..util import lazyproperty, LruCache
 
 
 class FontFiles(object):
     """
     A class-based singleton serving as a lazy cache for system font details.
+    The paths of the fonts seen are held in :attr:`_font_files`, a bounded
+    cache whose capacity can be changed. Lookups are serialized, so fonts
+    can be found from several threads at once. A font found to be missing
+    is remembered until a font directory changes, so asking for it again
+    does not scan the fonts again.
     """
 
-    _font_files = None
+    _font_files = LruCache(1024)
+    _font_index = None
+    _lock = RLock()
+    _missing_fonts = set()
+    _remaining_fonts = None
 
     @classmethod
     def find(cls, family_name, is_bold, is_italic):
         """
         Return the absolute path to the installed OpenType font having
-        *family_name* and the styles *is_bold* and *is_italic*.
-        """
-        if cls._font_files is None:
-            cls._font_files = cls._installed_fonts()
-        return cls._font_files[(family_name, is_bold, is_italic)]
+        *family_name* and the styles *is_bold* and *is_italic*. The font
+        directories are scanned only as far as needed to find the font, and
+        the fonts passed along the way are remembered for later calls.
+        Raises |KeyError| if no such font is installed.
+        """
+        key = (family_name, is_bold, is_italic)
+        with cls._lock:
+            path = cls._font_files.get(key)
+            if path is None:
+                path = cls._scan_for(key)
+        if path is None:
+            raise KeyError(key)
+        return path
 
     @classmethod
-    def _installed_fonts(cls):
+    def _index_path(cls):
         """
-        Return a dict mapping a font descriptor to its font file path,
-        containing all the font files resident on the current machine. The
-        font descriptor is a (family_name, is_bold, is_italic) 3-tuple.
+        Return the path of the file in which the font index is saved between
+        runs, or |None| if no suitable cache directory can be determined.
+        The ``XDG_CACHE_HOME`` environment variable is respected on
+        platforms other than Windows.
         """
-        fonts = {}
-        for d in cls._font_directories():
-            for key, path in cls._iter_font_files_in(d):
-                fonts[key] = path
-        return fonts
+        if sys.platform.startswith('win32'):
+            cache_dir = os.environ.get('LOCALAPPDATA')
+        else:
+            cache_dir = os.environ.get('XDG_CACHE_HOME')
+            home = os.environ.get('HOME')
+            if not cache_dir and home is not None:
+                cache_dir = os.path.join(home, '.cache')
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, 'python-pptx', 'font-index.json')
 
     @classmethod
     def _font_directories(cls):
@@ -54,24 +82,42 @@ class FontFiles(object):
             return cls._os_x_font_directories()
         if sys.platform.startswith('win32'):
             return cls._windows_font_directories()
+        if sys.platform.startswith('linux'):
+            return cls._linux_font_directories()
         raise OSError('unsupported operating system')
 
     @classmethod
-    def _iter_font_files_in(cls, directory):
+    def _iter_installed_fonts(cls, index):
         """
-        Generate the OpenType font files found in and under *directory*. Each
-        item is a key/value pair. The key is a (family_name, is_bold,
-        is_italic) 3-tuple, like ('Arial', True, False), and the value is the
-        absolute path to the font file.
+        Generate a key/value pair for each font file resident on the current
+        machine, using *index* to avoid parsing font files that have not
+        changed since they were last seen. The key is a (family_name,
+        is_bold, is_italic) 3-tuple and the value is the font file path. The
+        index is pruned of directories that no longer exist once all the
+        fonts have been generated.
         """
-        for root, dirs, files in os.walk(directory):
-            for filename in files:
-                file_ext = os.path.splitext(filename)[1]
-                if file_ext.lower() not in ('.otf', '.ttf'):
-                    continue
-                path = os.path.abspath(os.path.join(root, filename))
-                with _Font.open(path) as f:
-                    yield ((f.family_name, f.is_bold, f.is_italic), path)
+        for d in cls._font_directories():
+            for key, path in index.iter_fonts_in(d):
+                yield key, path
+        index.prune()
+
+    @classmethod
+    def _linux_font_directories(cls):
+        """
+        Return a sequence of directory paths on Linux in which fonts are
+        likely to be located.
+        """
+        linux_font_dirs = [
+            '/usr/share/fonts',
+            '/usr/local/share/fonts',
+        ]
+        home = os.environ.get('HOME')
+        if home is not None:
+            linux_font_dirs.extend([
+                os.path.join(home, '.local', 'share', 'fonts'),
+                os.path.join(home, '.fonts')
+            ])
+        return linux_font_dirs
 
     @classmethod
     def _os_x_font_directories(cls):
@@ -92,6 +138,49 @@ class FontFiles(object):
             ])
         return os_x_font_dirs
 
+    @classmethod
+    def _scan_for(cls, key):
+        """
+        Return the path to the font having *key*, continuing the scan of the
+        installed fonts from where the last scan stopped, or |None| if it is
+        not installed. When the font cache is full, fonts seen earlier may
+        have been discarded, so the scan starts over before giving up. The
+        key of a font not found is remembered, and |None| is returned for it
+        without scanning for as long as the font directories are unchanged.
+        """
+        if cls._font_index is None:
+            cls._font_index = _FontIndex.load(cls._index_path())
+            cls._remaining_fonts = cls._iter_installed_fonts(cls._font_index)
+        font_index = cls._font_index
+        if key in cls._missing_fonts:
+            if font_index.is_current():
+                return None
+            cls._missing_fonts = set()
+            cls._remaining_fonts = cls._iter_installed_fonts(font_index)
+        with font_index.parsing():
+            path = cls._scan_remaining_for(key)
+            font_files = cls._font_files
+            if path is None and len(font_files) >= font_files.capacity:
+                cls._remaining_fonts = cls._iter_installed_fonts(font_index)
+                path = cls._scan_remaining_for(key)
+        if path is None:
+            cls._missing_fonts.add(key)
+        font_index.save()
+        return path
+
+    @classmethod
+    def _scan_remaining_for(cls, key):
+        """
+        Return the path to the font having *key*, caching each font passed
+        along the way, or |None| if the remaining fonts run out first.
+        """
+        font_files = cls._font_files
+        for font_key, path in cls._remaining_fonts:
+            path = font_files.setdefault(font_key, path)
+            if font_key == key:
+                return path
+        return None
+
     @classmethod
     def _windows_font_directories(cls):
         """
@@ -101,6 +190,205 @@ class FontFiles(object):
         return [r'C:\Windows\Fonts']
 
 
+class _FontIndex(object):
+    """
+    Catalog of the fonts found in each font directory, saved as a JSON file
+    between runs so a font file is opened and parsed only when its directory
+    has changed since the last scan. Adding, removing, or renaming a file in
+    a directory updates the directory's modification time, which is how
+    a changed directory is detected. Within :meth:`parsing`, changed
+    directories are parsed on one pool of threads, a bounded batch of files
+    at a time.
+    """
+    _version = 1
+    _batch_size = 64
+    _thread_count = 8
+
+    def __init__(self, path, entries):
+        super(_FontIndex, self).__init__()
+        self._path = path
+        self._entries = entries
+        self._seen_dirpaths = set()
+        self._is_changed = False
+        self._is_parsing = False
+        self._pool = None
+
+    @classmethod
+    def load(cls, path):
+        """
+        Return a |_FontIndex| loaded from the JSON file at *path*. The index
+        is empty if *path* is |None| or the file is missing, unreadable, or
+        was written by a different version of this class.
+        """
+        entries = {}
+        if path is not None and os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    index = json.load(f)
+                if index.get('version') == cls._version:
+                    entries = index['directories']
+            except (IOError, OSError, ValueError, KeyError, AttributeError):
+                entries = {}
+        return cls(path, entries)
+
+    def is_current(self):
+        """
+        True if no directory in this index has changed since its fonts were
+        read. Only the modification time of each directory is checked, so
+        this is much faster than walking the directories again.
+        """
+        for dirpath, (mtime, fonts) in self._entries.items():
+            try:
+                if os.path.getmtime(dirpath) != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def iter_fonts_in(self, directory):
+        """
+        Generate the OpenType font files found in and under *directory*. Each
+        item is a key/value pair. The key is a (family_name, is_bold,
+        is_italic) 3-tuple, like ('Arial', True, False), and the value is the
+        absolute path to the font file. The fonts in unchanged directories
+        are generated first, straight from the index. The font files in the
+        remaining directories are then parsed concurrently and their fonts
+        generated a directory at a time as the parsing completes.
+        """
+        stale_dirs = []
+        for root, dirs, files in os.walk(directory):
+            dirpath = os.path.abspath(root)
+            mtime = os.path.getmtime(dirpath)
+            self._seen_dirpaths.add(dirpath)
+            entry = self._entries.get(dirpath)
+            if entry is None or entry[0] != mtime:
+                font_paths = [
+                    os.path.join(dirpath, filename) for filename in files
+                    if os.path.splitext(filename)[1].lower()
+                    in ('.otf', '.ttf')
+                ]
+                stale_dirs.append((dirpath, mtime, font_paths))
+                continue
+            for family_name, is_bold, is_italic, path in entry[1]:
+                yield (family_name, is_bold, is_italic), path
+
+        for dirpath, mtime, fonts in self._iter_scanned(stale_dirs):
+            self._entries[dirpath] = [mtime, fonts]
+            self._is_changed = True
+            for family_name, is_bold, is_italic, path in fonts:
+                yield (family_name, is_bold, is_italic), path
+
+    @contextmanager
+    def parsing(self):
+        """
+        Context manager within which the font files parsed by
+        :meth:`iter_fonts_in` share one pool of threads, started when the
+        first batch is parsed and shut down on exit, so no threads are left
+        running between scans. Font files parsed outside it are parsed one at
+        a time on the calling thread.
+        """
+        self._is_parsing = True
+        try:
+            yield self
+        finally:
+            self._is_parsing = False
+            pool, self._pool = self._pool, None
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+    def prune(self):
+        """
+        Remove the directories not seen by :meth:`iter_fonts_in` since this
+        index was loaded, such as font directories that have been deleted.
+        """
+        for dirpath in list(self._entries):
+            if dirpath not in self._seen_dirpaths:
+                del self._entries[dirpath]
+                self._is_changed = True
+
+    def save(self):
+        """
+        Write this index to its file if it has changed since it was loaded
+        or last saved. Failing to write the file is not an error; the fonts
+        are simply parsed again next time. The index is written to
+        a temporary file that then replaces the index file, which is done
+        atomically except on Windows, where the old file must be removed
+        first. The temporary file is removed if writing fails.
+        """
+        if self._path is None or not self._is_changed:
+            return
+        index = {'version': self._version, 'directories': self._entries}
+        tmp_path = '%s.%d.tmp' % (self._path, os.getpid())
+        try:
+            dirname = os.path.dirname(self._path)
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            with open(tmp_path, 'w') as f:
+                json.dump(index, f)
+            if sys.platform.startswith('win32') and os.path.exists(self._path):
+                os.remove(self._path)
+            os.rename(tmp_path, self._path)
+        except (IOError, OSError):
+            return
+        finally:
+            _remove_if_present(tmp_path)
+        self._is_changed = False
+
+    def _iter_scanned(self, stale_dirs):
+        """
+        Generate a (dirpath, mtime, fonts) 3-tuple for each of the
+        (dirpath, mtime, font_paths) 3-tuples in *stale_dirs*, where *fonts*
+        is a list of (family_name, is_bold, is_italic, path) 4-tuples. The
+        font files of each directory are parsed in batches of at most
+        :attr:`_batch_size` files, each finished before the next item is
+        generated, so no parsing happens while the caller holds this
+        generator suspended.
+        """
+        batch_size = self._batch_size
+        for dirpath, mtime, paths in stale_dirs:
+            fonts = []
+            for idx in range(0, len(paths), batch_size):
+                batch = paths[idx:idx+batch_size]
+                descriptors = self._read_descriptors(batch)
+                fonts.extend(
+                    descriptor + (path,)
+                    for descriptor, path in zip(descriptors, batch)
+                    if descriptor is not None
+                )
+            yield dirpath, mtime, fonts
+
+    @staticmethod
+    def _read_descriptor(path):
+        """
+        Return the (family_name, is_bold, is_italic) 3-tuple of the font file
+        at *path*, or |None| if it cannot be read or parsed as a font.
+        """
+        try:
+            with _Font.open(path) as f:
+                family_name, is_bold, is_italic = (
+                    f.family_name, f.is_bold, f.is_italic
+                )
+        except (IOError, OSError, KeyError, struct_error,
+                UnicodeDecodeError):
+            return None
+        if family_name is None:
+            return None
+        return family_name, is_bold, is_italic
+
+    def _read_descriptors(self, paths):
+        """
+        Return a list of the descriptors of the font files at *paths*, as
+        :meth:`_read_descriptor` returns them, in the same order. The files
+        are read on the pool of the enclosing :meth:`parsing` block, if any.
+        """
+        if not self._is_parsing:
+            return [self._read_descriptor(path) for path in paths]
+        if self._pool is None:
+            self._pool = ThreadPool(self._thread_count)
+        return self._pool.map(self._read_descriptor, paths)
+
+
 class _Font(object):
     """
     A wrapper around an OTF/TTF font file stream that knows how to parse it
@@ -115,6 +403,46 @@ class _Font(object):
     def __exit__(self, exception_type, exception_value, exception_tb):
         self._stream.close()
 
+    @property
+    def advance_widths(self):
+        """
+        A dict mapping the Unicode code point of each character this font
+        provides a glyph for to the advance width of that glyph, in font
+        design units. The 'cmap' and 'hmtx' tables are each read only once.
+        """
+        glyph_advances = self._glyph_advances
+        last_advance = glyph_advances[-1]
+        return dict(
+            (code_point, glyph_advances[glyph_id]
+                if glyph_id < len(glyph_advances) else last_advance)
+            for code_point, glyph_id
+            in self._tables['cmap'].glyph_ids.items()
+        )
+
+    @property
+    def ascender(self):
+        """
+        Distance from the baseline to the top of the tallest glyphs of this
+        font, in font design units.
+        """
+        return self._tables['hhea'].ascender
+
+    @property
+    def default_advance_width(self):
+        """
+        Advance width, in font design units, of the glyph rendered for
+        a character this font has no glyph for.
+        """
+        return self._glyph_advances[0]
+
+    @property
+    def descender(self):
+        """
+        Distance from the baseline to the bottom of the lowest descenders of
+        this font, in font design units. This value is negative.
+        """
+        return self._tables['hhea'].descender
+
     @property
     def is_bold(self):
         """
@@ -154,6 +482,14 @@ class _Font(object):
         """
         return self._tables['name'].family_name
 
+    @property
+    def units_per_em(self):
+        """
+        The number of font design units in the em square of this font, the
+        scale against which its metrics are expressed, e.g. 2048.
+        """
+        return self._tables['head'].units_per_em
+
     @lazyproperty
     def _fields(self):
         """
@@ -163,6 +499,15 @@ class _Font(object):
         # sfnt_version, tbl_count, search_range, entry_selector, range_shift
         return self._stream.read_fields('>4sHHHH', 0)
 
+    @lazyproperty
+    def _glyph_advances(self):
+        """
+        Sequence of the advance width of each glyph in this font having its
+        own horizontal metrics, indexed by glyph id.
+        """
+        hmetric_count = self._tables['hhea'].hmetric_count
+        return self._tables['hmtx'].advance_widths(hmetric_count)
+
     def _iter_table_records(self):
         """
         Generate a (tag, offset, length) 3-tuple for each of the tables in
@@ -197,42 +542,48 @@ class _Font(object):
 
 class _Stream(object):
     """
-    A thin wrapper around a file that facilitates reading C-struct values
-    from a binary file.
+    A thin wrapper around the contents of a file that facilitates reading
+    C-struct values from it. The file is memory-mapped where possible, so
+    reading is slicing the mapping rather than a seek and read per value.
     """
-    def __init__(self, file):
-        self._file = file
+    def __init__(self, bufr):
+        self._bufr = bufr
 
     @classmethod
     def open(cls, path):
         """
         Return a |_Stream| providing binary access to the contents of the
-        file at *path*.
+        file at *path*. An empty file, which cannot be mapped, is read into
+        memory instead.
         """
-        return cls(open(path, 'rb'))
+        with open(path, 'rb') as f:
+            try:
+                bufr = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError):
+                bufr = f.read()
+        return cls(bufr)
 
     def close(self):
         """
-        Close the wrapped file. Using the stream after closing raises an
+        Release the file contents. Using the stream after closing raises an
         exception.
         """
-        self._file.close()
+        if isinstance(self._bufr, mmap.mmap):
+            self._bufr.close()
+        self._bufr = None
 
     def read(self, offset, length):
         """
         Return *length* bytes from this stream starting at *offset*.
         """
-        self._file.seek(offset)
-        return self._file.read(length)
+        return self._bufr[offset:offset+length]
 
     def read_fields(self, template, offset=0):
         """
         Return a tuple containing the C-struct fields in this stream
         specified by *template* and starting at *offset*.
         """
-        self._file.seek(offset)
-        bufr = self._file.read(calcsize(template))
-        return unpack_from(template, bufr)
+        return unpack_from(template, self._bufr, offset)
 
 
 class _BaseTable(object):
@@ -246,6 +597,109 @@ class _BaseTable(object):
         self._length = length
 
 
+class _CmapTable(_BaseTable):
+    """
+    OpenType font table having the tag 'cmap' and mapping character codes to
+    the glyphs that render them. Only the Unicode subtables in formats 4 and
+    12 are read; when a font has both, the format 12 subtable is used
+    because it also covers characters outside the Basic Multilingual Plane.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_CmapTable, self).__init__(tag, stream, offset, length)
+
+    @lazyproperty
+    def glyph_ids(self):
+        """
+        A dict mapping the Unicode code point of each character in this
+        table to the id of the glyph that renders it. Characters mapped to
+        the missing glyph (glyph id 0) are omitted.
+        """
+        bufr = self._stream.read(self._offset, self._length)
+        subtable_offset = self._unicode_subtable_offset(bufr)
+        if subtable_offset is None:
+            return {}
+        format_ = unpack_from('>H', bufr, subtable_offset)[0]
+        if format_ == 12:
+            return self._read_format_12(bufr, subtable_offset)
+        return self._read_format_4(bufr, subtable_offset)
+
+    @staticmethod
+    def _read_format_4(bufr, offset):
+        """
+        Return a code point to glyph id dict read from the format 4
+        (segment mapping to delta values) subtable at *offset* in *bufr*.
+        """
+        seg_count = unpack_from('>H', bufr, offset+6)[0] // 2
+        tmpl = '>%dH' % seg_count
+        end_codes_offset = offset + 14
+        start_codes_offset = end_codes_offset + seg_count*2 + 2
+        id_deltas_offset = start_codes_offset + seg_count*2
+        id_range_offsets_offset = id_deltas_offset + seg_count*2
+
+        end_codes = unpack_from(tmpl, bufr, end_codes_offset)
+        start_codes = unpack_from(tmpl, bufr, start_codes_offset)
+        id_deltas = unpack_from(tmpl, bufr, id_deltas_offset)
+        id_range_offsets = unpack_from(tmpl, bufr, id_range_offsets_offset)
+
+        glyph_ids = {}
+        for idx in range(seg_count):
+            start, end = start_codes[idx], min(end_codes[idx], 0xFFFE)
+            id_delta, id_range_offset = id_deltas[idx], id_range_offsets[idx]
+            if start > end:
+                continue
+            if id_range_offset == 0:
+                for code_point in range(start, end+1):
+                    glyph_ids[code_point] = (code_point + id_delta) & 0xFFFF
+                continue
+            # glyph ids are in an array addressed relative to this offset
+            array_offset = id_range_offsets_offset + idx*2 + id_range_offset
+            raw_ids = unpack_from('>%dH' % (end-start+1), bufr, array_offset)
+            for code_point, raw_id in zip(range(start, end+1), raw_ids):
+                if raw_id:
+                    glyph_ids[code_point] = (raw_id + id_delta) & 0xFFFF
+        return dict(
+            (code_point, glyph_id) for code_point, glyph_id
+            in glyph_ids.items() if glyph_id
+        )
+
+    @staticmethod
+    def _read_format_12(bufr, offset):
+        """
+        Return a code point to glyph id dict read from the format 12
+        (segmented coverage) subtable at *offset* in *bufr*.
+        """
+        group_count = unpack_from('>L', bufr, offset+12)[0]
+        glyph_ids = {}
+        for idx in range(group_count):
+            start, end, start_glyph_id = unpack_from(
+                '>LLL', bufr, offset + 16 + idx*12
+            )
+            for code_point in range(start, end+1):
+                glyph_ids[code_point] = start_glyph_id + code_point - start
+        return glyph_ids
+
+    @staticmethod
+    def _unicode_subtable_offset(bufr):
+        """
+        Return the offset in *bufr* of the preferred Unicode subtable of
+        this table, or |None| if it has no Unicode subtable in a supported
+        format.
+        """
+        subtable_count = unpack_from('>H', bufr, 2)[0]
+        offsets = {}
+        for idx in range(subtable_count):
+            platform_id, encoding_id, offset = unpack_from(
+                '>HHL', bufr, 4 + idx*8
+            )
+            # Unicode platform, any encoding, or Windows Unicode BMP/full
+            if platform_id != 0 and (platform_id, encoding_id) not in (
+                    (3, 1), (3, 10)):
+                continue
+            format_ = unpack_from('>H', bufr, offset)[0]
+            offsets.setdefault(format_, offset)
+        return offsets.get(12, offsets.get(4))
+
+
 class _HeadTable(_BaseTable):
     """
     OpenType font table having the tag 'head' and containing certain header
@@ -268,6 +722,14 @@ class _HeadTable(_BaseTable):
         """
         return bool(self._macStyle & 2)
 
+    @property
+    def units_per_em(self):
+        """
+        The unsigned short value of the 'unitsPerEm' field in this head
+        table.
+        """
+        return self._fields[5]
+
     @lazyproperty
     def _fields(self):
         """
@@ -283,6 +745,65 @@ class _HeadTable(_BaseTable):
         return self._fields[12]
 
 
+class _HheaTable(_BaseTable):
+    """
+    OpenType font table having the tag 'hhea' and containing the
+    information needed to lay out the font horizontally.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_HheaTable, self).__init__(tag, stream, offset, length)
+
+    @property
+    def ascender(self):
+        """
+        The signed short value of the 'ascender' field in this hhea table.
+        """
+        return self._fields[1]
+
+    @property
+    def descender(self):
+        """
+        The signed short value of the 'descender' field in this hhea table.
+        """
+        return self._fields[2]
+
+    @property
+    def hmetric_count(self):
+        """
+        The number of glyphs having their own entry in the 'hmtx' table,
+        the value of the 'numberOfHMetrics' field.
+        """
+        return self._fields[16]
+
+    @lazyproperty
+    def _fields(self):
+        """
+        A 17-tuple containing the fields in this table.
+        """
+        return self._stream.read_fields('>4shhhHhhhhhhhhhhhH', self._offset)
+
+
+class _HmtxTable(_BaseTable):
+    """
+    OpenType font table having the tag 'hmtx' and containing the horizontal
+    metrics of each glyph in the font.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_HmtxTable, self).__init__(tag, stream, offset, length)
+
+    def advance_widths(self, hmetric_count):
+        """
+        Return a tuple containing the advance width of each of the first
+        *hmetric_count* glyphs, indexed by glyph id. The glyphs following
+        them share the advance width of the last one.
+        """
+        # each metric is an (advanceWidth, leftSideBearing) pair
+        fields = self._stream.read_fields(
+            '>%dH' % (hmetric_count*2), self._offset
+        )
+        return fields[::2]
+
+
 class _NameTable(_BaseTable):
     """
     An OpenType font table having the tag 'name' and containing the
@@ -415,7 +936,22 @@ def _TableFactory(tag, stream, offset, length):
     *font_file* with content of *length* starting at *offset*.
     """
     TableClass = {
+        'cmap': _CmapTable,
         'head': _HeadTable,
+        'hhea': _HheaTable,
+        'hmtx': _HmtxTable,
         'name': _NameTable,
     }.get(tag, _BaseTable)
     return TableClass(tag, stream, offset, length)
+
+
+def _remove_if_present(path):
+    """
+    Delete the file at *path* if there is one, ignoring any failure to do
+    so.
+    """
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
@@ -6,16 +6,19 @@ Objects related to layout of rendered text, such as TextFitter.
 
 from __future__ import absolute_import, print_function
 
-from PIL import ImageFont
+from bisect import bisect_right
+
+from ..util import lazyproperty, LruCache
+from .fonts import _Font
 
 
 class TextFitter(tuple):
     """
     Value object that knows how to fit text into given rectangular extents.
     """
-    def __new__(cls, line_source, extents, font_file):
+    def __new__(cls, text, extents, font_metrics):
         width, height = extents
-        return tuple.__new__(cls, (line_source, width, height, font_file))
+        return tuple.__new__(cls, (text, width, height, font_metrics))
 
     @classmethod
     def best_fit_font_size(cls, text, extents, max_size, font_file):
@@ -24,10 +27,35 @@ class TextFitter(tuple):
         *max_size* that allows *text* to fit completely within *extents* when
         rendered using font defined in *font_file*.
         """
-        line_source = _LineSource(text)
-        text_fitter = cls(line_source, extents, font_file)
+        font_metrics = _FontMetrics.from_font_file(font_file)
+        text_fitter = cls(text, extents, font_metrics)
         return text_fitter._best_fit_font_size(max_size)
 
+    @classmethod
+    def best_fit_font_sizes(cls, texts, extents, max_size, font_file):
+        """
+        Return a list containing the best-fit font size of each text in
+        *texts*, in the same order, where each is fitted within *extents* as
+        :meth:`best_fit_font_size` does. The font file is measured once and
+        the candidate sizes are arranged for searching once for all the
+        texts. Texts having the same words are fitted only once.
+        """
+        font_metrics = _FontMetrics.from_font_file(font_file)
+        sizes = _BinarySearchTree.from_ordered_sequence(
+            range(1, int(max_size)+1)
+        )
+        best_fit_sizes = {}
+        font_sizes = []
+        for text in texts:
+            words = ' '.join(text.split())
+            if words not in best_fit_sizes:
+                text_fitter = cls(words, extents, font_metrics)
+                best_fit_sizes[words] = sizes.find_max(
+                    text_fitter._fits_inside_predicate
+                )
+            font_sizes.append(best_fit_sizes[words])
+        return font_sizes
+
     def _best_fit_font_size(self, max_size):
         """
         Return the largest whole-number point size less than or equal to
@@ -39,32 +67,6 @@ class TextFitter(tuple):
         )
         return sizes.find_max(predicate)
 
-    def _break_line(self, line_source, point_size):
-        """
-        Return a (line, remainder) pair where *line* is the longest line in
-        *line_source* that will fit in this fitter's width and *remainder* is
-        a |_LineSource| object containing the text following the break point.
-        """
-        lines = _BinarySearchTree.from_ordered_sequence(line_source)
-        predicate = self._fits_in_width_predicate(point_size)
-        return lines.find_max(predicate)
-
-    def _fits_in_width_predicate(self, point_size):
-        """
-        Return a function taking a text string value and returns |True| if
-        that text fits in this fitter when rendered at *point_size*. Used as
-        predicate for _break_line()
-        """
-        def predicate(line):
-            """
-            Return |True| if *line* fits in this fitter when rendered at
-            *point_size*.
-            """
-            cx = _rendered_size(line.text, point_size, self._font_file)[0]
-            return cx <= self._width
-
-        return predicate
-
     @property
     def _fits_inside_predicate(self):
         """
@@ -74,43 +76,74 @@ class TextFitter(tuple):
         """
         def predicate(point_size):
             """
-            Return |True| if the text in *line_source* can be wrapped to fit
-            entirely within *extents* when rendered at *point_size* using the
-            font defined in *font_file*.
+            Return |True| if the text in this fitter can be wrapped to fit
+            entirely within its extents when rendered at *point_size*.
+            Nothing fits in extents having no width or height.
             """
-            text_lines = self._wrap_lines(self._line_source, point_size)
-            cy = _rendered_size('Ty', point_size, self._font_file)[1]
-            return (cy * len(text_lines)) <= self._height
+            if self._width <= 0 or self._height <= 0:
+                return False
+            line_count = self._line_count(point_size)
+            if line_count is None:
+                return False
+            line_height = self._font_metrics.line_height(point_size)
+            return (line_height * line_count) <= self._height
 
         return predicate
 
     @property
-    def _font_file(self):
+    def _font_metrics(self):
         return self[3]
 
     @property
     def _height(self):
         return self[2]
 
+    def _line_count(self, point_size):
+        """
+        Return the number of lines the text in this fitter wraps to when
+        rendered at *point_size*, or |None| if a word is too wide to fit on
+        a line by itself. Lines are broken greedily at word boundaries. The
+        end of each line is found by bisecting the running total of word
+        widths, so no candidate line is measured.
+        """
+        word_ends = self._word_ends
+        space_width = self._font_metrics.space_width
+        max_line_width = self._font_metrics.to_units(self._width, point_size)
+        line_count, idx, word_count = 0, 0, len(word_ends) - 1
+        while idx < word_count:
+            # a line ends with a word, not the space following it
+            end_idx = bisect_right(
+                word_ends, word_ends[idx] + max_line_width + space_width
+            ) - 1
+            if end_idx <= idx:
+                return None
+            line_count += 1
+            idx = end_idx
+        return line_count
+
     @property
-    def _line_source(self):
+    def _text(self):
         return self[0]
 
     @property
     def _width(self):
         return self[1]
 
-    def _wrap_lines(self, line_source, point_size):
+    @lazyproperty
+    def _word_ends(self):
         """
-        Return a sequence of str values representing the text in
-        *line_source* wrapped within this fitter when rendered at
-        *point_size*.
+        Sequence of the width, in font units, of the text from the start up
+        to and including the space following each word. The sequence begins
+        with zero, so the width of the line running from word *i* through
+        word *j* is ``word_ends[j+1] - word_ends[i] - space_width``.
         """
-        text, remainder = self._break_line(line_source, point_size)
-        lines = [text]
-        if remainder:
-            lines.extend(self._wrap_lines(remainder, point_size))
-        return lines
+        font_metrics = self._font_metrics
+        space_width = font_metrics.space_width
+        word_ends, end = [0], 0
+        for word in self._text.split():
+            end += font_metrics.text_width(word) + space_width
+            word_ends.append(end)
+        return word_ends
 
 
 class _BinarySearchTree(object):
@@ -208,109 +241,89 @@ class _BinarySearchTree(object):
         self._insert_from_ordered_sequence(lesser)
 
 
-class _LineSource(object):
+class _FontMetrics(object):
     """
-    Generates all the possible even-word line breaks in a string of text,
-    each in the form of a (line, remainder) 2-tuple where *line* contains the
-    text before the break and *remainder* the text after as a |_LineSource|
-    object. Its boolean value is |True| when it contains text, |False| when
-    its text is the empty string or whitespace only.
+    The metrics of a font needed to measure rendered text, read from its font
+    file only once. The rendered width of a string is the sum of the advance
+    widths of its characters, in font design units, scaled by point size.
+    Kerning is not applied. The metrics of the most recently used font files
+    are cached in :attr:`_font_metrics`, whose capacity can be changed.
     """
-    def __init__(self, text):
-        self._text = text
+    _emu_per_pt = 12700
 
-    def __bool__(self):
-        """
-        Gives this object boolean behaviors (in Python 3). bool(line_source)
-        is False if it contains the empty string or whitespace only.
-        """
-        return self._text.strip() != ''
+    _font_metrics = LruCache(16)
+    _text_width_capacity = 4096
 
-    def __eq__(self, other):
-        return self._text == other._text
+    def __init__(self, advance_widths, default_advance_width, text_height,
+                 units_per_em):
+        super(_FontMetrics, self).__init__()
+        self._advance_widths = advance_widths
+        self._default_advance_width = default_advance_width
+        self._text_height = text_height
+        self._units_per_em = units_per_em
+        self._text_widths = LruCache(self._text_width_capacity)
 
-    def __iter__(self):
+    @classmethod
+    def from_font_file(cls, font_file):
         """
-        Generate a (text, remainder) pair for each possible even-word line
-        break in this line source, where *text* is a str value and remainder
-        is a |_LineSource| value.
+        Return the |_FontMetrics| object for the font defined in *font_file*.
+        A font file is parsed again only if its metrics have been discarded
+        from the cache to make room for those of other font files.
         """
-        words = self._text.split()
-        for idx in range(1, len(words)+1):
-            line_text = ' '.join(words[:idx])
-            remainder_text = ' '.join(words[idx:])
-            remainder = _LineSource(remainder_text)
-            yield _Line(line_text, remainder)
+        return cls._font_metrics.get_or_add(font_file, cls._load)
 
-    def __nonzero__(self):
+    def line_height(self, point_size):
         """
-        Gives this object boolean behaviors (in Python 2). bool(line_source)
-        is False if it contains the empty string or whitespace only.
+        The height in EMU of a line of text rendered at *point_size*.
         """
-        return self._text.strip() != ''
-
-    def __repr__(self):
-        return "<_LineSource('%s')>" % self._text
-
-
-class _Line(tuple):
-    """
-    A candidate line broken at an even word boundary from a string of text,
-    and a |_LineSource| value containing the text that remains after the line
-    is broken at this spot.
-    """
-    def __new__(cls, text, remainder):
-        return tuple.__new__(cls, (text, remainder))
-
-    def __gt__(self, other):
-        return len(self.text) > len(other.text)
-
-    def __lt__(self, other):
-        return not self.__gt__(other)
-
-    def __len__(self):
-        return len(self.text)
-
-    def __repr__(self):
-        return "'%s' => '%s'" % (self.text, self.remainder)
+        return int(self._to_emu(self._text_height, point_size))
 
     @property
-    def remainder(self):
-        return self[1]
-
-    @property
-    def text(self):
-        return self[0]
+    def space_width(self):
+        """
+        The advance width of the space character, in font design units.
+        """
+        return self.text_width(' ')
 
+    def text_width(self, text):
+        """
+        The rendered width of *text*, in font design units. Recently used
+        widths are remembered, so a word is generally measured only once
+        however many texts it appears in.
+        """
+        return self._text_widths.get_or_add(text, self._measure)
 
-class _Fonts(object):
-    """
-    A memoizing cache for ImageFont objects.
-    """
-    fonts = {}
+    def to_units(self, emu, point_size):
+        """
+        The length in font design units of *emu* at *point_size*.
+        """
+        return emu * self._units_per_em / float(point_size * self._emu_per_pt)
 
     @classmethod
-    def font(cls, font_path, point_size):
-        if (font_path, point_size) not in cls.fonts:
-            cls.fonts[(font_path, point_size)] = ImageFont.truetype(
-                font_path, point_size
+    def _load(cls, font_file):
+        """
+        Return a new |_FontMetrics| object loaded from *font_file*.
+        """
+        with _Font.open(font_file) as font:
+            return cls(
+                font.advance_widths, font.default_advance_width,
+                font.ascender - font.descender, font.units_per_em
             )
-        return cls.fonts[(font_path, point_size)]
-
-
-def _rendered_size(text, point_size, font_file):
-    """
-    Return a (width, height) pair representing the size of *text* in English
-    Metric Units (EMU) when rendered at *point_size* in the font defined in
-    *font_file*.
-    """
-    emu_per_inch = 914400
-    px_per_inch = 72.0
 
-    font = _Fonts.font(font_file, point_size)
-    px_width, px_height = font.getsize(text)
-
-    emu_width = int(px_width / px_per_inch * emu_per_inch)
-    emu_height = int(px_height / px_per_inch * emu_per_inch)
+    def _measure(self, text):
+        """
+        The sum of the advance widths of the characters in *text*.
+        """
+        advance_widths = self._advance_widths
+        default_advance_width = self._default_advance_width
+        return sum(
+            advance_widths.get(ord(c), default_advance_width) for c in text
+        )
 
-    return emu_width, emu_height
+    def _to_emu(self, units, point_size):
+        """
+        The length in EMU of *units* font design units at *point_size*.
+        """
+        return units * point_size * self._emu_per_pt / float(
+            self._units_per_em
+        )
@@ -6,7 +6,7 @@ Text-related objects such as TextFrame and Paragraph.
 
 from __future__ import absolute_import, print_function
 
-from ..compat import to_unicode
+from ..compat import is_string, to_unicode
 from ..dml.fill import FillFormat
 from ..enum.dml import MSO_FILL
 from ..enum.text import MSO_AUTO_SIZE, MSO_UNDERLINE
@@ -14,8 +14,42 @@ from .fonts import FontFiles
 from .layout import TextFitter
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..oxml.simpletypes import ST_TextWrappingType
+from ..oxml.text import CT_TextCharacterProperties, CT_TextParagraph
 from ..shapes import Subshape
-from ..util import Centipoints, Emu, lazyproperty, Pt
+from ..util import Centipoints, Emu, lazyproperty, ProxyCache, Pt
+
+
+def fit_text_frames(text_frames, font_family='Calibri', max_size=18,
+                    bold=False, italic=False, font_file=None):
+    """
+    Make the text in each of *text_frames* fit entirely within the bounds of
+    its shape, as :meth:`TextFrame.fit_text` does, and return a list
+    containing the font size applied to each text frame, in the same order.
+    The font file is located and measured only once, and text frames having
+    the same extents are fitted together, so the measured width of each word
+    and the fit of text repeated across frames are reused. The parameters
+    have the same meaning as those of :meth:`TextFrame.fit_text`.
+    """
+    text_frames = list(text_frames)
+    if font_file is None:
+        font_file = FontFiles.find(font_family, bold, italic)
+
+    frame_idxs_by_extents = {}
+    for idx, text_frame in enumerate(text_frames):
+        frame_idxs_by_extents.setdefault(text_frame._extents, []).append(idx)
+
+    font_sizes = [None] * len(text_frames)
+    for extents, frame_idxs in frame_idxs_by_extents.items():
+        texts = [text_frames[idx].text for idx in frame_idxs]
+        best_fit_sizes = TextFitter.best_fit_font_sizes(
+            texts, extents, max_size, font_file
+        )
+        for idx, font_size in zip(frame_idxs, best_fit_sizes):
+            font_sizes[idx] = font_size
+
+    for text_frame, font_size in zip(text_frames, font_sizes):
+        text_frame._apply_fit(font_family, font_size, bold, italic)
+    return font_sizes
 
 
 class TextFrame(Subshape):
@@ -24,9 +58,12 @@ class TextFrame(Subshape):
     frame. Corresponds to the ``<p:txBody>`` element that can appear as a
     child element of ``<p:sp>``. Not intended to be constructed directly.
     """
+    __slots__ = ('_element', '_txBody', '_proxies')
+
     def __init__(self, txBody, parent):
         super(TextFrame, self).__init__(parent)
         self._element = self._txBody = txBody
+        self._proxies = ProxyCache()
 
     def add_paragraph(self):
         """
@@ -34,7 +71,7 @@ class TextFrame(Subshape):
         paragraphs contained in this text frame.
         """
         p = self._txBody.add_p()
-        return _Paragraph(p, self)
+        return self._paragraph_proxy(p)
 
     @property
     def auto_size(self):
@@ -72,7 +109,8 @@ class TextFrame(Subshape):
         metrics. If *font_file* is |None|, best efforts are made to locate
         a font file with mathching *font_family*, *bold*, and *italic*
         installed on the current system (usually succeeds if the font is
-        installed).
+        installed). Use :func:`fit_text_frames` to fit many text frames at
+        once.
         """
         font_size = self._best_fit_font_size(
             font_family, max_size, bold, italic, font_file
@@ -132,7 +170,38 @@ class TextFrame(Subshape):
         paragraphs in this text frame. A text frame always contains at least
         one paragraph.
         """
-        return tuple([_Paragraph(p, self) for p in self._txBody.p_lst])
+        return tuple(
+            [self._paragraph_proxy(p) for p in self._txBody.p_lst]
+        )
+
+    def set_paragraphs(self, paragraphs):
+        """
+        Replace all the text in this text frame with *paragraphs*. Each
+        item in *paragraphs* describes one paragraph and is either a string
+        or a dict. A string becomes a paragraph containing that text. A dict
+        has either a ``'text'`` item or a ``'runs'`` item containing
+        a sequence of runs, and optionally a ``'level'`` item giving the
+        indentation level of the paragraph (0-8). Each run is either
+        a string or a dict having a ``'text'`` item. The font properties
+        ``'bold'``, ``'italic'``, ``'underline'``, ``'size'``, ``'name'``,
+        and ``'color'`` can appear in a run dict, or in a paragraph dict to
+        apply to each of its runs, and take the same values as the |Font|
+        property of that name, except that *color* is an |RGBColor| value.
+        Line feed characters in text become line breaks. For example::
+
+            text_frame.set_paragraphs([
+                {'text': 'Results', 'bold': True, 'size': Pt(24)},
+                'Revenue grew in every region',
+                {'runs': ['Margin: ', {'text': '31%', 'bold': True}],
+                 'level': 1},
+            ])
+
+        Raises |ValueError| on an unsupported item in a paragraph or run
+        dict.
+        """
+        self._txBody.replace_paragraphs(
+            u''.join(self._p_xml(paragraph) for paragraph in paragraphs)
+        )
 
     @property
     def text(self):
@@ -237,6 +306,73 @@ class TextFrame(Subshape):
             self._parent.height - self.margin_top - self.margin_bottom
         )
 
+    def _new_paragraph(self, p):
+        """
+        Return a new |_Paragraph| object proxying *p*.
+        """
+        return _Paragraph(p, self)
+
+    @classmethod
+    def _p_xml(cls, paragraph):
+        """
+        Return the ``<a:p>`` XML for *paragraph*, an item in the sequence
+        passed to :meth:`set_paragraphs`.
+        """
+        if is_string(paragraph):
+            return CT_TextParagraph.p_xml(((paragraph, u''),))
+        font = dict(paragraph)
+        level = font.pop('level', 0)
+        if 'runs' in font and 'text' in font:
+            raise ValueError("paragraph can have 'text' or 'runs', not both")
+        runs = font.pop('runs', None)
+        if runs is None:
+            runs = (font.pop('text', u''),)
+        rPr_xml = cls._rPr_xml(font)
+        run_xmls = []
+        for run in runs:
+            if is_string(run):
+                run_xmls.append((run, rPr_xml))
+                continue
+            run_font = dict(font)
+            run_font.update(run)
+            text = run_font.pop('text', u'')
+            run_xmls.append((text, cls._rPr_xml(run_font)))
+        return CT_TextParagraph.p_xml(run_xmls, level)
+
+    def _paragraph_proxy(self, p):
+        """
+        Return the |_Paragraph| object for *p*, the same object each time
+        *p* is accessed through this text frame.
+        """
+        return self._proxies.get_or_add(p, self._new_paragraph)
+
+    @staticmethod
+    def _rPr_xml(font):
+        """
+        Return the ``<a:rPr>`` XML for *font*, a dict of |Font| property
+        values keyed by property name, as described in
+        :meth:`set_paragraphs`.
+        """
+        unsupported = sorted(
+            set(font) -
+            set(('bold', 'color', 'italic', 'name', 'size', 'underline'))
+        )
+        if unsupported:
+            raise ValueError("unsupported font property '%s'" % unsupported[0])
+        size, underline, color = (
+            font.get('size'), font.get('underline'), font.get('color')
+        )
+        if underline is True:
+            underline = MSO_UNDERLINE.SINGLE_LINE
+        elif underline is False:
+            underline = MSO_UNDERLINE.NONE
+        return CT_TextCharacterProperties.rPr_xml(
+            sz=None if size is None else Emu(size).centipoints,
+            b=font.get('bold'), i=font.get('italic'), u=underline,
+            typeface=font.get('name'),
+            srgbClr=None if color is None else str(color)
+        )
+
     def _set_font(self, family, size, bold, italic):
         """
         Set the font properties of all the text in this text frame to
@@ -265,6 +401,8 @@ class Font(object):
     appears as ``<a:defRPr>`` and ``<a:endParaRPr>`` in paragraph and
     ``<a:defRPr>`` in list style elements.
     """
+    __slots__ = ('_element', '_rPr', '_color', '_fill')
+
     def __init__(self, rPr):
         super(Font, self).__init__()
         self._element = self._rPr = rPr
@@ -400,6 +538,8 @@ class _Hyperlink(Subshape):
     Text run hyperlink object. Corresponds to ``<a:hlinkClick>`` child
     element of the run's properties element (``<a:rPr>``).
     """
+    __slots__ = ('_rPr',)
+
     def __init__(self, rPr, parent):
         super(_Hyperlink, self).__init__(parent)
         self._rPr = rPr
@@ -440,6 +580,8 @@ class _Paragraph(Subshape):
     """
     Paragraph object. Not intended to be constructed directly.
     """
+    __slots__ = ('_element', '_p')
+
     def __init__(self, p, parent):
         super(_Paragraph, self).__init__(parent)
         self._element = self._p = p
@@ -613,6 +755,8 @@ class _Run(Subshape):
     """
     Text run object. Corresponds to ``<a:r>`` child element in a paragraph.
     """
+    __slots__ = ('_r', '_hyperlink')
+
     def __init__(self, r, parent):
         super(_Run, self).__init__(parent)
         self._r = r
@@ -9,6 +9,8 @@ from __future__ import absolute_import, division, print_function
 
 import platform
 
+from collections import OrderedDict
+from threading import RLock
 from warnings import warn
 
 
@@ -159,6 +161,193 @@ class Px(Length):
         return Length.__new__(cls, emu)
 
 
+class LruCache(object):
+    """
+    Cache holding at most *capacity* values, discarding the least recently
+    used value to make room for a new one. Access is serialized by a lock so
+    a cache can be shared between threads, and the number of lookups that
+    hit and missed is counted to help in choosing a capacity.
+    """
+    def __init__(self, capacity):
+        super(LruCache, self).__init__()
+        self._capacity = capacity
+        self._values = OrderedDict()
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def capacity(self):
+        """
+        Read/write integer maximum number of values held in this cache.
+        Reducing the capacity discards the least recently used values that
+        no longer fit.
+        """
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value):
+        with self._lock:
+            self._capacity = value
+            self._discard_overflow()
+
+    def clear(self):
+        """
+        Discard all cached values and reset the hit and miss counts.
+        """
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = 0
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for *key*, or *default* if it is not cached.
+        A value found becomes the most recently used.
+        """
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+            except KeyError:
+                self._misses += 1
+                return default
+            self._values[key] = value
+            self._hits += 1
+            return value
+
+    def get_or_add(self, key, factory):
+        """
+        Return the value cached for *key*, calling *factory* with *key* to
+        compute and cache it if not already present. The lock is held while
+        *factory* runs, so concurrent requests for the same missing key
+        compute its value only once.
+        """
+        with self._lock:
+            sentinel = self._values
+            value = self.get(key, sentinel)
+            if value is sentinel:
+                value = factory(key)
+                self._add(key, value)
+            return value
+
+    @property
+    def hits(self):
+        """
+        The number of lookups that found their key in this cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        The number of lookups that did not find their key in this cache.
+        """
+        return self._misses
+
+    def setdefault(self, key, value):
+        """
+        Cache *value* for *key* unless a value is already cached for it, and
+        return the cached value. Unlike :meth:`get`, this does not count as
+        a hit or a miss.
+        """
+        with self._lock:
+            if key in self._values:
+                value = self._values.pop(key)
+            self._add(key, value)
+            return value
+
+    def _add(self, key, value):
+        """
+        Cache *value* as the most recently used value, discarding the least
+        recently used value if this cache is full.
+        """
+        self._values[key] = value
+        self._discard_overflow()
+
+    def _discard_overflow(self):
+        """
+        Discard least recently used values until no more than capacity
+        remain.
+        """
+        while len(self._values) > self._capacity:
+            self._values.popitem(last=False)
+
+
+class ProxyCache(object):
+    """
+    Identity map from an lxml element to the proxy object constructed for
+    it, such that repeated access to the same element produces the same
+    proxy, along with any lazy state it has accumulated. Each proxy refers
+    to its element, so an entry can't be reclaimed by the garbage collector
+    while the cache holds it. Instead, entries for elements that have been
+    removed from their document are pruned, whenever the cache has doubled
+    in size since it was last pruned and when :meth:`prune` is called.
+    """
+    __slots__ = ('_proxies', '_prune_size')
+
+    _MIN_PRUNE_SIZE = 64
+
+    def __init__(self):
+        super(ProxyCache, self).__init__()
+        self._proxies = {}
+        self._prune_size = self._MIN_PRUNE_SIZE
+
+    def __len__(self):
+        """
+        The number of proxies cached for elements still in their document.
+        """
+        self.prune()
+        return len(self._proxies)
+
+    def clear(self):
+        """
+        Discard all cached proxies, such as when the element tree they proxy
+        is replaced.
+        """
+        self._proxies.clear()
+        self._prune_size = self._MIN_PRUNE_SIZE
+
+    def get_or_add(self, element, factory):
+        """
+        Return the proxy cached for *element*, calling *factory* with
+        *element* to construct and cache it if not already present.
+        """
+        proxies = self._proxies
+        try:
+            return proxies[element]
+        except KeyError:
+            if len(proxies) >= self._prune_size:
+                self.prune()
+            proxy = proxies[element] = factory(element)
+            return proxy
+
+    def prune(self):
+        """
+        Discard the proxies for elements no longer in their document, such
+        as a shape or row that has been removed.
+        """
+        proxies = self._proxies
+        for element in [e for e in proxies if self._is_detached(e)]:
+            del proxies[element]
+        self._prune_size = max(2 * len(proxies), self._MIN_PRUNE_SIZE)
+
+    @staticmethod
+    def _is_detached(element):
+        """
+        True if *element* has been removed from the document it belongs to,
+        either directly or along with one of its ancestors. A removed
+        subtree still refers to its original document, whose root element
+        is therefore not the top of its ancestor chain.
+        """
+        top = element
+        parent = top.getparent()
+        while parent is not None:
+            top, parent = parent, parent.getparent()
+        return top is not top.getroottree().getroot()
+
+
 def lazyproperty(f):
     """
     @lazyprop decorator. Decorated method will be called only on first access
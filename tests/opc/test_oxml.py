@@ -8,6 +8,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from lxml import etree
+
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.oxml import (
     CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types,
@@ -150,6 +152,56 @@ class DescribeSerializePartXml(object):
         # len of 134 if it's unicode and 137 if it's bytes
         assert len(xml) == 137
 
+    def it_can_minify_the_xml_it_produces(self):
+        part_elm = etree.fromstring(
+            '<f:foo xmlns:f="http://foo" xmlns:b="http://bar">\n  <f:bar xm'
+            'lns:f="http://foo" xmlns:x="http://x">\n    <f:baz> </f:baz>\n'
+            '  </f:bar>\n</f:foo>'
+        )
+        xml = serialize_part_xml(part_elm, minify=True)
+        assert xml == (
+            b'<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>'
+            b'\n<f:foo xmlns:f="http://foo" xmlns:b="http://bar"><f:bar><f:'
+            b'baz> </f:baz></f:bar></f:foo>'
+        )
+
+    def it_keeps_namespaces_named_by_markup_compatibility_attributes(self):
+        part_elm = etree.fromstring(
+            '<f:foo xmlns:f="http://foo" xmlns:mc="http://schemas.openxmlfo'
+            'rmats.org/markup-compatibility/2006"><mc:AlternateContent><mc:'
+            'Choice xmlns:p14="http://p14" Requires="p14"><f:bar/></mc:Choic'
+            'e></mc:AlternateContent><f:baz xmlns:x="http://x" xmlns:y="http'
+            '://y" mc:Ignorable="x"/></f:foo>'
+        )
+        xml = serialize_part_xml(part_elm, minify=True)
+        assert xml.endswith(
+            b'<mc:AlternateContent><mc:Choice xmlns:p14="http://p14" Requir'
+            b'es="p14"><f:bar/></mc:Choice></mc:AlternateContent><f:baz xml'
+            b'ns:x="http://x" mc:Ignorable="x"/></f:foo>'
+        )
+
+    def it_keeps_whitespace_where_xml_space_is_preserve(self):
+        part_elm = etree.fromstring(
+            '<f:foo xmlns:f="http://foo">\n  <f:bar xml:space="preserve">'
+            '<f:a>x</f:a> <f:a>y</f:a>\n  <f:baz xml:space="default"> <f:a/'
+            '> </f:baz></f:bar>\n</f:foo>'
+        )
+        xml = serialize_part_xml(part_elm, minify=True)
+        assert xml.endswith(
+            b'<f:foo xmlns:f="http://foo"><f:bar xml:space="preserve"><f:a>'
+            b'x</f:a> <f:a>y</f:a>\n  <f:baz xml:space="default"><f:a/></f:'
+            b'baz></f:bar></f:foo>'
+        )
+
+    def it_does_not_change_the_element_it_minifies(self):
+        part_elm = etree.fromstring(
+            '<f:foo xmlns:f="http://foo">\n  <f:bar xmlns:x="http://x"/>\n'
+            '</f:foo>'
+        )
+        before = etree.tostring(part_elm)
+        serialize_part_xml(part_elm, minify=True)
+        assert etree.tostring(part_elm) == before
+
     # fixtures -----------------------------------
 
     @pytest.fixture
@@ -163,8 +215,8 @@ class DescribeSerializePartXml(object):
     def expected_part_xml(self):
         unicode_xml = (
             '<?xml version=\'1.0\' encoding=\'UTF-8\' standalone=\'yes\'?>\n'
-            '<f:foo xmlns:f="http://foo" xmlns:b="http://bar"><f:bar>fØØbÅr<'
-            '/f:bar></f:foo>'
+            '<f:foo xmlns:f="http://foo" xmlns:b="http://bar">'
+            '<f:bar>fØØbÅr</f:bar></f:foo>'
         )
         xml_bytes = unicode_xml.encode('utf-8')
         return xml_bytes
@@ -102,7 +102,7 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, False
         )
 
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
@@ -323,8 +323,23 @@ class DescribePart(object):
         part.blob = new_blob
         assert part.blob == new_blob
 
+    def it_can_minify_its_blob(self, minified_blob_fixture):
+        part, expected_blob = minified_blob_fixture
+        assert part.minified_blob == expected_blob
+
     # fixtures ---------------------------------------------
 
+    @pytest.fixture(params=[
+        ('image/svg+xml',
+         b'<text><tspan>Hello</tspan> <tspan>world</tspan></text>'),
+        ('application/xml', b'<foo>\n  <bar> </bar>\n</foo>'),
+        ('image/png', b'<foo>\n  <bar/>\n</foo>'),
+    ])
+    def minified_blob_fixture(self, request):
+        content_type, blob = request.param
+        part = Part(None, content_type, blob, None)
+        return part, blob
+
     @pytest.fixture
     def blob_fixture(self, blob_):
         part = Part(None, None, blob_, None)
@@ -566,6 +581,12 @@ class DescribeXmlPart(object):
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def it_can_serialize_to_minified_xml(self, blob_fixture):
+        xml_part, element_, serialize_part_xml_ = blob_fixture
+        blob = xml_part.minified_blob
+        serialize_part_xml_.assert_called_once_with(element_, minify=True)
+        assert blob is serialize_part_xml_.return_value
+
     def it_knows_its_the_part_for_its_child_objects(self, part_fixture):
         xml_part = part_fixture
         assert xml_part.part is xml_part
@@ -748,6 +769,14 @@ class DescribeRelationshipCollection(object):
         with pytest.raises(KeyError):
             rels['barfoo']
 
+    def it_forgets_the_target_part_of_a_deleted_rel(self):
+        rels = RelationshipCollection(None)
+        part = Mock(name='part')
+        rels.add_relationship('reltype', part, 'rId1')
+        del rels['rId1']
+        assert 'rId1' not in rels
+        assert rels.related_parts == {}
+
     def it_can_add_a_relationship(self, _Relationship_):
         baseURI, rId, reltype, target, external = (
             'baseURI', 'rId9', 'reltype', 'target', False
@@ -59,19 +59,19 @@ class DescribePackageReader(object):
         )
 
     @pytest.fixture
-    def _srels_for(self, request):
-        return method_mock(request, PackageReader, '_srels_for')
+    def srels_for(self, request):
+        return method_mock(request, PackageReader, 'srels_for')
 
     @pytest.fixture
     def _walk_phys_parts(self, request):
         return method_mock(request, PackageReader, '_walk_phys_parts')
 
     def it_can_construct_from_pkg_file(self, init, PhysPkgReader_, from_xml,
-                                       _srels_for, _load_serialized_parts):
+                                       srels_for, _load_serialized_parts):
         # mockery ----------------------
         phys_reader = PhysPkgReader_.return_value
         content_types = from_xml.return_value
-        pkg_srels = _srels_for.return_value
+        pkg_srels = srels_for.return_value
         sparts = _load_serialized_parts.return_value
         pkg_file = Mock(name='pkg_file')
         # exercise ---------------------
@@ -79,7 +79,7 @@ class DescribePackageReader(object):
         # verify -----------------------
         PhysPkgReader_.assert_called_once_with(pkg_file)
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
-        _srels_for.assert_called_once_with(phys_reader, '/')
+        srels_for.assert_called_once_with(phys_reader, '/')
         _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels,
                                                        content_types)
         phys_reader.close.assert_called_once_with()
@@ -148,7 +148,7 @@ class DescribePackageReader(object):
         assert _SerializedPart_.call_args_list == expected_calls
         assert retval == expected_sparts
 
-    def it_can_walk_phys_pkg_parts(self, _srels_for):
+    def it_can_walk_phys_pkg_parts(self, srels_for):
         # test data --------------------
         # +----------+       +--------+
         # | pkg_rels |-----> | part_1 |
@@ -177,7 +177,7 @@ class DescribePackageReader(object):
         part_3_srels = []
         # mockery ----------------------
         phys_reader = Mock(name='phys_reader')
-        _srels_for.side_effect = [part_1_srels, part_2_srels, part_3_srels]
+        srels_for.side_effect = [part_1_srels, part_2_srels, part_3_srels]
         phys_reader.blob_for.side_effect = [
             part_1_blob, part_2_blob, part_3_blob
         ]
@@ -201,7 +201,7 @@ class DescribePackageReader(object):
         load_from_xml = _SerializedRelationshipCollection_.load_from_xml
         srels = load_from_xml.return_value
         # exercise ---------------------
-        retval = PackageReader._srels_for(phys_reader, source_uri)
+        retval = PackageReader.srels_for(phys_reader, source_uri)
         # verify -----------------------
         phys_reader.rels_xml_for.assert_called_once_with(source_uri)
         load_from_xml.assert_called_once_with(source_uri.baseURI, rels_xml)
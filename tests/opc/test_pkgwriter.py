@@ -31,7 +31,7 @@ class DescribePackageWriter(object):
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, False),
         ]
         PhysPkgWriter_.assert_called_once_with(pkg_file)
         assert _write_methods.mock_calls == expected_calls
@@ -78,6 +78,17 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_can_write_minified_parts(self):
+        # mockery ----------------------
+        phys_writer = Mock(name='phys_writer')
+        part = Mock(name='part', _rels=[])
+        # exercise ---------------------
+        PackageWriter._write_parts(phys_writer, [part], minify=True)
+        # verify -----------------------
+        phys_writer.write.assert_called_once_with(
+            part.partname, part.minified_blob
+        )
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
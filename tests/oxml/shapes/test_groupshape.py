@@ -11,9 +11,11 @@ import pytest
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.groupshape import CT_GroupShape
+from pptx.oxml.ns import qn
 from pptx.oxml.shapes.picture import CT_Picture
 
 from ..unitdata.shape import an_spTree
+from ...unitutil.cxml import element
 from ...unitutil.mock import class_mock, instance_mock, method_mock
 
 
@@ -66,6 +68,13 @@ class DescribeCT_GroupShape(object):
         insert_element_before_.assert_called_once_with(sp_, 'p:extLst')
         assert sp is sp_
 
+    def it_can_add_shape_elements_from_xml(self, add_from_xml_fixt):
+        spTree, shape_xmls, expected_tags = add_from_xml_fixt
+        shape_elms = spTree.add_shapes_from_xml(shape_xmls)
+        assert [elm.tag for elm in spTree] == expected_tags
+        assert shape_elms == list(spTree)[1:3]
+        assert isinstance(shape_elms[0], CT_Shape)
+
     def it_can_add_a_textbox_sp_element(self, add_textbox_fixt):
         spTree, id_, name, x, y, cx, cy, CT_Shape_ = add_textbox_fixt[:8]
         insert_element_before_, sp_ = add_textbox_fixt[8:]
@@ -76,6 +85,11 @@ class DescribeCT_GroupShape(object):
         insert_element_before_.assert_called_once_with(sp_, 'p:extLst')
         assert sp is sp_
 
+    def it_can_iterate_over_all_its_shape_elements(self, iter_all_fixt):
+        spTree, expected_names = iter_all_fixt
+        shape_elms = list(spTree.iter_all_shape_elms())
+        assert [elm.shape_name for elm in shape_elms] == expected_names
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -122,6 +136,20 @@ class DescribeCT_GroupShape(object):
             new_table_graphicFrame_, insert_element_before_, graphicFrame_
         )
 
+    @pytest.fixture(params=[
+        ('p:spTree/p:nvGrpSpPr', 0),
+        ('p:spTree/(p:nvGrpSpPr,p:extLst)', 1),
+    ])
+    def add_from_xml_fixt(self, request):
+        spTree_cxml, has_extLst = request.param
+        spTree = element(spTree_cxml)
+        shape_xmls = ['<p:sp/>', '<p:pic><a:blip r:embed="rId1"/></p:pic>']
+        expected_tags = (
+            [qn('p:nvGrpSpPr'), qn('p:sp'), qn('p:pic')] +
+            [qn('p:extLst')] * has_extLst
+        )
+        return spTree, shape_xmls, expected_tags
+
     @pytest.fixture
     def add_textbox_fixt(
             self, spTree, CT_Shape_, insert_element_before_, sp_):
@@ -132,6 +160,18 @@ class DescribeCT_GroupShape(object):
             insert_element_before_, sp_
         )
 
+    @pytest.fixture
+    def iter_all_fixt(self):
+        spTree = element(
+            'p:spTree/(p:nvGrpSpPr/p:cNvPr{name=Tree},p:sp/p:nvSpPr/p:cNvPr{'
+            'name=A},p:grpSp/(p:nvGrpSpPr/p:cNvPr{name=B},p:pic/p:nvPicPr/p:'
+            'cNvPr{name=C},p:grpSp/(p:nvGrpSpPr/p:cNvPr{name=D},p:sp/p:nvSpP'
+            'r/p:cNvPr{name=E})),ve:AlternateContent/ve:Choice/p:sp/p:nvSpPr'
+            '/p:cNvPr{name=F},p:cxnSp/p:nvCxnSpPr/p:cNvPr{name=G})'
+        )
+        expected_names = ['A', 'B', 'C', 'D', 'E', 'G']
+        return spTree, expected_names
+
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -40,3 +40,16 @@ class DescribeCT_Table(object):
         )
         tbl = CT_Table.new_tbl(2, 3, 334, 445)
         assert tbl.xml == expected_xml
+
+    def it_can_create_a_new_tbl_element_tree_from_text(self):
+        tbl = CT_Table.new_tbl_from_text(
+            [[u'a & b', u'c\nd'], [u'e']], 100, 301, col_weights=[1, 3]
+        )
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == [25, 75]
+        assert [tr.h for tr in tbl.tr_lst] == [150, 151]
+        assert [
+            [tc.xpath('string(a:txBody/a:p)') for tc in tr.tc_lst]
+            for tr in tbl.tr_lst
+        ] == [[u'a & b', u'cd'], [u'e', u'']]
+        assert len(tbl.xpath('//a:br')) == 1
+        assert len(tbl.xpath('//a:tc/a:tcPr')) == 4
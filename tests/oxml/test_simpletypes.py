@@ -12,8 +12,10 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.oxml.simpletypes import (
-    BaseIntType, BaseSimpleType, ST_Coordinate, ST_HexColorRGB, ST_Percentage
+    BaseIntType, BaseSimpleType, ST_Coordinate, ST_Coordinate32,
+    ST_HexColorRGB, ST_Percentage, ST_PositiveCoordinate, XsdBoolean
 )
+from pptx.exc import InvalidXmlError
 
 from ..unitutil.mock import method_mock, instance_mock
 
@@ -167,8 +169,61 @@ class DescribeST_Coordinate(object):
         str_value, expected_value = univ_meas_fixture
         assert ST_Coordinate.convert_from_xml(str_value) == expected_value
 
+    def it_can_convert_an_integer_coordinate_from_xml(self):
+        assert ST_Coordinate.from_xml('-914400') == -914400
+        assert ST_Coordinate32.from_xml('914400') == 914400
+
+    def it_raises_on_a_malformed_coordinate_in_xml(
+            self, from_xml_raise_fixture):
+        simple_type, str_value = from_xml_raise_fixture
+        with pytest.raises(ValueError) as e:
+            simple_type.convert_from_xml(str_value)
+        assert str(e.value) == (
+            "invalid literal for int() with base 10: '%s'" % str_value
+        )
+
+    def it_can_convert_a_coordinate_to_xml(self, to_xml_fixture):
+        simple_type, value, expected_value = to_xml_fixture
+        assert simple_type.to_xml(value) == expected_value
+
+    def it_raises_on_an_invalid_coordinate(self, to_xml_raise_fixture):
+        simple_type, value, exception = to_xml_raise_fixture
+        with pytest.raises(exception):
+            simple_type.to_xml(value)
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        (ST_Coordinate,   '12xx'),
+        (ST_Coordinate,   'abc'),
+        (ST_Coordinate32, '12xx'),
+    ])
+    def from_xml_raise_fixture(self, request):
+        simple_type, str_value = request.param
+        return simple_type, str_value
+
+    @pytest.fixture(params=[
+        (ST_Coordinate,         -914400,        '-914400'),
+        (ST_Coordinate,         27273042316900, '27273042316900'),
+        (ST_Coordinate32,       -2147483648,    '-2147483648'),
+        (ST_PositiveCoordinate, 0,              '0'),
+        (ST_PositiveCoordinate, 914400,         '914400'),
+    ])
+    def to_xml_fixture(self, request):
+        simple_type, value, expected_value = request.param
+        return simple_type, value, expected_value
+
+    @pytest.fixture(params=[
+        (ST_Coordinate,         27273042316901, ValueError),
+        (ST_Coordinate,         1.5,            TypeError),
+        (ST_Coordinate32,       2147483648,     ValueError),
+        (ST_PositiveCoordinate, -1,             ValueError),
+        (ST_PositiveCoordinate, '42',           TypeError),
+    ])
+    def to_xml_raise_fixture(self, request):
+        simple_type, value, exception = request.param
+        return simple_type, value, exception
+
     @pytest.fixture(params=[
         ('1.2in',       1097280),
         ('42mm',        1512000),
@@ -266,3 +321,33 @@ class ST_SimpleType(BaseSimpleType):
     @classmethod
     def validate(cls, value):
         pass
+
+
+class DescribeXsdBoolean(object):
+
+    def it_can_convert_from_xml(self, from_xml_fixture):
+        str_value, expected_value = from_xml_fixture
+        assert XsdBoolean.from_xml(str_value) is expected_value
+
+    def it_raises_on_an_invalid_xml_value(self):
+        with pytest.raises(InvalidXmlError):
+            XsdBoolean.from_xml('True')
+
+    def it_can_convert_to_xml(self):
+        assert XsdBoolean.to_xml(True) == '1'
+        assert XsdBoolean.to_xml(False) == '0'
+        assert XsdBoolean.to_xml(1) == '1'
+        with pytest.raises(TypeError):
+            XsdBoolean.to_xml('1')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('1',     True),
+        ('0',     False),
+        ('true',  True),
+        ('false', False),
+    ])
+    def from_xml_fixture(self, request):
+        str_value, expected_value = request.param
+        return str_value, expected_value
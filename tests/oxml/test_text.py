@@ -0,0 +1,93 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.oxml.text module.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from lxml.etree import XMLSyntaxError
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.oxml.text import CT_TextParagraph
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeCT_TextBody(object):
+
+    def it_can_replace_its_paragraphs(self):
+        txBody = element('p:txBody/(a:bodyPr,a:p/a:r/a:t"foo")')
+        txBody.replace_paragraphs('<a:p><a:r><a:t>bar</a:t></a:r></a:p>')
+        assert txBody.xml == xml('p:txBody/(a:bodyPr,a:p/a:r/a:t"bar")')
+
+    def it_keeps_its_paragraphs_when_the_new_ones_cannot_be_parsed(self):
+        txBody = element('p:txBody/(a:bodyPr,a:p/a:r/a:t"foo")')
+        expected_xml = txBody.xml
+        with pytest.raises(XMLSyntaxError):
+            txBody.replace_paragraphs('<a:p><a:r></a:p>')
+        assert txBody.xml == expected_xml
+
+    def it_can_replace_its_text(self, replace_text_fixture):
+        txBody, p, expected_xml = replace_text_fixture
+        txBody.replace_text(p)
+        assert txBody.xml == expected_xml
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('p:txBody/(a:bodyPr,a:p/a:r/a:t"foo",a:p)',
+         'p:txBody/(a:bodyPr,a:p/a:r/a:t"bar")'),
+        ('p:txBody/(a:bodyPr,a:p/(a:r/a:t"foo",a:endParaRPr))',
+         'p:txBody/(a:bodyPr,a:p/(a:r/a:t"bar",a:endParaRPr))'),
+        ('p:txBody/a:bodyPr',
+         'p:txBody/(a:bodyPr,a:p/a:r/a:t"bar")'),
+    ])
+    def replace_text_fixture(self, request):
+        txBody_cxml, expected_cxml = request.param
+        txBody = element(txBody_cxml)
+        p = element('a:p/a:r/a:t"bar"')
+        return txBody, p, xml(expected_cxml)
+
+
+class DescribeCT_TextParagraph(object):
+
+    def it_can_generate_the_xml_for_its_content(self, content_fixture):
+        text, expected_text = content_fixture
+        p = parse_xml('<a:p %s>%s</a:p>' % (
+            nsdecls('a'), CT_TextParagraph.content_xml(text)
+        ))
+        assert ''.join(t.text for t in p.xpath('.//a:t')) == expected_text
+
+    def it_can_generate_the_xml_for_a_paragraph(self):
+        p_xml = CT_TextParagraph.p_xml((('a\r\nb & c', ''),), lvl=1)
+        p = parse_xml(p_xml.replace('<a:p>', '<a:p %s>' % nsdecls('a'), 1))
+        assert [t.text for t in p.xpath('.//a:t')] == ['a\r', 'b & c']
+        assert p.pPr.lvl == 1
+
+    def it_raises_on_a_character_not_allowed_in_xml(self, bad_text_fixture):
+        text = bad_text_fixture
+        with pytest.raises(ValueError):
+            CT_TextParagraph.content_xml(text)
+        with pytest.raises(ValueError):
+            CT_TextParagraph.p_xml(((text, ''),))
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=['a\x00b', 'a\x0bb', 'a\x1fb', 'a\uffffb'])
+    def bad_text_fixture(self, request):
+        return request.param
+
+    @pytest.fixture(params=[
+        ('foo', 'foo'),
+        ('a\r\nb', 'a\rb'),
+        ('a\rb', 'a\rb'),
+        ('<a> & "b"', '<a> & "b"'),
+        ('tab\there', 'tab\there'),
+    ])
+    def content_fixture(self, request):
+        text, expected_text = request.param
+        return text, expected_text
@@ -17,6 +17,7 @@ from pptx.opc.packuri import PackURI
 from pptx.oxml.chart.chart import CT_ChartSpace
 from pptx.parts.chart import ChartPart, ChartWorkbook
 from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+from pptx.parts.image import ImagePart
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import (
@@ -58,8 +59,48 @@ class DescribeChartPart(object):
         ChartWorkbook_.assert_called_once_with(chartSpace_, chart_part)
         assert chart_workbook is chart_workbook_
 
+    def it_can_clone_itself(self, clone_fixture):
+        chart_part, package_, EmbeddedXlsxPart_, xlsx_part_ = clone_fixture[:4]
+        image_part_, partname_ = clone_fixture[4:]
+
+        clone = chart_part.clone(package_)
+
+        package_.next_partname.assert_called_once_with(
+            '/ppt/charts/chart%d.xml'
+        )
+        EmbeddedXlsxPart_.new.assert_called_once_with(b'xlsx', package_)
+        assert isinstance(clone, ChartPart)
+        assert clone.partname is partname_
+        assert clone.package is package_
+        assert clone._element is not chart_part._element
+        assert clone._element.xml == chart_part._element.xml
+        assert clone.related_parts == {
+            'rId1': xlsx_part_, 'rId2': image_part_
+        }
+        assert clone.rels['rId3'].target_ref == 'http://foo/bar'
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture
+    def clone_fixture(self, package_, partname_, EmbeddedXlsxPart_,
+                      xlsx_part_, image_part_):
+        chartSpace = element('c:chartSpace/c:externalData{r:id=rId1}')
+        chart_part = ChartPart(
+            PackURI('/ppt/charts/chart1.xml'), CT.DML_CHART, chartSpace
+        )
+        embedded_xlsx_part = EmbeddedXlsxPart(None, None, b'xlsx')
+        chart_part.rels.add_relationship(
+            RT.PACKAGE, embedded_xlsx_part, 'rId1'
+        )
+        chart_part.rels.add_relationship(RT.IMAGE, image_part_, 'rId2')
+        chart_part.rels.add_relationship(
+            RT.HYPERLINK, 'http://foo/bar', 'rId3', is_external=True
+        )
+        return (
+            chart_part, package_, EmbeddedXlsxPart_, xlsx_part_, image_part_,
+            partname_
+        )
+
     @pytest.fixture
     def chart_fixture(self, chartSpace_, Chart_, chart_):
         chart_part = ChartPart(None, None, chartSpace_)
@@ -129,6 +170,18 @@ class DescribeChartPart(object):
     def chart_workbook_(self, request):
         return instance_mock(request, ChartWorkbook)
 
+    @pytest.fixture
+    def EmbeddedXlsxPart_(self, request, xlsx_part_):
+        EmbeddedXlsxPart_ = class_mock(
+            request, 'pptx.parts.chart.EmbeddedXlsxPart'
+        )
+        EmbeddedXlsxPart_.new.return_value = xlsx_part_
+        return EmbeddedXlsxPart_
+
+    @pytest.fixture
+    def image_part_(self, request):
+        return instance_mock(request, ImagePart)
+
     @pytest.fixture
     def load_(self, request, chart_part_):
         return method_mock(
@@ -149,6 +202,10 @@ class DescribeChartPart(object):
     def xlsx_blob_(self, request):
         return instance_mock(request, bytes)
 
+    @pytest.fixture
+    def xlsx_part_(self, request):
+        return instance_mock(request, EmbeddedXlsxPart)
+
 
 class DescribeChartWorkbook(object):
 
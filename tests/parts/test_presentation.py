@@ -8,7 +8,13 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.oxml.parts.presentation import (
     CT_Presentation, CT_SlideIdList, CT_SlideMasterIdList
 )
@@ -19,6 +25,7 @@ from pptx.parts.slide import SlideCollection
 from ..oxml.unitdata.presentation import (
     a_presentation, a_sldMasterId, a_sldMasterIdLst, a_sldSz
 )
+from ..unitutil.cxml import element
 from ..unitutil.mock import (
     class_mock, instance_mock, method_mock, property_mock
 )
@@ -44,6 +51,22 @@ class DescribePresentationPart(object):
         prs_part.slide_height = slide_height
         assert prs_part._element.xml == expected_xml
 
+    def it_drops_unreferenced_slides_before_saving(self, marshal_fixture):
+        prs_part, slides_ = marshal_fixture
+        prs_part.before_marshal()
+        assert sorted(prs_part.rels) == ['rId1', 'rId2']
+        slides_.rename_slides.assert_called_once_with()
+
+    def it_drops_links_to_removed_slides_before_saving(self, link_fixture):
+        prs, removed_slide, linking_slide = link_fixture
+        prs.slides.remove(removed_slide)
+        prs.save(BytesIO())
+        assert linking_slide._element.xpath('//a:hlinkClick') == []
+        assert removed_slide not in set(linking_slide.package.iter_parts())
+        assert [rel.reltype for rel in linking_slide.rels.values()] == [
+            RT.SLIDE_LAYOUT
+        ]
+
     def it_provides_access_to_its_slide_masters(self, masters_fixture):
         presentation_part = masters_fixture
         slide_masters = presentation_part.slide_masters
@@ -69,6 +92,39 @@ class DescribePresentationPart(object):
 
     # fixtures ---------------------------------------------
 
+    @pytest.fixture
+    def link_fixture(self):
+        prs = Presentation()
+        for _ in range(3):
+            prs.slides.add_slide(prs.slide_layouts[6])
+        removed_slide, linking_slide = prs.slides[1], prs.slides[2]
+        rId = linking_slide.relate_to(removed_slide, RT.SLIDE)
+        textbox = linking_slide.shapes.add_textbox(0, 0, 100, 100)
+        textbox._element.nvSpPr.cNvPr.append(parse_xml(
+            '<a:hlinkClick %s r:id="%s" action="ppaction://hlinksldjump"/>'
+            % (nsdecls('a', 'r'), rId)
+        ))
+        return prs, removed_slide, linking_slide
+
+    @pytest.fixture
+    def marshal_fixture(self, request, slides_):
+        prs_elm = element('p:presentation/p:sldIdLst/p:sldId{r:id=rId2}')
+        prs_part = PresentationPart(
+            PackURI('/ppt/presentation.xml'), None, prs_elm, None
+        )
+        slide_part = Part(PackURI('/ppt/slides/slide1.xml'), None)
+        orphan_part = Part(PackURI('/ppt/slides/slide2.xml'), None)
+        master_part = Part(
+            PackURI('/ppt/slideMasters/slideMaster1.xml'), None
+        )
+        prs_part.rels.add_relationship(RT.SLIDE_MASTER, master_part, 'rId1')
+        prs_part.rels.add_relationship(RT.SLIDE, slide_part, 'rId2')
+        prs_part.rels.add_relationship(RT.SLIDE, orphan_part, 'rId3')
+        property_mock(
+            request, PresentationPart, 'slides', return_value=slides_
+        )
+        return prs_part, slides_
+
     @pytest.fixture
     def masters_fixture(self):
         presentation_part = PresentationPart(None, None, None, None)
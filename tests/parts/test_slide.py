@@ -8,12 +8,16 @@ from __future__ import absolute_import
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.chart.data import ChartData
+from pptx.compat import BytesIO
 from pptx.enum.base import EnumValue
-from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE, PP_PLACEHOLDER
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.opc.packuri import PackURI
 from pptx.opc.package import Part, _Relationship
+from pptx.oxml.ns import qn
 from pptx.oxml.parts.presentation import CT_SlideId, CT_SlideIdList
 from pptx.oxml.parts.slide import CT_Slide
 from pptx.oxml.shapes.autoshape import CT_Shape
@@ -23,11 +27,12 @@ from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import ST_Direction
 from pptx.package import Package
 from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
 from pptx.parts.image import ImagePart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import (
-    BaseSlide, Slide, SlideCollection, _SlidePlaceholder, _SlidePlaceholders,
-    _SlideShapeFactory, _SlideShapeTree
+    BaseSlide, Slide, SlideCollection, _SlideImporter, _SlidePlaceholder,
+    _SlidePlaceholders, _SlideShapeFactory, _SlideShapeTree
 )
 from pptx.parts.slidelayout import _LayoutPlaceholder, SlideLayout
 from pptx.shapes.autoshape import AutoShapeType, Shape
@@ -35,7 +40,9 @@ from pptx.shapes.graphfrm import GraphicFrame
 from pptx.shapes.picture import Picture
 from pptx.shapes.placeholder import BasePlaceholder
 from pptx.shapes.shape import BaseShape
+from pptx.shapes.shapetree import ShapeSpec
 from pptx.shapes.table import Table
+from pptx.util import Inches
 
 from ..oxml.unitdata.shape import (
     a_cNvPr, a_ph, a_pic, an_ext, an_nvPr, an_nvSpPr, an_sp, an_spPr,
@@ -143,6 +150,20 @@ class DescribeSlide(object):
         _SlidePlaceholders_.assert_called_once_with(slide)
         assert placeholders is slide_placeholders_
 
+    def it_can_copy_the_relationships_of_another_slide(self, clone_fixture):
+        slide, source_slide, chart_part_, chart_part_clone_ = clone_fixture[:4]
+        slide_layout_, image_part_ = clone_fixture[4:]
+
+        slide.clone_rels_from(source_slide)
+
+        chart_part_.clone.assert_called_once_with(slide.package)
+        assert slide.related_parts == {
+            'rId1': slide_layout_, 'rId2': image_part_,
+            'rId3': chart_part_clone_
+        }
+        assert slide.rels['rId5'].target_ref == 'http://foo/bar'
+        assert sorted(slide.rels) == ['rId1', 'rId2', 'rId3', 'rId5']
+
     def it_can_create_a_new_slide(self, new_fixture):
         slide_layout_, partname_, package_ = new_fixture[:3]
         Slide_init_, slide_elm_, shapes_, relate_to_ = new_fixture[3:]
@@ -160,6 +181,22 @@ class DescribeSlide(object):
         )
         assert isinstance(slide, Slide)
 
+    def it_can_evict_its_element_tree(self, evict_fixture):
+        slide, expected_blob = evict_fixture
+        slide.evict()
+        assert slide.is_evicted is True
+        assert slide.blob == expected_blob
+        assert slide.is_evicted is True
+
+    def it_parses_its_xml_again_after_eviction(self, evict_fixture):
+        slide, expected_blob = evict_fixture
+        shapes = slide.shapes
+        slide.evict()
+        assert slide.shapes is not shapes
+        assert slide.spTree.tag == qn('p:spTree')
+        assert slide.is_evicted is False
+        assert slide.blob == expected_blob
+
     def it_knows_the_slide_layout_it_inherits_from(self, layout_fixture):
         slide, slide_layout_ = layout_fixture
         slide_layout = slide.slide_layout
@@ -185,6 +222,13 @@ class DescribeSlide(object):
             package_, rId
         )
 
+    @pytest.fixture
+    def evict_fixture(self):
+        sld = element('p:sld/p:cSld/p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2}')
+        slide = Slide(None, None, sld, None)
+        expected_blob = slide.blob
+        return slide, expected_blob
+
     @pytest.fixture
     def layout_fixture(self, slide_layout_, part_related_by_):
         slide = Slide(None, None, None, None)
@@ -201,6 +245,30 @@ class DescribeSlide(object):
         slide = Slide(None, None, None, None)
         return slide, _SlideShapeTree_, slide_shape_tree_
 
+    @pytest.fixture
+    def clone_fixture(self, request, package_, slide_layout_):
+        partname = PackURI('/ppt/slides/slide1.xml')
+        source_slide = Slide(partname, CT.PML_SLIDE, None, package_)
+        slide = Slide(partname, CT.PML_SLIDE, None, package_)
+        chart_part_ = instance_mock(request, ChartPart)
+        chart_part_clone_ = instance_mock(request, ChartPart)
+        chart_part_.clone.return_value = chart_part_clone_
+        image_part_ = instance_mock(request, ImagePart)
+        notes_slide_part_ = instance_mock(request, Part)
+        for reltype, target, rId in (
+                (RT.SLIDE_LAYOUT, slide_layout_, 'rId1'),
+                (RT.IMAGE, image_part_, 'rId2'),
+                (RT.CHART, chart_part_, 'rId3'),
+                (RT.NOTES_SLIDE, notes_slide_part_, 'rId4')):
+            source_slide.rels.add_relationship(reltype, target, rId)
+        source_slide.rels.add_relationship(
+            RT.HYPERLINK, 'http://foo/bar', 'rId5', is_external=True
+        )
+        return (
+            slide, source_slide, chart_part_, chart_part_clone_,
+            slide_layout_, image_part_
+        )
+
     @pytest.fixture
     def new_fixture(
             self, slide_layout_, partname_, package_, Slide_init_,
@@ -344,6 +412,99 @@ class DescribeSlideCollection(object):
         slides._sldIdLst.add_sldId.assert_called_once_with(ANY)
         assert slide is slide_
 
+    def it_can_duplicate_a_slide(self, duplicate_fixture):
+        slides, source_slide, clone_rels_from_ = duplicate_fixture
+
+        new_slide = slides.duplicate(source_slide)
+
+        assert isinstance(new_slide, Slide)
+        assert new_slide.partname == '/ppt/slides/slide3.xml'
+        assert new_slide.package is slides._prs.package
+        assert new_slide._element is not source_slide._element
+        assert new_slide.shapes[0].name == 'Foo'
+        slides._prs.relate_to.assert_called_once_with(new_slide, RT.SLIDE)
+        clone_rels_from_.assert_called_once_with(source_slide)
+        slides._sldIdLst.add_sldId.assert_called_once_with('rId9')
+
+    def it_can_import_slides_from_another_presentation(
+            self, import_fixture):
+        prs, source_prs, indexes, expected_titles, expected_layouts = (
+            import_fixture
+        )
+        new_slides = prs.slides.import_from(source_prs, indexes)
+        assert [s.shapes.title.text for s in new_slides] == expected_titles
+        assert [s.shapes.title.text for s in prs.slides] == (
+            ['target'] + expected_titles
+        )
+        assert [s.slide_layout.name for s in new_slides] == expected_layouts
+        assert all(
+            s.slide_layout.part.package is prs.slides[0].package
+            for s in new_slides
+        )
+        image_parts = set(
+            part for slide in prs.slides
+            for part in slide.related_parts.values()
+            if isinstance(part, ImagePart)
+        )
+        assert len(image_parts) == 1
+
+    def it_can_move_a_slide(self, move_fixture):
+        slides, slide, new_idx, expected_rIds = move_fixture
+        slides.move(slide, new_idx)
+        assert [sldId.rId for sldId in slides._sldIdLst] == expected_rIds
+
+    def it_raises_on_move_to_an_index_out_of_range(self, reorder_fixture):
+        slides, slide_parts, _ = reorder_fixture
+        with pytest.raises(IndexError):
+            slides.move(slide_parts[0], 3)
+
+    def it_can_remove_a_slide(self, reorder_fixture, rename_slides_):
+        slides, slide_parts, prs_ = reorder_fixture
+        slides.remove(slide_parts[1])
+        prs_.drop_rel.assert_called_once_with('rId2')
+        assert [sldId.rId for sldId in slides._sldIdLst] == ['rId1', 'rId3']
+        prs_.package.memory_budget.discard.assert_called_once_with(
+            slide_parts[1]
+        )
+        assert rename_slides_.call_count == 0
+
+    def it_renames_the_slides_before_naming_one_after_a_remove(
+            self, reorder_fixture, rename_slides_):
+        slides, slide_parts, _ = reorder_fixture
+        slides.remove(slide_parts[0])
+        slides.remove(slide_parts[2])
+        slides._next_partname
+        rename_slides_.assert_called_once_with()
+
+    def it_names_a_removed_slide_still_linked_to_after_the_others(
+            self, linked_fixture):
+        prs, removed_slide = linked_fixture
+        prs.slides.remove(removed_slide)
+        prs.save(BytesIO())
+        partnames = [
+            part.partname for part in removed_slide.package.iter_parts()
+            if isinstance(part, Slide)
+        ]
+        assert len(set(partnames)) == len(partnames) == 3
+        assert removed_slide.partname == '/ppt/slides/slide3.xml'
+
+    def it_names_a_slide_added_after_a_remove_apart_from_the_others(
+            self, linked_fixture):
+        prs, removed_slide = linked_fixture
+        prs.slides.remove(removed_slide)
+        prs.slides.add_slide(prs.slide_layouts[6])
+        partnames = [
+            part.partname for part in removed_slide.package.iter_parts()
+            if isinstance(part, Slide)
+        ]
+        assert len(set(partnames)) == len(partnames) == 4
+
+    def it_raises_on_remove_of_a_slide_not_in_collection(
+            self, reorder_fixture, slide_):
+        slides = reorder_fixture[0]
+        with pytest.raises(ValueError):
+            slides.remove(slide_)
+
     def it_knows_the_next_available_slide_partname(
             self, slides_with_slide_parts_):
         slides = slides_with_slide_parts_[0]
@@ -353,10 +514,14 @@ class DescribeSlideCollection(object):
         assert partname == expected_partname
 
     def it_can_assign_partnames_to_the_slides(
-            self, slides, slide_, slide_2_):
+            self, slides, slide_, slide_2_, unlisted_slide_):
+        slides._prs.package.iter_parts.return_value = iter(
+            [slide_, unlisted_slide_, slide_2_]
+        )
         slides.rename_slides()
         assert slide_.partname == '/ppt/slides/slide1.xml'
         assert slide_2_.partname == '/ppt/slides/slide2.xml'
+        assert unlisted_slide_.partname == '/ppt/slides/slide3.xml'
 
     # fixtures -------------------------------------------------------
     #
@@ -373,6 +538,78 @@ class DescribeSlideCollection(object):
     #
     # ----------------------------------------------------------------
 
+    @pytest.fixture
+    def clone_rels_from_(self, request):
+        return method_mock(request, Slide, 'clone_rels_from')
+
+    @pytest.fixture
+    def duplicate_fixture(self, slides, clone_rels_from_):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo}'
+        )
+        source_slide = Slide(
+            PackURI('/ppt/slides/slide1.xml'), CT.PML_SLIDE, sld, None
+        )
+        slides._prs.relate_to.return_value = 'rId9'
+        return slides, source_slide, clone_rels_from_
+
+    @pytest.fixture
+    def import_fixture(self):
+        image_path = absjoin(test_file_dir, 'python-icon.jpeg')
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = 'target'
+        slide.shapes.add_picture(image_path, 0, 0)
+        source_prs = Presentation()
+        source_prs.slide_layouts[1]._element.cSld.set('name', 'Custom')
+        for layout_idx, title in ((1, 'a'), (5, 'b'), (5, 'c')):
+            slide = source_prs.slides.add_slide(
+                source_prs.slide_layouts[layout_idx]
+            )
+            slide.shapes.title.text = title
+            slide.shapes.add_picture(image_path, 0, 0)
+        indexes = [2, 0, 1]
+        expected_titles = ['c', 'a', 'b']
+        expected_layouts = ['Title Only', 'Title Slide', 'Title Only']
+        return (
+            prs, source_prs, indexes, expected_titles, expected_layouts
+        )
+
+    @pytest.fixture
+    def linked_fixture(self):
+        prs = Presentation()
+        for _ in range(3):
+            prs.slides.add_slide(prs.slide_layouts[6])
+        removed_slide = prs.slides[1]
+        prs.slides[2].relate_to(removed_slide, RT.SLIDE)
+        return prs, removed_slide
+
+    @pytest.fixture(params=[
+        (0, 2, ['rId2', 'rId3', 'rId1']),
+        (2, 0, ['rId3', 'rId1', 'rId2']),
+        (1, 1, ['rId1', 'rId2', 'rId3']),
+    ])
+    def move_fixture(self, request, reorder_fixture):
+        slide_idx, new_idx, expected_rIds = request.param
+        slides, slide_parts, _ = reorder_fixture
+        slide = slide_parts[slide_idx]
+        return slides, slide, new_idx, expected_rIds
+
+    @pytest.fixture
+    def reorder_fixture(self, request):
+        sldIdLst = element(
+            'p:sldIdLst/(p:sldId{id=256,r:id=rId1},p:sldId{id=257,r:id=rId2}'
+            ',p:sldId{id=258,r:id=rId3})'
+        )
+        slide_parts = [instance_mock(request, Slide) for _ in range(3)]
+        prs_ = instance_mock(request, PresentationPart)
+        prs_.related_parts = dict(
+            ('rId%d' % (idx+1), slide_part)
+            for idx, slide_part in enumerate(slide_parts)
+        )
+        slides = SlideCollection(sldIdLst, prs_)
+        return slides, slide_parts, prs_
+
     @pytest.fixture
     def prs_(self, request, rel_, related_parts_):
         prs_ = instance_mock(request, PresentationPart)
@@ -465,6 +702,89 @@ class DescribeSlideCollection(object):
         slides = SlideCollection(sldIdLst_, prs_)
         return slides, slide_, slide_2_
 
+    @pytest.fixture
+    def unlisted_slide_(self, request):
+        return instance_mock(request, Slide)
+
+
+class Describe_SlideImporter(object):
+
+    def it_copies_a_part_used_by_several_slides_once(self, copy_fixture):
+        importer, slide, slide_2, new_slide, new_slide_2 = copy_fixture[:5]
+        chart_part, xlsx_part = copy_fixture[5:]
+
+        importer.copy_rels(slide, new_slide)
+        importer.copy_rels(slide_2, new_slide_2)
+
+        chart_part_copy = new_slide.related_parts['rId2']
+        assert new_slide_2.related_parts['rId2'] is chart_part_copy
+        assert isinstance(chart_part_copy, ChartPart)
+        assert chart_part_copy.partname == '/ppt/charts/chart2.xml'
+        assert chart_part_copy._element is not chart_part._element
+        assert chart_part_copy._element.xml == chart_part._element.xml
+        xlsx_part_copy = chart_part_copy.related_parts['rId1']
+        assert xlsx_part_copy is not xlsx_part
+        assert xlsx_part_copy.partname == (
+            '/ppt/embeddings/Microsoft_Excel_Sheet1.xlsx'
+        )
+        assert xlsx_part_copy.blob == b'xlsx'
+        assert sorted(new_slide.rels) == ['rId2']
+
+    def it_allocates_partnames_for_the_parts_it_copies(self, partname_fixture):
+        importer, partname, expected_partname = partname_fixture
+        assert importer._next_partname(partname) == expected_partname
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def copy_fixture(self, importer):
+        chartSpace = element('c:chartSpace/c:externalData{r:id=rId1}')
+        chart_part = ChartPart(
+            PackURI('/ppt/charts/chart3.xml'), CT.DML_CHART, chartSpace
+        )
+        xlsx_part = EmbeddedXlsxPart(
+            PackURI('/ppt/embeddings/Microsoft_Excel_Sheet3.xlsx'),
+            CT.SML_SHEET, b'xlsx'
+        )
+        chart_part.rels.add_relationship(RT.PACKAGE, xlsx_part, 'rId1')
+        notes_slide_part = Part(PackURI('/ppt/notesSlides/notes1.xml'), None)
+        slide, slide_2, new_slide, new_slide_2 = [
+            Slide(PackURI('/ppt/slides/slide%d.xml' % n), CT.PML_SLIDE,
+                  element('p:sld'), None)
+            for n in range(1, 5)
+        ]
+        for source_slide in (slide, slide_2):
+            source_slide.rels.add_relationship(RT.CHART, chart_part, 'rId2')
+            source_slide.rels.add_relationship(
+                RT.NOTES_SLIDE, notes_slide_part, 'rId3'
+            )
+        return (
+            importer, slide, slide_2, new_slide, new_slide_2, chart_part,
+            xlsx_part
+        )
+
+    @pytest.fixture(params=[
+        ('/ppt/charts/chart3.xml', '/ppt/charts/chart2.xml'),
+        ('/ppt/media/image9.png', '/ppt/media/image2.png'),
+        ('/ppt/media/image9.jpeg', '/ppt/media/image1.jpeg'),
+        ('/ppt/foo.xml', '/ppt/foo1.xml'),
+    ])
+    def partname_fixture(self, request, importer):
+        partname, expected_partname = request.param
+        return importer, PackURI(partname), expected_partname
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def importer(self, request):
+        package_ = instance_mock(request, Package)
+        package_.iter_parts.return_value = iter([
+            Part(PackURI('/ppt/charts/chart1.xml'), None),
+            Part(PackURI('/ppt/media/image1.png'), None),
+        ])
+        prs_part_ = instance_mock(request, PresentationPart, package=package_)
+        return _SlideImporter(prs_part_)
+
 
 class Describe_SlideShapeTree(object):
 
@@ -557,6 +877,39 @@ class Describe_SlideShapeTree(object):
         _shape_factory_.assert_called_once_with(sp_)
         assert textbox is textbox_
 
+    def it_can_add_many_shapes_at_once(self, add_many_fixture):
+        shapes, specs, expected_ids = add_many_fixture
+        shape_ids = shapes.add_many(specs)
+        assert shape_ids == expected_ids
+        rect, textbox = shapes.by_id(3), shapes.by_id(4)
+        assert (rect.name, rect.shape_type) == ('Rectangle 2', 1)
+        assert (rect.left, rect.top, rect.width, rect.height) == (1, 2, 3, 4)
+        assert rect.text == 'foo & bar\nbaz'
+        assert rect.fill.fore_color.rgb == RGBColor(0x12, 0x34, 0x56)
+        assert (textbox.name, textbox.text) == ('TextBox 3', '')
+        assert textbox._element.spPr.noFill is not None
+        assert shapes.by_id(2).name == 'Foo'
+
+    def it_can_add_a_table_filled_with_data(self, add_table_data_fixture):
+        shapes, data, autofit, expected_widths = add_table_data_fixture
+        graphic_frame = shapes.add_table_from_data(
+            data, 1, 2, 1000, formats=[None, '.1f'], autofit=autofit
+        )
+        assert graphic_frame.name == 'Table 1'
+        assert graphic_frame.height == Inches(0.4) * 2
+        table = graphic_frame.table
+        assert [col.width for col in table.columns] == expected_widths
+        assert [row.height for row in table.rows] == [Inches(0.4)] * 2
+        assert [
+            [cell.text_frame.text for cell in row.cells]
+            for row in table.rows
+        ] == [['Name', 'Value', ''], ['foo & bar', '1.2', 'x']]
+
+    def it_raises_on_table_data_having_no_values(self, add_table_data_fixture):
+        shapes = add_table_data_fixture[0]
+        with pytest.raises(ValueError):
+            shapes.add_table_from_data([[], []], 1, 2, 1000)
+
     def it_can_clone_placeholder_shapes_from_a_layout(self, clone_fixture):
         shapes, slide_layout_, placeholder_, _clone_layout_placeholder_ = (
             clone_fixture
@@ -673,8 +1026,43 @@ class Describe_SlideShapeTree(object):
         print(shapes._spTree.xml)
         assert name == expected_name
 
+    def it_does_not_hand_out_the_same_placeholder_name_twice(
+            self, ph_name_fixture):
+        shapes, ph_type, id_, orient, expected_name = ph_name_fixture
+        names = [shapes._next_ph_name(ph_type, id_, orient) for _ in range(2)]
+        assert names[0] == expected_name
+        assert names[1] != names[0]
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        (False, [333, 333, 334]),
+        (True,  [523, 333, 144]),
+    ])
+    def add_table_data_fixture(self, request):
+        autofit, expected_widths = request.param
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:grpSpPr)'
+        )
+        shapes = _SlideShapeTree(Slide(None, None, sld, None))
+        data = [('Name', 'Value'), ['foo & bar', 1.23, 'x']]
+        return shapes, data, autofit, expected_widths
+
+    @pytest.fixture
+    def add_many_fixture(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:grpSpPr,p:sp/'
+            'p:nvSpPr/p:cNvPr{id=2,name=Foo},p:extLst)'
+        )
+        shapes = _SlideShapeTree(Slide(None, None, sld, None))
+        specs = (
+            ShapeSpec(MSO_SHAPE.RECTANGLE, 1, 2, 3, 4, 'foo & bar\nbaz',
+                      RGBColor(0x12, 0x34, 0x56)),
+            ShapeSpec(None, 5, 6, 7, 8),
+        )
+        expected_ids = [3, 4]
+        return shapes, specs, expected_ids
+
     @pytest.fixture
     def add_chart_fixture(
             self, slide_, chart_type_, chart_data_, rId_,
@@ -1017,7 +1405,7 @@ class Describe_SlideShapeTree(object):
 
     @pytest.fixture
     def _next_shape_id_(self, request, id_):
-        return property_mock(
+        return method_mock(
             request, _SlideShapeTree, '_next_shape_id', return_value=id_
         )
 
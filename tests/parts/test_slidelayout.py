@@ -22,6 +22,7 @@ from pptx.shapes.shapetree import BaseShapeTree
 from ..oxml.unitdata.shape import (
     a_ph, a_pic, an_ext, an_nvPr, an_nvSpPr, an_sp, an_spPr, an_xfrm
 )
+from ..unitutil.cxml import element
 from ..unitutil.mock import (
     class_mock, function_mock, instance_mock, method_mock, property_mock
 )
@@ -255,23 +256,46 @@ class Describe_LayoutPlaceholders(object):
         assert layout_placeholder is layout_placeholder_
 
     def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        layout_placeholders, ph_idx, placeholder_ = get_fixture
+        layout_placeholders, ph_idx, expected_name = get_fixture
         placeholder = layout_placeholders.get(idx=ph_idx)
-        assert placeholder is placeholder_
+        assert isinstance(placeholder, _LayoutPlaceholder)
+        assert placeholder.name == expected_name
 
     def it_returns_default_if_placeholder_having_idx_not_found(
-            self, default_fixture):
-        layout_placeholders = default_fixture
+            self, layout_placeholders):
         default = 'barfoo'
-        placeholder = layout_placeholders.get('foobar', default)
+        placeholder = layout_placeholders.get(42, default)
         assert placeholder is default
 
-    # fixtures -------------------------------------------------------
+    def it_finds_a_placeholder_added_after_a_lookup(
+            self, layout_placeholders):
+        assert layout_placeholders.get(idx=2) is None
+        spTree = layout_placeholders._spTree
+        spTree.append(element(
+            'p:sp/p:nvSpPr/(p:cNvPr{id=4,name=Foo},p:cNvSpPr,p:nvPr/p:ph{ty'
+            'pe=dt,idx=2})'
+        ))
+        assert layout_placeholders.get(idx=2).name == 'Foo'
+
+    def it_does_not_reindex_on_a_miss_in_an_unchanged_tree(
+            self, layout_placeholders):
+        assert layout_placeholders.get(idx=99) is None
+        shape_index = layout_placeholders._shape_index
+        assert layout_placeholders.get(idx=99) is None
+        assert layout_placeholders._shape_index is shape_index
+
+    def it_finds_a_placeholder_that_replaced_another(
+            self, layout_placeholders):
+        assert layout_placeholders.get(idx=2) is None
+        spTree = layout_placeholders._spTree
+        spTree.remove(spTree[0])
+        spTree.append(element(
+            'p:sp/p:nvSpPr/(p:cNvPr{id=4,name=Foo},p:cNvSpPr,p:nvPr/p:ph{ty'
+            'pe=dt,idx=2})'
+        ))
+        assert layout_placeholders.get(idx=2).name == 'Foo'
 
-    @pytest.fixture
-    def default_fixture(self, _iter_):
-        layout_placeholders = _LayoutPlaceholders(None)
-        return layout_placeholders
+    # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def factory_fixture(
@@ -282,26 +306,27 @@ class Describe_LayoutPlaceholders(object):
             layout_placeholder_
         )
 
-    @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        layout_placeholders = _LayoutPlaceholders(None)
-        ph_idx = request.param
-        ph_shape_ = {0: placeholder_, 1: placeholder_2_}[request.param]
-        return layout_placeholders, ph_idx, ph_shape_
+    @pytest.fixture(params=[(0, 'Title'), (1, 'Body')])
+    def get_fixture(self, request, layout_placeholders):
+        ph_idx, expected_name = request.param
+        return layout_placeholders, ph_idx, expected_name
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, _LayoutPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def layout_placeholder_(self, request):
         return instance_mock(request, _LayoutPlaceholder)
 
+    @pytest.fixture
+    def layout_placeholders(self):
+        sldLayout = element(
+            'p:sldLayout/p:cSld/p:spTree/(p:sp/p:nvSpPr/(p:cNvPr{id=2,name=T'
+            'itle},p:cNvSpPr,p:nvPr/p:ph{type=title}),p:sp/p:nvSpPr/(p:cNvPr'
+            '{id=3,name=Body},p:cNvSpPr,p:nvPr/p:ph{type=body,idx=1}))'
+        )
+        slide_layout = SlideLayout(None, None, sldLayout, None)
+        return slide_layout.placeholders
+
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, layout_placeholder_):
         return function_mock(
@@ -313,14 +338,6 @@ class Describe_LayoutPlaceholders(object):
     def ph_elm_(self, request):
         return instance_mock(request, CT_Shape)
 
-    @pytest.fixture
-    def placeholder_(self, request):
-        return instance_mock(request, _LayoutPlaceholder, idx=0)
-
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, _LayoutPlaceholder, idx=1)
-
 
 class Describe_LayoutPlaceholder(object):
 
@@ -8,6 +8,7 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.parts.slidemaster import CT_SlideLayoutIdList
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.parts.slidelayout import SlideLayout
@@ -21,6 +22,7 @@ from ..oxml.unitdata.shape import a_ph, a_pic, an_nvPr, an_nvSpPr, an_sp
 from ..oxml.unitdata.slides import (
     a_sldLayoutId, a_sldLayoutIdLst, a_sldMaster
 )
+from ..unitutil.cxml import element
 from ..unitutil.mock import (
     class_mock, function_mock, instance_mock, method_mock, property_mock
 )
@@ -271,23 +273,32 @@ class Describe_MasterPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_type(self, get_fixture):
-        master_placeholders, ph_type, placeholder_ = get_fixture
+        master_placeholders, ph_type, expected_name = get_fixture
         placeholder = master_placeholders.get(ph_type)
-        assert placeholder is placeholder_
+        assert isinstance(placeholder, _MasterPlaceholder)
+        assert placeholder.name == expected_name
 
     def it_returns_default_if_placeholder_of_type_not_found(
-            self, default_fixture):
-        master_placeholders = default_fixture
+            self, master_placeholders):
         default = 'barfoo'
-        placeholder = master_placeholders.get('foobar', default)
+        placeholder = master_placeholders.get(PP_PLACEHOLDER.DATE, default)
         assert placeholder is default
 
-    # fixtures -------------------------------------------------------
+    def it_does_not_reindex_on_a_miss_in_an_unchanged_tree(
+            self, master_placeholders):
+        assert master_placeholders.get(PP_PLACEHOLDER.DATE) is None
+        shape_index = master_placeholders._shape_index
+        assert master_placeholders.get(PP_PLACEHOLDER.DATE) is None
+        assert master_placeholders._shape_index is shape_index
 
-    @pytest.fixture
-    def default_fixture(self, _iter_):
-        master_placeholders = _MasterPlaceholders(None)
-        return master_placeholders
+    def it_does_not_find_a_placeholder_removed_after_a_lookup(
+            self, master_placeholders):
+        title_placeholder = master_placeholders.get(PP_PLACEHOLDER.TITLE)
+        sp = title_placeholder._element
+        sp.getparent().remove(sp)
+        assert master_placeholders.get(PP_PLACEHOLDER.TITLE) is None
+
+    # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def factory_fixture(
@@ -297,24 +308,16 @@ class Describe_MasterPlaceholders(object):
             master_placeholders, ph_elm_, _MasterShapeFactory_, placeholder_
         )
 
-    @pytest.fixture(params=['title', 'body'])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        master_placeholders = _MasterPlaceholders(None)
-        ph_type = request.param
-        ph_shape_ = {
-            'title': placeholder_, 'body': placeholder_2_
-        }[request.param]
-        return master_placeholders, ph_type, ph_shape_
+    @pytest.fixture(params=[
+        (PP_PLACEHOLDER.TITLE, 'Title'),
+        (PP_PLACEHOLDER.BODY, 'Body'),
+    ])
+    def get_fixture(self, request, master_placeholders):
+        ph_type, expected_name = request.param
+        return master_placeholders, ph_type, expected_name
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, _MasterPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -322,6 +325,16 @@ class Describe_MasterPlaceholders(object):
             return_value=placeholder_
         )
 
+    @pytest.fixture
+    def master_placeholders(self):
+        sldMaster = element(
+            'p:sldMaster/p:cSld/p:spTree/(p:sp/p:nvSpPr/(p:cNvPr{id=2,name=T'
+            'itle},p:cNvSpPr,p:nvPr/p:ph{type=title}),p:sp/p:nvSpPr/(p:cNvPr'
+            '{id=3,name=Body},p:cNvSpPr,p:nvPr/p:ph{type=body,idx=1}))'
+        )
+        slide_master = SlideMaster(None, None, sldMaster, None)
+        return slide_master.placeholders
+
     @pytest.fixture
     def ph_elm_(self, request):
         return instance_mock(request, CT_Shape)
@@ -329,7 +342,3 @@ class Describe_MasterPlaceholders(object):
     @pytest.fixture
     def placeholder_(self, request):
         return instance_mock(request, _MasterPlaceholder, ph_type='title')
-
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, _MasterPlaceholder, ph_type='body')
@@ -14,7 +14,11 @@ from pptx.shapes.autoshape import Shape
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.shapes.shape import BaseShape
 from pptx.shapes.picture import Picture
-from pptx.shapes.shapetree import BaseShapeTree, BaseShapeFactory
+from pptx.shapes.shapetree import (
+    BaseShapeTree, BaseShapeFactory, ShapeGeometry, ShapeSpec,
+    _ShapeIdAllocator
+)
+from pptx.shapes.spatial import SpatialIndex
 
 from ..oxml.unitdata.shape import (
     a_cNvPr, an_nvSpPr, an_sp, an_spPr, an_spTree
@@ -37,9 +41,15 @@ class DescribeBaseShapeFactory(object):
 
     def it_finds_an_unused_shape_id_to_help_add_shape(self, next_id_fixture):
         shapes, next_available_shape_id = next_id_fixture
-        shape_id = shapes._next_shape_id
+        shape_id = shapes._next_shape_id()
         assert shape_id == next_available_shape_id
 
+    def it_reserves_each_shape_id_it_hands_out(self, next_id_fixture):
+        shapes, next_available_shape_id = next_id_fixture
+        shape_ids = [shapes._next_shape_id() for _ in range(3)]
+        assert len(set(shape_ids)) == 3
+        assert shape_ids[0] == next_available_shape_id
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=['sp', 'pic', 'graphicFrame', 'grpSp', 'cxnSp'])
@@ -152,6 +162,13 @@ class DescribeBaseShapeTree(object):
         BaseShapeFactory_.assert_called_once_with(shape_elm_, shapes)
         assert shape is shape_
 
+    def it_provides_the_same_shape_object_on_each_access(self, slide):
+        shapes = BaseShapeTree(slide)
+        first_pass = list(shapes)
+        assert list(shapes) == first_pass
+        assert [shapes[0], shapes[1]] == first_pass
+        assert first_pass[0] is not first_pass[1]
+
     def it_raises_on_shape_index_out_of_range(self, getitem_fixture):
         shapes = getitem_fixture[0]
         with pytest.raises(IndexError):
@@ -161,14 +178,81 @@ class DescribeBaseShapeTree(object):
         shapes = BaseShapeTree(slide)
         assert shapes.part is slide
 
+    def it_can_find_a_shape_by_id(self, lookup_fixture):
+        shapes, sp, sp_2 = lookup_fixture
+        assert shapes.by_id(3).element is sp_2
+        assert shapes.by_id(2).element is sp
+        with pytest.raises(KeyError):
+            shapes.by_id(9)
+
+    def it_can_find_a_shape_by_name(self, lookup_fixture):
+        shapes, sp, sp_2 = lookup_fixture
+        assert shapes.by_name('Foo').element is sp
+        sp_2.nvSpPr.cNvPr.name = 'Bar'
+        assert shapes.by_name('Bar').element is sp_2
+        with pytest.raises(KeyError):
+            shapes.by_name('Baz')
+
+    def it_can_iterate_over_all_shapes_including_grouped_ones(
+            self, iter_all_fixture):
+        shapes, expected_geometries = iter_all_fixture
+        assert [s.name for s in shapes.iter_all()] == ['A', 'B', 'C', 'D']
+        items = list(shapes.iter_all(geometry=True))
+        assert [(s.name, tuple(g)) for s, g in items] == expected_geometries
+        assert isinstance(items[0][1], ShapeGeometry)
+
+    def it_can_index_its_shapes_by_position(self, iter_all_fixture):
+        shapes = iter_all_fixture[0]
+        spatial_index = shapes.spatial_index()
+        assert isinstance(spatial_index, SpatialIndex)
+        assert len(spatial_index) == 2
+        hits = spatial_index.intersecting(0, 0, 1500, 2500)
+        assert [s.name for s in hits] == ['A', 'B']
+        assert [s.name for s in spatial_index.outside(1100, 3000)] == ['B']
+
+    def it_reindexes_when_a_shape_is_added(self, lookup_fixture):
+        shapes = lookup_fixture[0]
+        assert len(shapes) == 2
+        shapes.part.spTree.append(
+            element('p:sp/p:nvSpPr/p:cNvPr{id=7,name=Baz}')
+        )
+        assert len(shapes) == 3
+        assert shapes[2].name == 'Baz'
+        assert shapes.by_id(7) is shapes[2]
+
+    def it_discards_the_proxies_of_removed_shapes(self, lookup_fixture):
+        shapes, sp, sp_2 = lookup_fixture
+        shape = shapes[0]
+        shapes.part.spTree.remove(sp)
+        assert len(shapes) == 1
+        assert len(shapes._proxies) == 0
+        assert shapes[0] is not shape
+
+    def it_reindexes_when_a_shape_is_moved(self, lookup_fixture):
+        shapes, sp, sp_2 = lookup_fixture
+        assert [shapes[0].id, shapes[1].id] == [2, 3]
+        spTree = shapes.part.spTree
+        spTree.remove(sp)
+        spTree.append(sp)
+        assert [shapes[0].id, shapes[1].id] == [3, 2]
+
+    def it_reindexes_when_a_shape_is_replaced(self, lookup_fixture):
+        shapes, sp, sp_2 = lookup_fixture
+        assert shapes[1].id == 3
+        spTree = shapes.part.spTree
+        spTree.remove(sp_2)
+        spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{id=7,name=Baz}'))
+        assert shapes[1].id == 7
+        assert shapes[-1].id == 7
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def getitem_fixture(
-            self, _iter_member_elms_, BaseShapeFactory_, sp_2_, shape_):
-        shapes = BaseShapeTree(None)
+    def getitem_fixture(self, slide, sld, BaseShapeFactory_, shape_):
+        shapes = BaseShapeTree(slide)
         idx = 1
-        return shapes, idx, BaseShapeFactory_, sp_2_, shape_
+        sp_2 = sld.xpath('//p:sp')[1]
+        return shapes, idx, BaseShapeFactory_, sp_2, shape_
 
     @pytest.fixture
     def iter_fixture(
@@ -183,6 +267,39 @@ class DescribeBaseShapeTree(object):
         expected_elm_count = 2
         return shapes, expected_elm_count
 
+    @pytest.fixture
+    def iter_all_fixture(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=Tree},p:sp/'
+            '(p:nvSpPr/p:cNvPr{id=2,name=A},p:spPr/a:xfrm/(a:off{x=10,y=20},'
+            'a:ext{cx=30,cy=40})),p:grpSp/(p:nvGrpSpPr/p:cNvPr{id=3,name=B},'
+            'p:grpSpPr/a:xfrm/(a:off{x=1000,y=2000},a:ext{cx=200,cy=400},a:c'
+            'hOff{x=100,y=100},a:chExt{cx=100,cy=100}),p:grpSp/(p:nvGrpSpPr/'
+            'p:cNvPr{id=4,name=C},p:grpSpPr/a:xfrm/(a:off{x=100,y=100},a:ext'
+            '{cx=50,cy=50},a:chOff{x=0,y=0},a:chExt{cx=100,cy=100}),p:sp/(p:'
+            'nvSpPr/p:cNvPr{id=5,name=D},p:spPr/a:xfrm/(a:off{x=20,y=40},a:e'
+            'xt{cx=10,cy=10})))))'
+        )
+        shapes = BaseShapeTree(Slide(None, None, sld, None))
+        expected_geometries = [
+            ('A', (10, 20, 30, 40)),
+            ('B', (1000, 2000, 200, 400)),
+            ('C', (1000, 2000, 100, 200)),
+            ('D', (1020, 2080, 10, 20)),
+        ]
+        return shapes, expected_geometries
+
+    @pytest.fixture
+    def lookup_fixture(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=Tree},p:sp/'
+            'p:nvSpPr/p:cNvPr{id=2,name=Foo},p:sp/p:nvSpPr/p:cNvPr{id=3,name'
+            '=Foo})'
+        )
+        shapes = BaseShapeTree(Slide(None, None, sld, None))
+        sp, sp_2 = sld.xpath('//p:sp')
+        return shapes, sp, sp_2
+
     @pytest.fixture
     def len_fixture(self, slide):
         shapes = BaseShapeTree(slide)
@@ -236,3 +353,78 @@ class DescribeBaseShapeTree(object):
     @pytest.fixture
     def sp_2_(self, request):
         return instance_mock(request, CT_Shape)
+
+
+class DescribeShapeGeometry(object):
+
+    def it_provides_access_to_its_fields(self):
+        geometry = ShapeGeometry(1, 2, 3, 4)
+        assert geometry.left == 1
+        assert geometry.top == 2
+        assert geometry.width == 3
+        assert geometry.height == 4
+
+
+class DescribeShapeSpec(object):
+
+    def it_provides_access_to_its_fields(self):
+        spec = ShapeSpec(1, 2, 3, 4, 5, 'foo', 'bar')
+        assert spec.autoshape_type_id == 1
+        assert (spec.left, spec.top, spec.width, spec.height) == (2, 3, 4, 5)
+        assert (spec.text, spec.fill) == ('foo', 'bar')
+
+    def it_has_no_text_or_fill_by_default(self):
+        spec = ShapeSpec(None, 2, 3, 4, 5)
+        assert (spec.text, spec.fill) == (None, None)
+
+
+class Describe_ShapeIdAllocator(object):
+
+    def it_can_construct_from_a_shape_tree(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/'
+                         'p:cNvPr{id=3})')
+        allocator = _ShapeIdAllocator.from_spTree(spTree)
+        assert allocator.spTree is spTree
+        assert [allocator.allocate() for _ in range(3)] == [2, 4, 5]
+
+    def it_allocates_the_lowest_unused_id(self):
+        allocator = _ShapeIdAllocator(None, (1, 2, 4, 7))
+        shape_ids = [allocator.allocate() for _ in range(4)]
+        assert shape_ids == [3, 5, 6, 8]
+
+    def it_can_allocate_many_ids_at_once(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/'
+                         'p:cNvPr{id=3})')
+        allocator = _ShapeIdAllocator.from_spTree(spTree)
+        assert allocator.allocate_many(3) == [2, 4, 5]
+        for shape_id in (2, 4, 5):
+            spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{id=%d}' % shape_id))
+        assert allocator.allocate() == 6
+
+    def it_can_reuse_a_released_id(self):
+        allocator = _ShapeIdAllocator(None, (1, 2, 3, 4))
+        allocator.release(3)
+        allocator.release(2)
+        allocator.release(9)
+        assert [allocator.allocate() for _ in range(3)] == [2, 3, 5]
+
+    def it_ignores_a_released_id_above_the_scan_position(self):
+        allocator = _ShapeIdAllocator(None, (1, 5))
+        allocator.release(5)
+        assert [allocator.allocate() for _ in range(5)] == [2, 3, 4, 5, 6]
+
+    def it_sees_a_shape_inserted_directly_into_the_tree(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/'
+                         'p:cNvPr{id=2})')
+        allocator = _ShapeIdAllocator.from_spTree(spTree)
+        spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{id=3}'))
+        assert allocator.allocate() == 4
+
+    def it_reuses_the_id_of_a_shape_removed_from_the_tree(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/'
+                         'p:cNvPr{id=2},p:sp/p:nvSpPr/p:cNvPr{id=3})')
+        allocator = _ShapeIdAllocator.from_spTree(spTree)
+        assert allocator.allocate() == 4
+        spTree.append(element('p:sp/p:nvSpPr/p:cNvPr{id=4}'))
+        spTree.remove(spTree[1])
+        assert [allocator.allocate() for _ in range(2)] == [2, 5]
@@ -0,0 +1,112 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.shapes.spatial module
+"""
+
+from __future__ import absolute_import
+
+import pytest
+import random
+import time
+
+from pptx.shapes.spatial import SpatialIndex
+
+
+class DescribeSpatialIndex(object):
+
+    def it_knows_how_many_shapes_it_indexes(self, index_fixture):
+        spatial_index = index_fixture
+        assert len(spatial_index) == 5
+
+    def it_can_find_the_shapes_intersecting_a_rectangle(
+            self, intersecting_fixture):
+        spatial_index, rect, expected_shapes = intersecting_fixture
+        assert spatial_index.intersecting(*rect) == expected_shapes
+
+    def it_can_find_the_shapes_that_overlap_each_other(self, index_fixture):
+        spatial_index = index_fixture
+        assert spatial_index.overlapping_pairs() == [
+            ('A', 'B'), ('A', 'D'), ('B', 'D')
+        ]
+
+    def it_can_find_the_shapes_outside_the_slide(self, index_fixture):
+        spatial_index = index_fixture
+        assert spatial_index.outside(100, 100) == ['C', 'D', 'E']
+
+    def it_agrees_with_comparing_every_pair_of_shapes(self, random_fixture):
+        spatial_index, items = random_fixture
+        expected_pairs = [
+            (shape, other_shape)
+            for idx, (shape, box) in enumerate(items)
+            for other_shape, other_box in items[idx+1:]
+            if self._overlap(box, other_box)
+        ]
+        assert spatial_index.overlapping_pairs() == expected_pairs
+        rect = (2000, 3000, 1500, 1000)
+        assert spatial_index.intersecting(*rect) == [
+            shape for shape, box in items if self._overlap(box, rect)
+        ]
+
+    def it_stays_fast_for_stacked_full_width_shapes(self, rows_fixture):
+        spatial_index, row_count = rows_fixture
+        start = time.time()
+        assert spatial_index.overlapping_pairs() == []
+        for idx in range(0, row_count, 10):
+            rect = (500, idx*10+1, 10, 5)
+            assert spatial_index.intersecting(*rect) == [idx]
+        assert time.time() - start < 2.0
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def index_fixture(self):
+        return SpatialIndex([
+            ('A', (0, 0, 50, 50)),
+            ('B', (40, 40, 20, 20)),
+            ('C', (50, 0, 60, 10)),
+            ('X', (10, None, 10, 10)),
+            ('D', (-10, 30, 60, 20)),
+            ('E', (200, 200, 10, 10)),
+        ])
+
+    @pytest.fixture(params=[
+        ((0, 0, 10, 10),      ['A']),
+        ((45, 45, 1, 1),      ['A', 'B', 'D']),
+        ((50, 0, 5, 5),       ['C']),
+        ((60, 20, 10, 10),    []),
+        ((-100, -100, 99, 99), []),
+        ((0, 0, 1000, 1000),  ['A', 'B', 'C', 'D', 'E']),
+    ])
+    def intersecting_fixture(self, request, index_fixture):
+        rect, expected_shapes = request.param
+        return index_fixture, rect, expected_shapes
+
+    @pytest.fixture
+    def random_fixture(self):
+        rand = random.Random(42)
+        items = [
+            (idx, (
+                rand.randint(-500, 9000), rand.randint(-500, 6000),
+                rand.randint(0, 800), rand.randint(0, 800)
+            ))
+            for idx in range(300)
+        ]
+        return SpatialIndex(items), items
+
+    @pytest.fixture
+    def rows_fixture(self):
+        row_count = 5000
+        items = [(idx, (0, idx*10, 10**6, 10)) for idx in range(row_count)]
+        return SpatialIndex(items), row_count
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def _overlap(box, other_box):
+        left, top, width, height = box
+        other_left, other_top, other_width, other_height = other_box
+        return (
+            left < other_left + other_width and other_left < left + width and
+            top < other_top + other_height and other_top < top + height
+        )
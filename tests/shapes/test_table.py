@@ -16,7 +16,7 @@ from pptx.shapes.table import (
     _Cell, _CellCollection, _Column, _ColumnCollection, _Row, _RowCollection,
     Table
 )
-from pptx.util import Inches, Length, Pt
+from pptx.util import Inches, Length, ProxyCache, Pt
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import class_mock, instance_mock
@@ -25,9 +25,61 @@ from ..unitutil.mock import class_mock, instance_mock
 class DescribeTable(object):
 
     def it_provides_access_to_its_cells(self, cell_fixture):
-        table, row_idx, col_idx, expected_cell_ = cell_fixture
-        cell = table.cell(row_idx, col_idx)
-        assert cell is expected_cell_
+        table, tbl = cell_fixture
+        cell = table.cell(1, 0)
+        assert isinstance(cell, _Cell)
+        assert cell._tc is tbl.tr_lst[1].tc_lst[0]
+        assert table.cell(1, 0) is cell
+
+    def it_raises_on_cell_index_out_of_range(self, cell_fixture):
+        table = cell_fixture[0]
+        for row_idx, col_idx in ((2, 0), (0, 2), (-1, 0), (1, 1)):
+            with pytest.raises(IndexError):
+                table.cell(row_idx, col_idx)
+
+    def it_finds_cells_after_the_table_changes(self, cell_fixture):
+        table, tbl = cell_fixture
+        table.cell(1, 0)
+        tr = tbl.tr_lst[1]
+        tr.append(element('a:tc/a:txBody/a:p/a:r/a:t"new"'))
+        assert table.cell(1, 1).text_frame.text == 'new'
+        tbl.remove(tbl.tr_lst[0])
+        assert table.cell(0, 1).text_frame.text == 'new'
+        with pytest.raises(IndexError):
+            table.cell(1, 0)
+
+    def it_provides_the_same_cell_however_it_is_reached(self, cell_fixture):
+        table = cell_fixture[0]
+        assert table.rows[1].cells[0] is table.cell(1, 0)
+        assert table.cell(0, 1) is table.rows[0].cells[1]
+
+    def it_finds_cells_after_rows_or_cells_are_moved(self):
+        tbl = element(
+            'a:tbl/(a:tblGrid/a:gridCol,a:tr/(a:tc/a:txBody/a:p/a:r/a:t"a",a'
+            ':tc/a:txBody/a:p/a:r/a:t"b"),a:tr/(a:tc/a:txBody/a:p/a:r/a:t"c"'
+            ',a:tc/a:txBody/a:p/a:r/a:t"d"))'
+        )
+        table = Table(tbl, None)
+        assert table.cell(0, 0).text_frame.text == 'a'
+        tr = tbl.tr_lst[0]
+        tbl.remove(tr)
+        tbl.append(tr)
+        assert table.cell(0, 0).text_frame.text == 'c'
+        tr = tbl.tr_lst[0]
+        tc = tr.tc_lst[0]
+        tr.remove(tc)
+        tr.append(tc)
+        assert table.cell(0, 0).text_frame.text == 'd'
+        assert table.cell(0, 1).text_frame.text == 'c'
+
+    def it_can_read_the_text_of_all_its_cells(self):
+        tbl = element(
+            'a:tbl/(a:tr/(a:tc/a:txBody/(a:bodyPr,a:p/(a:r/a:t"a",a:br,a:r/'
+            'a:t"b"),a:p/a:fld/a:t"c"),a:tc/a:txBody/a:p),a:tr/a:tc/a:txBody'
+            '/(a:p/a:r/a:t"d",a:p,a:p/a:r/a:t"e"),a:tr)'
+        )
+        table = Table(tbl, None)
+        assert table.to_rows() == [['a\nb\nc', ''], ['d\n\ne'], []]
 
     def it_provides_access_to_its_rows(self, rows_fixture):
         table, expected_rows_ = rows_fixture
@@ -47,14 +99,39 @@ class DescribeTable(object):
         table.notify_height_changed()
         assert table._graphic_frame.height == expected_height
 
+    def it_can_write_rows_of_values_into_its_cells(self, write_fixture):
+        table, rows, formats, expected_xml = write_fixture
+        table.write(rows, formats)
+        assert table._tbl.xml == expected_xml
+
+    def it_raises_when_the_values_do_not_fit(self, write_raises_fixture):
+        table, rows = write_raises_fixture
+        with pytest.raises(ValueError):
+            table.write(rows)
+
+    def it_writes_text_as_cell_text_assignment_would(self):
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/a:txBody/a:p,'
+            'a:tc/a:txBody/a:p))'
+        )
+        table = Table(tbl, None)
+        table.write([['a\r\nb', 'c']])
+        table.cell(0, 1).text = 'a\r\nb'
+        assert table.to_rows() == [['a\r\nb', 'a\r\nb']]
+        with pytest.raises(ValueError):
+            table.write([['a\x0bb']])
+        assert table.to_rows() == [['a\r\nb', 'a\r\nb']]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def cell_fixture(self, table, row_, cell_):
-        table._rows = [row_]
-        row_.cells = [cell_]
-        row_idx = col_idx = 0
-        return table, row_idx, col_idx, cell_
+    def cell_fixture(self):
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc),a:tr/a:t'
+            'c)'
+        )
+        table = Table(tbl, None)
+        return table, tbl
 
     @pytest.fixture
     def columns_fixture(self, table, columns_):
@@ -80,11 +157,50 @@ class DescribeTable(object):
         table._rows = rows_
         return table, rows_
 
-    # fixture components ---------------------------------------------
+    @pytest.fixture(params=[
+        ([['a', 'b'], ['c', 'd']], None,
+         'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/a:txBody/(a:bod'
+         'yPr,a:p/a:r/a:t"a"),a:tc/a:txBody/(a:bodyPr,a:p/a:r/a:t"b")),a:tr/'
+         '(a:tc/a:txBody/(a:bodyPr,a:p/(a:pPr,a:r/a:t"c",a:endParaRPr)),a:tc'
+         '/a:txBody/(a:bodyPr,a:p/a:r/a:t"d")))'),
+        ([(1.5, None)], [',.2f'],
+         'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/a:txBody/(a:bod'
+         'yPr,a:p/a:r/a:t"1.50"),a:tc/a:txBody/(a:bodyPr,a:p)),a:tr/(a:tc/a:'
+         'txBody/(a:bodyPr,a:p/(a:pPr,a:r/a:t"x",a:endParaRPr)),a:tc/a:txBod'
+         'y/(a:bodyPr,a:p,a:p)))'),
+        ([[], [1234, 'foo\nbar']], [',d'],
+         'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/a:txBody/(a:bod'
+         'yPr,a:p),a:tc/a:txBody/(a:bodyPr,a:p/a:r/a:t"old")),a:tr/(a:tc/a:'
+         'txBody/(a:body'
+         'Pr,a:p/(a:pPr,a:r/a:t"1,234",a:endParaRPr)),a:tc/a:txBody/(a:bodyP'
+         'r,a:p/(a:r/a:t"foo",a:br,a:r/a:t"bar"))))'),
+    ])
+    def write_fixture(self, request):
+        rows, formats, expected_cxml = request.param
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc/a:txBody/(a:'
+            'bodyPr,a:p),a:tc/a:txBody/(a:bodyPr,a:p/a:r/a:t"old")),a:tr/(a:'
+            'tc/a:txBody/(a:bodyPr,a:p/(a:pPr,a:r/a:t"x",a:endParaRPr)),a:tc'
+            '/a:txBody/(a:bodyPr,a:p,a:p)))'
+        )
+        table = Table(tbl, None)
+        expected_xml = xml(expected_cxml)
+        return table, rows, formats, expected_xml
 
-    @pytest.fixture
-    def cell_(self, request):
-        return instance_mock(request, _Cell)
+    @pytest.fixture(params=[
+        [['a', 'b', 'c']],
+        [['a'], ['b'], ['c']],
+    ])
+    def write_raises_fixture(self, request):
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc),a:tr/(a'
+            ':tc,a:tc))'
+        )
+        table = Table(tbl, None)
+        rows = request.param
+        return table, rows
+
+    # fixture components ---------------------------------------------
 
     @pytest.fixture
     def columns_(self, request):
@@ -94,10 +210,6 @@ class DescribeTable(object):
     def graphic_frame_(self, request):
         return instance_mock(request, GraphicFrame)
 
-    @pytest.fixture
-    def row_(self, request):
-        return instance_mock(request, _Row)
-
     @pytest.fixture
     def rows_(self, request):
         return instance_mock(request, _RowCollection)
@@ -314,6 +426,12 @@ class Describe_CellCollection(object):
             assert isinstance(cell, _Cell)
             assert cell._tc is tc
 
+    def it_provides_the_same_cell_object_on_each_access(self):
+        cells = _CellCollection(element('a:tr/(a:tc,a:tc)'), None)
+        cell = cells[1]
+        assert cells[1] is cell
+        assert cells[0] is not cell
+
     def it_raises_on_indexed_access_out_of_range(self):
         cells = _CellCollection(element('a:tr/a:tc'), None)
         with pytest.raises(IndexError):
@@ -478,17 +596,18 @@ class Describe_Row(object):
         parent_.notify_height_changed.assert_called_once_with()
 
     def it_provides_access_to_its_cells(self, cells_fixture):
-        row, _CellCollection_, cells_ = cells_fixture
+        row, cell_proxies, _CellCollection_, cells_ = cells_fixture
         cells = row.cells
-        _CellCollection_.assert_called_once_with(row._tr, row)
+        _CellCollection_.assert_called_once_with(row._tr, row, cell_proxies)
         assert cells is cells_
 
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def cells_fixture(self, _CellCollection_, cells_):
-        row = _Row(element('a:tr'), None)
-        return row, _CellCollection_, cells_
+        cell_proxies = ProxyCache()
+        row = _Row(element('a:tr'), None, cell_proxies)
+        return row, cell_proxies, _CellCollection_, cells_
 
     @pytest.fixture(params=[
         ('a:tr{h=914400}', Inches(1)),
@@ -548,6 +667,13 @@ class Describe_RowCollection(object):
             assert isinstance(row, _Row)
             assert row._tr is tr
 
+    def it_provides_the_same_row_object_on_each_access(self):
+        rows = _RowCollection(element('a:tbl/(a:tr,a:tr)'), None)
+        row = rows[1]
+        assert rows[1] is row
+        assert row.cells is row.cells
+        assert rows[0] is not row
+
     def it_raises_on_indexed_access_out_of_range(self):
         rows = _RowCollection(element('a:tbl/a:tr'), None)
         with pytest.raises(IndexError):
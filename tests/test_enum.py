@@ -90,6 +90,8 @@ class DescribeXmlEnumeration(object):
         assert XMLFOO.to_xml(42) == 'attrVal'
         with pytest.raises(ValueError):
             XMLFOO.to_xml(XMLFOO.RO)
+        with pytest.raises(ValueError):
+            XMLFOO.to_xml([42])
 
     def it_can_map_each_of_its_xml_members_from_the_XML_value(self):
         assert XMLFOO.from_xml(None) is None
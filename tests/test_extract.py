@@ -0,0 +1,210 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.extract module
+"""
+
+from __future__ import absolute_import, print_function
+
+import gzip
+import pytest
+import zipfile
+
+from lxml.etree import XMLSyntaxError
+
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.extract import (
+    iter_text_records, TextIndex, TextPosition, TextRecord
+)
+from pptx.util import Inches
+
+from .unitutil.file import testfile
+
+
+class DescribeIterTextRecords(object):
+
+    def it_generates_a_record_for_each_paragraph(self, pptx_fixture):
+        pkg_file, expected_records = pptx_fixture
+        records = list(iter_text_records(pkg_file))
+        assert records == expected_records
+
+    def it_follows_the_slide_order_of_the_presentation(self, order_fixture):
+        pkg_file, expected_texts = order_fixture
+        records = list(iter_text_records(pkg_file))
+        assert [(r.slide_idx, r.text) for r in records] == expected_texts
+
+    def it_includes_line_breaks_and_table_cells(self, body_fixture):
+        pkg_file, expected_records = body_fixture
+        records = list(iter_text_records(pkg_file))
+        assert records == expected_records
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def body_fixture(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textbox = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        textbox.text_frame.text = 'foo\nbar'
+        textbox.text_frame.add_paragraph().text = 'baz'
+        graphfrm = slide.shapes.add_table(1, 2, 0, 0, Inches(2), Inches(1))
+        graphfrm.table.cell(0, 0).text = 'cell 1'
+        graphfrm.table.cell(0, 1).text = 'cell 2'
+        pkg_file = BytesIO()
+        prs.save(pkg_file)
+        pkg_file.seek(0)
+        expected_records = [
+            TextRecord(0, 2, 'TextBox 1', 0, 'foo\nbar'),
+            TextRecord(0, 2, 'TextBox 1', 1, 'baz'),
+            TextRecord(0, 3, 'Table 2', 0, 'cell 1'),
+            TextRecord(0, 3, 'Table 2', 1, 'cell 2'),
+        ]
+        return pkg_file, expected_records
+
+    @pytest.fixture
+    def order_fixture(self):
+        prs = Presentation()
+        for text in ('first', 'second', 'third'):
+            slide = prs.slides.add_slide(prs.slide_layouts[5])
+            slide.shapes.title.text = text
+        sldIdLst = prs._presentation._element.sldIdLst
+        sldIdLst.insert(0, sldIdLst[2])
+        pkg_file = BytesIO()
+        prs.save(pkg_file)
+        pkg_file.seek(0)
+        expected_texts = [(0, 'third'), (1, 'first'), (2, 'second')]
+        return pkg_file, expected_texts
+
+    @pytest.fixture
+    def pptx_fixture(self):
+        pkg_file = testfile('test.pptx')
+        expected_records = [
+            TextRecord(0, 2, 'Title 1', 0, 'Presentation Title Text'),
+            TextRecord(0, 3, 'Subtitle 2', 0, 'Subtitle Text'),
+        ]
+        return pkg_file, expected_records
+
+
+class DescribeTextIndex(object):
+
+    def it_finds_the_paragraphs_containing_all_terms(self, index_fixture):
+        index = index_fixture
+        assert index.search('Revenue') == [
+            TextPosition('a', 0, 2, 0),
+            TextPosition('a', 1, 2, 1),
+            TextPosition('b', 0, 2, 0),
+        ]
+        assert index.search('revenue, GREW') == [TextPosition('a', 0, 2, 0)]
+        assert index.search('revenue fell') == [TextPosition('b', 0, 2, 0)]
+        assert index.search('grew fell') == []
+        assert index.search('  ...') == []
+
+    def it_knows_the_decks_it_indexes(self, index_fixture):
+        index = index_fixture
+        assert index.decks == ('a', 'b')
+
+    def it_indexes_a_deck_by_its_path(self):
+        index = TextIndex()
+        pkg_file = testfile('test.pptx')
+        index.add(pkg_file)
+        assert index.decks == (pkg_file,)
+        assert index.search('subtitle') == [TextPosition(pkg_file, 0, 3, 0)]
+
+    def it_can_save_and_load_itself(self, index_fixture, tmpdir):
+        path = str(tmpdir.join('index.gz'))
+        index_fixture.save(path)
+        index = TextIndex.load(path)
+        assert index.decks == ('a', 'b')
+        assert index.search('revenue') == index_fixture.search('revenue')
+
+    def it_raises_on_a_missing_or_duplicate_deck_name(self, index_fixture):
+        with pytest.raises(ValueError):
+            index_fixture.add(BytesIO())
+        with pytest.raises(ValueError):
+            index_fixture.add(BytesIO(), 'a')
+
+    def it_is_unchanged_by_a_deck_it_cannot_read(self, index_fixture):
+        index = index_fixture
+        bad_pkg_file = self._corrupted(
+            self._pkg_file(['revenue rose', 'costs']), 'slide2.xml'
+        )
+        with pytest.raises(XMLSyntaxError):
+            index.add(bad_pkg_file, 'c')
+        assert index.decks == ('a', 'b')
+        assert len(index.search('revenue')) == 3
+        index.add(self._pkg_file(['revenue rose']), 'c')
+        assert index.search('rose') == [TextPosition('c', 0, 2, 0)]
+
+    def it_raises_on_an_incompatible_index_file(self, tmpdir):
+        path = str(tmpdir.join('index.gz'))
+        with gzip.open(path, 'wb') as f:
+            f.write(b'{"version": 0}')
+        with pytest.raises(ValueError):
+            TextIndex.load(path)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def index_fixture(self):
+        index = TextIndex()
+        index.add(self._pkg_file(['Revenue grew', 'Costs\nrevenue']), 'a')
+        index.add(self._pkg_file(['revenue fell 3%']), 'b')
+        return index
+
+    # fixture components ---------------------------------------------
+
+    @staticmethod
+    def _corrupted(pkg_file, filename):
+        """
+        Return a copy of the package in *pkg_file* in which the part whose
+        name ends with *filename* is not well-formed XML.
+        """
+        corrupted_file = BytesIO()
+        with zipfile.ZipFile(pkg_file) as src:
+            with zipfile.ZipFile(corrupted_file, 'w') as dst:
+                for info in src.infolist():
+                    blob = src.read(info.filename)
+                    if info.filename.endswith(filename):
+                        blob = blob[:len(blob)//2]
+                    dst.writestr(info, blob)
+        corrupted_file.seek(0)
+        return corrupted_file
+
+    @staticmethod
+    def _pkg_file(slide_texts):
+        """
+        Return a file-like object containing a deck having a slide with
+        a text box for each of *slide_texts*. Lines of a text become
+        paragraphs.
+        """
+        prs = Presentation()
+        for text in slide_texts:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            textbox = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+            textbox.text_frame.set_paragraphs(text.split('\n'))
+        pkg_file = BytesIO()
+        prs.save(pkg_file)
+        pkg_file.seek(0)
+        return pkg_file
+
+
+class DescribeTextPosition(object):
+
+    def it_provides_access_to_its_fields(self):
+        position = TextPosition('deck.pptx', 1, 42, 3)
+        assert position.deck == 'deck.pptx'
+        assert position.slide_idx == 1
+        assert position.shape_id == 42
+        assert position.paragraph_idx == 3
+
+
+class DescribeTextRecord(object):
+
+    def it_provides_access_to_its_fields(self):
+        record = TextRecord(1, 42, 'Title 1', 3, 'foobar')
+        assert record.slide_idx == 1
+        assert record.shape_id == 42
+        assert record.shape_name == 'Title 1'
+        assert record.paragraph_idx == 3
+        assert record.text == 'foobar'
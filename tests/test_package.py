@@ -8,13 +8,17 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.extract import iter_text_records
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part, _Relationship
 from pptx.opc.packuri import PackURI
-from pptx.package import _ImageParts, Package
+from pptx.package import _ImageParts, _MemoryBudget, Package
 from pptx.parts.coreprops import CoreProperties
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.presentation import PresentationPart
+from pptx.parts.slide import Slide
 
 
 from .unitutil.file import absjoin
@@ -244,3 +248,119 @@ class Describe_ImageParts(object):
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
+
+
+class Describe_MemoryBudget(object):
+
+    def it_has_no_limit_by_default(self, request, package_):
+        memory_budget = _MemoryBudget(package_)
+        slide_ = instance_mock(request, Slide)
+        memory_budget.touch(slide_)
+        assert memory_budget.max_parsed_slides is None
+        assert not slide_.evict.called
+
+    def it_evicts_only_slides_that_have_been_released(self, evict_fixture):
+        memory_budget, slide_, slide_2_, slide_3_ = evict_fixture
+        memory_budget.touch(slide_)
+        memory_budget.touch(slide_2_)
+        memory_budget.touch(slide_3_)
+        assert memory_budget.evictions == 0
+        memory_budget.release(slide_2_)
+        slide_2_.evict.assert_called_once_with()
+        assert not slide_.evict.called
+        assert not slide_3_.evict.called
+        assert memory_budget.evictions == 1
+
+    def it_evicts_the_earliest_released_slide(self, evict_fixture):
+        memory_budget, slide_, slide_2_, slide_3_ = evict_fixture
+        memory_budget.touch(slide_)
+        memory_budget.touch(slide_2_)
+        memory_budget.release(slide_2_)
+        memory_budget.release(slide_)
+        memory_budget.touch(slide_3_)
+        slide_2_.evict.assert_called_once_with()
+        assert not slide_.evict.called
+        assert memory_budget.evictions == 1
+
+    def it_keeps_a_released_slide_that_is_used_again(self, evict_fixture):
+        memory_budget, slide_, slide_2_, slide_3_ = evict_fixture
+        memory_budget.touch(slide_)
+        memory_budget.touch(slide_2_)
+        memory_budget.release(slide_)
+        memory_budget.touch(slide_)
+        memory_budget.touch(slide_3_)
+        assert not slide_.evict.called
+        assert memory_budget.evictions == 0
+
+    def it_can_stop_tracking_a_slide(self, evict_fixture):
+        memory_budget, slide_, slide_2_, slide_3_ = evict_fixture
+        memory_budget.touch(slide_)
+        memory_budget.touch(slide_2_)
+        memory_budget.release(slide_)
+        memory_budget.discard(slide_)
+        memory_budget.touch(slide_3_)
+        memory_budget.release(slide_)
+        assert not slide_.evict.called
+        assert not slide_2_.evict.called
+        assert memory_budget.evictions == 0
+
+    def it_raises_on_a_budget_less_than_one(self, package_):
+        memory_budget = _MemoryBudget(package_)
+        with pytest.raises(ValueError):
+            memory_budget.max_parsed_slides = 0
+
+    def it_keeps_slide_content_across_evictions(self):
+        prs = Presentation()
+        prs.memory_budget.max_parsed_slides = 2
+        memory_budget = prs.memory_budget
+        for idx in range(5):
+            slide = prs.slides.add_slide(prs.slide_layouts[5])
+            slide.shapes.title.text = 'Slide %d' % idx
+            memory_budget.release(slide)
+        assert memory_budget.evictions == 3
+        assert [s.is_evicted for s in prs.slides] == [
+            True, True, True, False, False
+        ]
+
+        assert prs.slides[0].shapes.title.text == 'Slide 0'
+        assert memory_budget.reparses == 1
+
+        pkg_file = BytesIO()
+        prs.save(pkg_file)
+        pkg_file.seek(0)
+        texts = [r.text for r in iter_text_records(pkg_file)]
+        assert texts == ['Slide %d' % idx for idx in range(5)]
+
+    def it_does_not_evict_a_slide_still_in_use(self):
+        prs = Presentation()
+        for _ in range(2):
+            prs.slides.add_slide(prs.slide_layouts[5])
+        prs.memory_budget.max_parsed_slides = 1
+        title = prs.slides[0].shapes.title
+        prs.slides[1].shapes.title.text = 'Slide 1'
+        title.text = 'Slide 0'
+
+        pkg_file = BytesIO()
+        prs.save(pkg_file)
+        pkg_file.seek(0)
+        texts = [r.text for r in iter_text_records(pkg_file)]
+        assert texts == ['Slide 0', 'Slide 1']
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def evict_fixture(self, request, package_):
+        package_.iter_parts.return_value = iter(())
+        memory_budget = _MemoryBudget(package_)
+        memory_budget.max_parsed_slides = 2
+        slide_, slide_2_, slide_3_ = (
+            instance_mock(request, Slide), instance_mock(request, Slide),
+            instance_mock(request, Slide)
+        )
+        return memory_budget, slide_, slide_2_, slide_3_
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def package_(self, request):
+        return instance_mock(request, Package)
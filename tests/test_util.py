@@ -8,9 +8,16 @@ from __future__ import absolute_import
 
 import platform
 import pytest
+import threading
+import time
 
 from pptx.compat import to_unicode
-from pptx.util import Length, Centipoints, Cm, Emu, Inches, Mm, Pt, Px
+from pptx.util import (
+    Length, Centipoints, Cm, Emu, Inches, LruCache, Mm, ProxyCache, Pt, Px
+)
+
+from .unitutil.cxml import element
+from .unitutil.mock import Mock
 
 
 def test_to_unicode_raises_on_non_string():
@@ -62,3 +69,113 @@ class DescribeLength(object):
     def units_fixture(self, request):
         emu, units_prop_name, expected_length_in_units = request.param
         return emu, units_prop_name, expected_length_in_units
+
+
+class DescribeLruCache(object):
+
+    def it_computes_a_missing_value_once(self):
+        cache = LruCache(2)
+        factory_ = Mock(side_effect=lambda key: key * 2)
+        assert cache.get_or_add('a', factory_) == 'aa'
+        assert cache.get_or_add('a', factory_) == 'aa'
+        factory_.assert_called_once_with('a')
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def it_discards_the_least_recently_used_value(self):
+        cache = LruCache(2)
+        cache.setdefault('a', 1)
+        cache.setdefault('b', 2)
+        cache.get('a')
+        cache.setdefault('c', 3)
+        assert len(cache) == 2
+        assert cache.get('b') is None
+        assert (cache.get('a'), cache.get('c')) == (1, 3)
+
+    def it_keeps_the_value_already_cached_for_a_key(self):
+        cache = LruCache(2)
+        assert cache.setdefault('a', 1) == 1
+        assert cache.setdefault('a', 2) == 1
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def it_discards_values_when_its_capacity_is_reduced(self):
+        cache = LruCache(3)
+        for key in 'abc':
+            cache.setdefault(key, key)
+        cache.capacity = 1
+        assert cache.capacity == 1
+        assert len(cache) == 1
+        assert cache.get('c') == 'c'
+
+    def it_can_discard_its_values(self):
+        cache = LruCache(2)
+        cache.setdefault('a', 1)
+        cache.get('a')
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def it_computes_a_value_once_for_concurrent_callers(self):
+        cache = LruCache(2)
+        calls = []
+
+        def factory(key):
+            calls.append(key)
+            time.sleep(0.01)
+            return key
+
+        threads = [
+            threading.Thread(target=cache.get_or_add, args=('a', factory))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == ['a']
+
+
+class DescribeProxyCache(object):
+
+    def it_provides_the_same_proxy_for_the_same_element(self, cache_fixture):
+        proxy_cache, p, factory_ = cache_fixture
+        proxy = proxy_cache.get_or_add(p, factory_)
+        assert proxy_cache.get_or_add(p, factory_) is proxy
+        factory_.assert_called_once_with(p)
+        assert len(proxy_cache) == 1
+
+    def it_prunes_the_proxies_of_removed_elements(self, cache_fixture):
+        proxy_cache, factory_ = cache_fixture[0], cache_fixture[2]
+        txBody = element('a:txBody/(a:p,a:p/a:r,a:p)')
+        p, p_2, p_3 = txBody.p_lst
+        r = p_2.r_lst[0]
+        for elm in (p, p_2, p_3, r):
+            proxy_cache.get_or_add(elm, factory_)
+        txBody.remove(p)
+        txBody.remove(p_2)
+        assert len(proxy_cache) == 1
+        assert proxy_cache.get_or_add(p_3, factory_) is not None
+        assert factory_.call_count == 4
+
+    def it_prunes_as_it_grows(self, cache_fixture):
+        proxy_cache, factory_ = cache_fixture[0], cache_fixture[2]
+        txBody = element('a:txBody')
+        for _ in range(200):
+            p = txBody.add_p()
+            proxy_cache.get_or_add(p, factory_)
+            txBody.remove(p)
+        assert len(proxy_cache._proxies) <= 64
+
+    def it_can_discard_its_proxies(self, cache_fixture):
+        proxy_cache, p, factory_ = cache_fixture
+        proxy_cache.get_or_add(p, factory_)
+        proxy_cache.clear()
+        assert len(proxy_cache) == 0
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def cache_fixture(self):
+        proxy_cache = ProxyCache()
+        p = element('a:p')
+        factory_ = Mock(side_effect=lambda elm: Mock(name='proxy'))
+        return proxy_cache, p, factory_
@@ -6,37 +6,83 @@ Test suite for pptx.text.fonts module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-import io
+import mmap
+import os
 import pytest
+import threading
 
-from struct import calcsize
+from struct import pack
 
-from pptx.compat import BytesIO
 from pptx.text.fonts import (
-    _BaseTable, _Font, FontFiles, _HeadTable, _NameTable, _Stream,
-    _TableFactory
+    _BaseTable, _CmapTable, _Font, FontFiles, _FontIndex, _HeadTable,
+    _HheaTable, _HmtxTable, _NameTable, _Stream, _TableFactory
 )
+from pptx.util import LruCache
 
 from ..unitutil.file import test_file_dir, testfile
 from ..unitutil.mock import (
-    call, class_mock, function_mock, initializer_mock, instance_mock,
-    method_mock, open_mock, property_mock, var_mock
+    call, class_mock, function_mock, instance_mock, method_mock,
+    property_mock, var_mock
 )
 
 
 class DescribeFontFiles(object):
 
     def it_can_find_a_system_font_file(self, find_fixture):
-        family_name, is_bold, is_italic, expected_path = find_fixture
+        family_name, is_bold, is_italic, expected_path = find_fixture[:4]
+        _FontIndex_, index_ = find_fixture[4:]
         path = FontFiles.find(family_name, is_bold, is_italic)
+        _FontIndex_.load.assert_called_once_with('index.json')
+        FontFiles._iter_installed_fonts.assert_called_once_with(index_)
+        index_.save.assert_called_once_with()
         assert path == expected_path
 
+    def it_stops_scanning_when_the_font_is_found(self, find_fixture):
+        FontFiles.find('Foobar', False, False)
+        assert list(FontFiles._remaining_fonts) == [
+            (('Foobar', True, False), 'foobarb.ttf'),
+            (('Barfoo', False, True), 'barfooi.ttf'),
+        ]
+
+    def it_remembers_the_fonts_it_has_seen(self, find_fixture):
+        index_ = find_fixture[5]
+        FontFiles.find('Foobar', True, False)
+        path = FontFiles.find('Foobar', False, False)
+        assert path == 'foobar.ttf'
+        assert index_.save.call_count == 1
+
+    def it_raises_when_the_font_is_not_installed(self, find_fixture):
+        with pytest.raises(KeyError):
+            FontFiles.find('Foobar', True, True)
+
+    def it_scans_again_for_fonts_it_has_discarded(self, find_fixture):
+        FontFiles._font_files.capacity = 2
+        FontFiles.find('Barfoo', False, True)
+        path = FontFiles.find('Foobar', False, False)
+        assert path == 'foobar.ttf'
+        assert FontFiles._iter_installed_fonts.call_count == 2
+        with pytest.raises(KeyError):
+            FontFiles.find('Foobar', True, True)
+
+    def it_remembers_the_fonts_it_did_not_find(self, find_fixture):
+        index_ = find_fixture[5]
+        FontFiles._font_files.capacity = 2
+        index_.is_current.return_value = True
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                FontFiles.find('Foobar', True, True)
+        assert FontFiles._iter_installed_fonts.call_count == 2
+
+        index_.is_current.return_value = False
+        with pytest.raises(KeyError):
+            FontFiles.find('Foobar', True, True)
+        assert FontFiles._iter_installed_fonts.call_count == 4
+
     def it_catalogs_the_system_fonts_to_help_find(self, installed_fixture):
-        expected_call_args, expected_values = installed_fixture
-        installed_fonts = FontFiles._installed_fonts()
-        assert FontFiles._iter_font_files_in.call_args_list == (
-            expected_call_args
-        )
+        index_, expected_call_args, expected_values = installed_fixture
+        installed_fonts = list(FontFiles._iter_installed_fonts(index_))
+        assert index_.iter_fonts_in.call_args_list == expected_call_args
+        index_.prune.assert_called_once_with()
         assert installed_fonts == expected_values
 
     def it_generates_font_dirs_to_help_find(self, font_dirs_fixture):
@@ -54,14 +100,14 @@ class DescribeFontFiles(object):
         font_dirs = FontFiles._windows_font_directories()
         assert font_dirs == expected_dirs
 
-    def it_iterates_over_fonts_in_dir_to_help_find(self, iter_fixture):
-        directory, _Font_, expected_calls, expected_paths = iter_fixture
-        paths = list(FontFiles._iter_font_files_in(directory))
-
-        print(directory)
+    def it_knows_linux_font_dirs_to_help_find(self, linux_dirs_fixture):
+        expected_dirs = linux_dirs_fixture
+        font_dirs = FontFiles._linux_font_directories()
+        assert font_dirs == expected_dirs
 
-        assert _Font_.open.call_args_list == expected_calls
-        assert paths == expected_paths
+    def it_knows_where_to_save_the_font_index(self, index_path_fixture):
+        expected_path = index_path_fixture
+        assert FontFiles._index_path() == expected_path
 
     # fixtures ---------------------------------------------
 
@@ -70,50 +116,90 @@ class DescribeFontFiles(object):
         ('Foobar', True,  False, 'foobarb.ttf'),
         ('Barfoo', False, True,  'barfooi.ttf'),
     ])
-    def find_fixture(self, request, _installed_fonts_):
+    def find_fixture(self, request, _iter_installed_fonts_, _index_path_):
         family_name, is_bold, is_italic, expected_path = request.param
-        return family_name, is_bold, is_italic, expected_path
+        _FontIndex_ = class_mock(request, 'pptx.text.fonts._FontIndex')
+        index_ = _FontIndex_.load.return_value
+        _index_path_.return_value = 'index.json'
+        font_files, font_index = FontFiles._font_files, FontFiles._font_index
+        missing_fonts = FontFiles._missing_fonts
+
+        def restore():
+            FontFiles._font_files = font_files
+            FontFiles._font_index = font_index
+            FontFiles._missing_fonts = missing_fonts
+
+        FontFiles._font_files, FontFiles._font_index = LruCache(1024), None
+        FontFiles._missing_fonts = set()
+        request.addfinalizer(restore)
+        return (
+            family_name, is_bold, is_italic, expected_path, _FontIndex_,
+            index_
+        )
 
     @pytest.fixture(params=[
         ('darwin', ['a', 'b']),
         ('win32',  ['c', 'd']),
+        ('linux2', ['e', 'f']),
     ])
     def font_dirs_fixture(
             self, request, _os_x_font_directories_,
-            _windows_font_directories_):
+            _windows_font_directories_, _linux_font_directories_):
         platform, expected_dirs = request.param
         dirs_meth_mock = {
             'darwin': _os_x_font_directories_,
             'win32':  _windows_font_directories_,
+            'linux2': _linux_font_directories_,
         }[platform]
         sys_ = var_mock(request, 'pptx.text.fonts.sys')
         sys_.platform = platform
         dirs_meth_mock.return_value = expected_dirs
         return expected_dirs
 
+    @pytest.fixture(params=[
+        ('linux', {'XDG_CACHE_HOME': '/xdg', 'HOME': '/home/fbar'},
+         '/xdg/python-pptx/font-index.json'),
+        ('linux', {'HOME': '/home/fbar'},
+         '/home/fbar/.cache/python-pptx/font-index.json'),
+        ('darwin', {}, None),
+        ('win32', {'LOCALAPPDATA': '/appdata', 'HOME': '/home/fbar'},
+         '/appdata/python-pptx/font-index.json'),
+    ])
+    def index_path_fixture(self, request):
+        platform, environ, expected_path = request.param
+        sys_ = var_mock(request, 'pptx.text.fonts.sys')
+        sys_.platform = platform
+        os_ = var_mock(request, 'pptx.text.fonts.os')
+        os_.path = os.path
+        os_.environ = environ
+        return expected_path
+
     @pytest.fixture
-    def installed_fixture(self, _iter_font_files_in_, _font_directories_):
+    def installed_fixture(self, request, _font_directories_):
+        index_ = instance_mock(request, _FontIndex)
         _font_directories_.return_value = ['d', 'd_2']
-        _iter_font_files_in_.side_effect = [
+        index_.iter_fonts_in.side_effect = [
             [(('A', True,  False), 'a.ttf')],
             [(('B', False, True),  'b.ttf')],
         ]
         expected_call_args = [call('d'), call('d_2')]
-        expected_values = {
-            ('A', True,  False): 'a.ttf',
-            ('B', False, True):  'b.ttf',
-        }
-        return expected_call_args, expected_values
+        expected_values = [
+            (('A', True,  False), 'a.ttf'),
+            (('B', False, True),  'b.ttf'),
+        ]
+        return index_, expected_call_args, expected_values
 
     @pytest.fixture
-    def iter_fixture(self, _Font_):
-        directory = test_file_dir
-        font_file_path = testfile('calibriz.ttf')
-        font = _Font_.open.return_value.__enter__.return_value
-        font.family_name, font.is_bold, font.is_italic = 'Arial', True, True
-        expected_calls = [call(font_file_path)]
-        expected_paths = [(('Arial', True, True), font_file_path)]
-        return directory, _Font_, expected_calls, expected_paths
+    def linux_dirs_fixture(self, request):
+        os_ = var_mock(request, 'pptx.text.fonts.os')
+        os_.path = os.path
+        os_.environ = {'HOME': '/home/fbar'}
+        return [
+            '/usr/share/fonts',
+            '/usr/local/share/fonts',
+            '/home/fbar/.local/share/fonts',
+            '/home/fbar/.fonts',
+        ]
 
     @pytest.fixture
     def osx_dirs_fixture(self, request):
@@ -144,20 +230,24 @@ class DescribeFontFiles(object):
         return method_mock(request, FontFiles, '_font_directories')
 
     @pytest.fixture
-    def _installed_fonts_(self, request):
-        _installed_fonts_ = method_mock(
-            request, FontFiles, '_installed_fonts'
+    def _iter_installed_fonts_(self, request):
+        _iter_installed_fonts_ = method_mock(
+            request, FontFiles, '_iter_installed_fonts'
         )
-        _installed_fonts_.return_value = {
-            ('Foobar',  False, False): 'foobar.ttf',
-            ('Foobar',  True,  False): 'foobarb.ttf',
-            ('Barfoo',  False, True):  'barfooi.ttf',
-        }
-        return _installed_fonts_
+        _iter_installed_fonts_.side_effect = lambda index: iter([
+            (('Foobar', False, False), 'foobar.ttf'),
+            (('Foobar', True,  False), 'foobarb.ttf'),
+            (('Barfoo', False, True),  'barfooi.ttf'),
+        ])
+        return _iter_installed_fonts_
+
+    @pytest.fixture
+    def _index_path_(self, request):
+        return method_mock(request, FontFiles, '_index_path')
 
     @pytest.fixture
-    def _iter_font_files_in_(self, request):
-        return method_mock(request, FontFiles, '_iter_font_files_in')
+    def _linux_font_directories_(self, request):
+        return method_mock(request, FontFiles, '_linux_font_directories')
 
     @pytest.fixture
     def _os_x_font_directories_(self, request):
@@ -168,6 +258,149 @@ class DescribeFontFiles(object):
         return method_mock(request, FontFiles, '_windows_font_directories')
 
 
+class Describe_FontIndex(object):
+
+    def it_parses_the_fonts_in_a_directory(self, scan_fixture):
+        index_path, _Font_, expected_calls, expected_fonts = scan_fixture
+        index = _FontIndex.load(index_path)
+        fonts = list(index.iter_fonts_in(test_file_dir))
+        assert _Font_.open.call_args_list == expected_calls
+        assert fonts == expected_fonts
+
+    def it_reuses_saved_fonts_for_an_unchanged_dir(self, scan_fixture):
+        index_path, _Font_, _, expected_fonts = scan_fixture
+        index = _FontIndex.load(index_path)
+        list(index.iter_fonts_in(test_file_dir))
+        index.save()
+        _Font_.reset_mock()
+
+        index = _FontIndex.load(index_path)
+        fonts = list(index.iter_fonts_in(test_file_dir))
+
+        assert _Font_.open.call_count == 0
+        assert fonts == expected_fonts
+
+    def it_rescans_a_dir_whose_mtime_changed(self, scan_fixture):
+        index_path, _Font_, expected_calls, expected_fonts = scan_fixture
+        index = _FontIndex.load(index_path)
+        list(index.iter_fonts_in(test_file_dir))
+        dirpath = os.path.abspath(test_file_dir)
+        index._entries[dirpath][0] -= 1.0
+        index.save()
+        _Font_.reset_mock()
+
+        index = _FontIndex.load(index_path)
+        fonts = list(index.iter_fonts_in(test_file_dir))
+
+        assert _Font_.open.call_args_list == expected_calls
+        assert fonts == expected_fonts
+
+    def it_prunes_dirs_it_has_not_seen(self, scan_fixture):
+        index_path = scan_fixture[0]
+        index = _FontIndex(index_path, {'/gone': [1.0, []]})
+        list(index.iter_fonts_in(test_file_dir))
+        index.prune()
+        assert '/gone' not in index._entries
+        assert os.path.abspath(test_file_dir) in index._entries
+
+    def it_parses_only_as_far_as_the_caller_reads(
+            self, scan_fixture, tmpdir):
+        index_path, _Font_ = scan_fixture[:2]
+        font_dir = tmpdir.mkdir('fonts')
+        for dirname in ('a', 'b'):
+            subdir = font_dir.mkdir(dirname)
+            for filename in ('1.ttf', '2.ttf', '3.ttf'):
+                subdir.join(filename).write('')
+        thread_count = threading.active_count()
+        index = _FontIndex.load(index_path)
+        index._batch_size = 2
+
+        fonts = index.iter_fonts_in(str(font_dir))
+        next(fonts)
+
+        assert _Font_.open.call_count == 3
+        assert threading.active_count() == thread_count
+        assert len(list(fonts)) == 5
+        assert _Font_.open.call_count == 6
+
+    def it_shares_one_thread_pool_while_parsing(
+            self, scan_fixture, tmpdir, request):
+        index_path, _Font_ = scan_fixture[:2]
+        font_dir = tmpdir.mkdir('fonts')
+        for dirname in ('a', 'b'):
+            subdir = font_dir.mkdir(dirname)
+            for filename in ('1.ttf', '2.ttf', '3.ttf'):
+                subdir.join(filename).write('')
+        ThreadPool_ = class_mock(request, 'pptx.text.fonts.ThreadPool')
+        pool_ = ThreadPool_.return_value
+        pool_.map.side_effect = lambda f, paths: [f(p) for p in paths]
+        index = _FontIndex.load(index_path)
+        index._batch_size = 2
+
+        with index.parsing():
+            fonts = list(index.iter_fonts_in(str(font_dir)))
+
+        assert len(fonts) == 6
+        assert pool_.map.call_count == 4
+        ThreadPool_.assert_called_once_with(index._thread_count)
+        pool_.terminate.assert_called_once_with()
+
+    def it_knows_when_a_directory_has_changed(self, scan_fixture):
+        index_path = scan_fixture[0]
+        index = _FontIndex.load(index_path)
+        list(index.iter_fonts_in(test_file_dir))
+        assert index.is_current() is True
+        index._entries[os.path.abspath(test_file_dir)][0] -= 1.0
+        assert index.is_current() is False
+
+    def it_replaces_the_index_file_in_one_step(self, save_fixture, request):
+        index, index_path = save_fixture
+        with open(index_path, 'w') as f:
+            f.write('{}')
+        remove_ = function_mock(request, 'os.remove')
+        index.save()
+        assert remove_.call_count == 0
+        assert _FontIndex.load(index_path)._entries == {'/fonts': [1.0, []]}
+
+    def it_removes_its_temporary_file_when_saving_fails(
+            self, save_fixture, request):
+        index, index_path = save_fixture
+        function_mock(
+            request, 'pptx.text.fonts.json.dump', side_effect=IOError
+        )
+        index.save()
+        assert os.listdir(os.path.dirname(index_path)) == []
+
+    def it_starts_empty_when_the_index_file_is_unusable(self, tmpdir):
+        index_path = str(tmpdir.join('font-index.json'))
+        with open(index_path, 'w') as f:
+            f.write('{"version": 1, "directo')
+        index = _FontIndex.load(index_path)
+        assert index._entries == {}
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def save_fixture(self, tmpdir):
+        index_path = str(tmpdir.mkdir('cache').join('font-index.json'))
+        index = _FontIndex(index_path, {'/fonts': [1.0, []]})
+        index._is_changed = True
+        return index, index_path
+
+    @pytest.fixture
+    def scan_fixture(self, request, tmpdir):
+        index_path = str(tmpdir.join('cache', 'font-index.json'))
+        _Font_ = class_mock(request, 'pptx.text.fonts._Font')
+        font = _Font_.open.return_value.__enter__.return_value
+        font.family_name, font.is_bold, font.is_italic = 'Arial', True, True
+        font_file_path = os.path.join(
+            os.path.abspath(test_file_dir), 'calibriz.ttf'
+        )
+        expected_calls = [call(font_file_path)]
+        expected_fonts = [(('Arial', True, True), font_file_path)]
+        return index_path, _Font_, expected_calls, expected_fonts
+
+
 class Describe_Font(object):
 
     def it_can_construct_from_a_font_file_path(self, open_fixture):
@@ -177,6 +410,18 @@ class Describe_Font(object):
             assert isinstance(f, _Font)
         stream_.close.assert_called_once_with()
 
+    def it_knows_the_advance_width_of_each_character(self, advance_fixture):
+        font, expected_value = advance_fixture
+        assert font.advance_widths == expected_value
+        assert font.default_advance_width == 10
+
+    def it_knows_its_metrics(self):
+        with _Font.open(testfile('calibriz.ttf')) as f:
+            assert f.units_per_em == 2048
+            assert f.ascender == 1950
+            assert f.descender == -550
+            assert f.advance_widths[ord('T')] == 1014
+
     def it_knows_its_family_name(self, family_fixture):
         font, expected_name = family_fixture
         family_name = font.family_name
@@ -213,6 +458,21 @@ class Describe_Font(object):
 
     # fixtures ---------------------------------------------
 
+    @pytest.fixture
+    def advance_fixture(self, request, _tables_):
+        cmap_table_ = instance_mock(request, _CmapTable)
+        hhea_table_ = instance_mock(request, _HheaTable)
+        hmtx_table_ = instance_mock(request, _HmtxTable)
+        cmap_table_.glyph_ids = {65: 1, 66: 2, 67: 5}
+        hhea_table_.hmetric_count = 3
+        hmtx_table_.advance_widths.return_value = (10, 20, 30)
+        _tables_.return_value = {
+            'cmap': cmap_table_, 'hhea': hhea_table_, 'hmtx': hmtx_table_
+        }
+        font = _Font(None)
+        expected_value = {65: 20, 66: 30, 67: 30}
+        return font, expected_value
+
     @pytest.fixture(params=[
         ('head', True,  True),
         ('head', False, False),
@@ -347,74 +607,33 @@ class Describe_Font(object):
 
 class Describe_Stream(object):
 
-    def it_can_construct_from_a_path(self, open_fixture):
-        path, open_, _init_, file_ = open_fixture
-        stream = _Stream.open(path)
-        open_.assert_called_once_with(path, 'rb')
-        _init_.assert_called_once_with(file_)
+    def it_can_construct_from_a_path(self):
+        stream = _Stream.open(testfile('calibriz.ttf'))
         assert isinstance(stream, _Stream)
+        assert isinstance(stream._bufr, mmap.mmap)
 
-    def it_can_be_closed(self, close_fixture):
-        stream, file_ = close_fixture
-        stream.close()
-        file_.close.assert_called_once_with()
-
-    def it_can_read_fields_from_a_template(self, read_flds_fixture):
-        stream, tmpl, offset, file_, expected_values = read_flds_fixture
-        fields = stream.read_fields(tmpl, offset)
-        file_.seek.assert_called_once_with(offset)
-        file_.read.assert_called_once_with(calcsize(tmpl))
-        assert fields == expected_values
-
-    def it_can_read_bytes(self, read_fixture):
-        stream, offset, length, file_, expected_value = read_fixture
-        bytes_ = stream.read(offset, length)
-        file_.seek.assert_called_once_with(offset)
-        file_.read.assert_called_once_with(length)
-        assert bytes_ == expected_value
-
-    # fixtures ---------------------------------------------
-
-    @pytest.fixture
-    def close_fixture(self, file_):
-        stream = _Stream(file_)
-        return stream, file_
-
-    @pytest.fixture
-    def open_fixture(self, open_, _init_):
-        path = 'foobar.ttf'
-        file_ = open_.return_value
-        return path, open_, _init_, file_
-
-    @pytest.fixture
-    def read_fixture(self, file_):
-        stream = _Stream(file_)
-        offset, length = 42, 21
-        file_.read.return_value = 'foobar'
-        expected_value = 'foobar'
-        return stream, offset, length, file_, expected_value
-
-    @pytest.fixture
-    def read_flds_fixture(self, file_):
-        stream = _Stream(file_)
-        tmpl, offset = b'>4sHH', 0
-        file_.read.return_value = b'foob' b'\x00\x2A' b'\x00\x15'
-        expected_values = (b'foob', 42, 21)
-        return stream, tmpl, offset, file_, expected_values
+    def it_reads_an_empty_file_into_memory(self, tmpdir):
+        path = str(tmpdir.join('empty.ttf'))
+        open(path, 'wb').close()
+        stream = _Stream.open(path)
+        assert stream._bufr == b''
 
-    # fixture components -----------------------------------
+    def it_can_be_closed(self):
+        stream = _Stream.open(testfile('calibriz.ttf'))
+        bufr = stream._bufr
+        stream.close()
+        assert stream._bufr is None
+        with pytest.raises(ValueError):
+            bufr[0]
 
-    @pytest.fixture
-    def file_(self, request):
-        return instance_mock(request, io.RawIOBase)
+    def it_can_read_fields_from_a_template(self):
+        stream = _Stream(b'xx' b'foob' b'\x00\x2A' b'\x00\x15')
+        fields = stream.read_fields(b'>4sHH', 2)
+        assert fields == (b'foob', 42, 21)
 
-    @pytest.fixture
-    def _init_(self, request):
-        return initializer_mock(request, _Stream)
-
-    @pytest.fixture
-    def open_(self, request):
-        return open_mock(request, 'pptx.text.fonts')
+    def it_can_read_bytes(self):
+        stream = _Stream(b'xxfoobar')
+        assert stream.read(2, 3) == b'foo'
 
 
 class Describe_TableFactory(object):
@@ -427,13 +646,16 @@ class Describe_TableFactory(object):
 
     # fixtures ---------------------------------------------
 
-    @pytest.fixture(params=['name', 'head', 'foob'])
+    @pytest.fixture(params=['name', 'head', 'cmap', 'hhea', 'hmtx', 'foob'])
     def fixture(self, request, stream_):
         tag = request.param
         offset, length = 42, 21
         TableClass, target = {
             'name': (_NameTable, 'pptx.text.fonts._NameTable'),
             'head': (_HeadTable, 'pptx.text.fonts._HeadTable'),
+            'cmap': (_CmapTable, 'pptx.text.fonts._CmapTable'),
+            'hhea': (_HheaTable, 'pptx.text.fonts._HheaTable'),
+            'hmtx': (_HmtxTable, 'pptx.text.fonts._HmtxTable'),
             'foob': (_BaseTable, 'pptx.text.fonts._BaseTable'),
         }[tag]
         TableClass_ = class_mock(request, target)
@@ -446,6 +668,45 @@ class Describe_TableFactory(object):
         return instance_mock(request, _Stream)
 
 
+class Describe_CmapTable(object):
+
+    def it_maps_characters_to_glyph_ids(self, glyph_ids_fixture):
+        cmap_table, expected_value = glyph_ids_fixture
+        assert cmap_table.glyph_ids == expected_value
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        (False, {65: 1, 66: 2, 97: 5}),
+        (True,  {0x1F600: 10, 0x1F601: 11}),
+    ])
+    def glyph_ids_fixture(self, request):
+        has_format_12, expected_value = request.param
+        # segments 'A'-'B' by delta, 'a'-'b' by glyph id array, and the
+        # required final 0xFFFF segment
+        format_4 = pack(
+            '>HHHHHHH3HH3H3h3H2H', 4, 46, 0, 6, 4, 1, 2,
+            66, 98, 0xFFFF, 0, 65, 97, 0xFFFF, -64, 0, 1, 0, 4, 0, 5, 0
+        )
+        format_12 = pack(
+            '>HHLLLLLL', 12, 0, 28, 0, 1, 0x1F600, 0x1F601, 10
+        )
+        subtables = [(0, 3, format_4), (1, 0, pack('>H', 6))]
+        if has_format_12:
+            subtables.append((3, 10, format_12))
+        header = pack('>HH', 0, len(subtables))
+        records, bodies = b'', b''
+        offset = 4 + len(subtables) * 8
+        for platform_id, encoding_id, body in subtables:
+            records += pack(
+                '>HHL', platform_id, encoding_id, offset + len(bodies)
+            )
+            bodies += body
+        bytes_ = b'xx' + header + records + bodies
+        cmap_table = _CmapTable(None, _Stream(bytes_), 2, len(bytes_) - 2)
+        return cmap_table, expected_value
+
+
 class Describe_HeadTable(object):
 
     def it_knows_whether_the_font_is_bold(self, bold_fixture):
@@ -456,6 +717,11 @@ class Describe_HeadTable(object):
         head_table, expected_value = italic_fixture
         assert head_table.is_italic is expected_value
 
+    def it_knows_the_units_per_em(self):
+        bytes_ = b'xxxxyyyy..........\x08\x00' + b'.' * 34
+        head_table = _HeadTable(None, _Stream(bytes_), 0, len(bytes_))
+        assert head_table.units_per_em == 2048
+
     def it_reads_its_macStyle_field_to_help(self, macStyle_fixture):
         head_table, expected_value = macStyle_fixture
         assert head_table._macStyle == expected_value
@@ -487,7 +753,7 @@ class Describe_HeadTable(object):
         bytes_ = (
             b'xxxxyyyy....................................\xF0\xBA........'
         )
-        stream = _Stream(BytesIO(bytes_))
+        stream = _Stream(bytes_)
         offset, length = 0, len(bytes_)
         head_table = _HeadTable(None, stream, offset, length)
         expected_value = 61626
@@ -500,6 +766,25 @@ class Describe_HeadTable(object):
         return property_mock(request, _HeadTable, '_macStyle')
 
 
+class Describe_HheaTable(object):
+
+    def it_knows_its_metrics(self):
+        bytes_ = b'xx' + pack('>4shhhH11hH', b'\x00\x01\x00\x00', 1950,
+                              -550, 0, 3000, *([0]*11 + [3913]))
+        hhea_table = _HheaTable(None, _Stream(bytes_), 2, len(bytes_) - 2)
+        assert hhea_table.ascender == 1950
+        assert hhea_table.descender == -550
+        assert hhea_table.hmetric_count == 3913
+
+
+class Describe_HmtxTable(object):
+
+    def it_reads_the_advance_width_of_each_glyph(self):
+        bytes_ = b'xx' + pack('>HhHhHh', 1038, 0, 0, 0, 463, -20)
+        hmtx_table = _HmtxTable(None, _Stream(bytes_), 2, len(bytes_) - 2)
+        assert hmtx_table.advance_widths(3) == (1038, 0, 463)
+
+
 class Describe_NameTable(object):
 
     def it_knows_the_font_family_name(self, family_fixture):
@@ -8,13 +8,11 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
-from pptx.text.layout import (
-    _BinarySearchTree, _Line, _LineSource, TextFitter
-)
+from pptx.text.layout import _BinarySearchTree, _FontMetrics, TextFitter
 
+from ..unitutil.file import testfile
 from ..unitutil.mock import (
-    call, class_mock, function_mock, initializer_mock, instance_mock,
-    method_mock, property_mock
+    class_mock, initializer_mock, instance_mock, method_mock, property_mock
 )
 
 
@@ -22,18 +20,41 @@ class DescribeTextFitter(object):
 
     def it_can_determine_the_best_fit_font_size(self, best_fit_fixture):
         text, extents, max_size, font_file = best_fit_fixture[:4]
-        _LineSource_, _init_, line_source_ = best_fit_fixture[4:7]
+        _FontMetrics_, _init_, font_metrics_ = best_fit_fixture[4:7]
         _best_fit_font_size_, font_size_ = best_fit_fixture[7:]
 
         font_size = TextFitter.best_fit_font_size(
             text, extents, max_size, font_file
         )
 
-        _LineSource_.assert_called_once_with(text)
-        _init_.assert_called_once_with(line_source_, extents, font_file)
+        _FontMetrics_.from_font_file.assert_called_once_with(font_file)
+        _init_.assert_called_once_with(text, extents, font_metrics_)
         _best_fit_font_size_.assert_called_once_with(max_size)
         assert font_size is font_size_
 
+    def it_can_determine_the_best_fit_sizes_of_many_texts(
+            self, font_metrics, _FontMetrics_):
+        _FontMetrics_.from_font_file.return_value = font_metrics
+        texts = ['foo ba bazz', 'bazz', 'foo  ba\nbazz', 'bazz bazz bazz']
+        extents = (600 * 127, 2400 * 127)
+
+        font_sizes = TextFitter.best_fit_font_sizes(
+            texts, extents, 12, 'foobar.ttf'
+        )
+
+        _FontMetrics_.from_font_file.assert_called_once_with('foobar.ttf')
+        assert font_sizes == [
+            TextFitter(text, extents, font_metrics)._best_fit_font_size(12)
+            for text in texts
+        ]
+        assert font_sizes == [10, 12, 10, 6]
+
+    def it_finds_no_size_when_the_extents_are_empty(self, empty_fixture):
+        text, extents = empty_fixture
+        font_file = testfile('calibriz.ttf')
+        font_size = TextFitter.best_fit_font_size(text, extents, 18, font_file)
+        assert font_size is None
+
     def it_finds_best_fit_font_size_to_help_best_fit(self, _best_fit_fixture):
         text_fitter, max_size, _BinarySearchTree_ = _best_fit_fixture[:3]
         sizes_, predicate_, font_size_ = _best_fit_fixture[3:]
@@ -47,69 +68,34 @@ class DescribeTextFitter(object):
         assert font_size is font_size_
 
     def it_provides_a_fits_inside_predicate_fn(self, fits_pred_fixture):
-        text_fitter, point_size = fits_pred_fixture[:2]
-        _rendered_size_, expected_bool_value = fits_pred_fixture[2:]
+        text_fitter, point_size, _line_count_ = fits_pred_fixture[:3]
+        expected_bool_value = fits_pred_fixture[3]
 
         predicate = text_fitter._fits_inside_predicate
         result = predicate(point_size)
 
-        text_fitter._wrap_lines.assert_called_once_with(
-            text_fitter._line_source, point_size
-        )
-        _rendered_size_.assert_called_once_with(
-            'Ty', point_size, text_fitter._font_file
-        )
+        _line_count_.assert_called_once_with(point_size)
         assert result is expected_bool_value
 
-    def it_provides_a_fits_in_width_predicate_fn(self, fits_cx_pred_fixture):
-        text_fitter, point_size, line = fits_cx_pred_fixture[:3]
-        _rendered_size_, expected_value = fits_cx_pred_fixture[3:]
-
-        predicate = text_fitter._fits_in_width_predicate(point_size)
-        result = predicate(line)
-
-        _rendered_size_.assert_called_once_with(
-            line.text, point_size, text_fitter._font_file
-        )
-        assert result is expected_value
-
-    def it_wraps_lines_to_help_best_fit(self, wrap_fixture):
-        text_fitter, line_source, point_size, remainder = wrap_fixture
+    def it_counts_wrapped_lines_to_help_best_fit(self, line_count_fixture):
+        text_fitter, point_size, expected_value = line_count_fixture
+        assert text_fitter._line_count(point_size) == expected_value
 
-        text_fitter._wrap_lines(line_source, point_size)
-
-        assert text_fitter._break_line.call_args_list == [
-            call(line_source, point_size),
-            call(remainder, point_size)
-        ]
-
-    def it_breaks_off_a_line_to_help_wrap(self, break_fixture):
-        text_fitter, line_source_, point_size = break_fixture[:3]
-        _BinarySearchTree_, bst_, predicate_ = break_fixture[3:6]
-        max_value_ = break_fixture[6]
-
-        value = text_fitter._break_line(line_source_, point_size)
-
-        _BinarySearchTree_.from_ordered_sequence.assert_called_once_with(
-            line_source_
-        )
-        text_fitter._fits_in_width_predicate.assert_called_once_with(
-            point_size
-        )
-        bst_.find_max.assert_called_once_with(predicate_)
-        assert value is max_value_
+    def it_sums_word_widths_to_help_wrap(self, font_metrics):
+        text_fitter = TextFitter('foo ba  bazz', (None, None), font_metrics)
+        assert text_fitter._word_ends == [0, 400, 700, 1200]
 
     # fixtures ---------------------------------------------
 
     @pytest.fixture
-    def best_fit_fixture(self, _LineSource_, _init_, _best_fit_font_size_):
+    def best_fit_fixture(self, _FontMetrics_, _init_, _best_fit_font_size_):
         text, extents, max_size = 'Foobar', (19, 20), 42
         font_file = 'foobar.ttf'
-        line_source_ = _LineSource_.return_value
+        font_metrics_ = _FontMetrics_.from_font_file.return_value
         font_size_ = _best_fit_font_size_.return_value
         return (
-            text, extents, max_size, font_file, _LineSource_,
-            _init_, line_source_, _best_fit_font_size_, font_size_
+            text, extents, max_size, font_file, _FontMetrics_,
+            _init_, font_metrics_, _best_fit_font_size_, font_size_
         )
 
     @pytest.fixture
@@ -124,53 +110,45 @@ class DescribeTextFitter(object):
             font_size_
         )
 
-    @pytest.fixture
-    def break_fixture(
-            self, line_source_, _BinarySearchTree_, bst_,
-            _fits_in_width_predicate_):
-        text_fitter = TextFitter(None, (None, None), None)
-        point_size = 21
-        _BinarySearchTree_.from_ordered_sequence.return_value = bst_
-        predicate_ = _fits_in_width_predicate_.return_value
-        max_value_ = bst_.find_max.return_value
-        return (
-            text_fitter, line_source_, point_size, _BinarySearchTree_, bst_,
-            predicate_, max_value_
-        )
-
-    @pytest.fixture(params=[(49, True), (50, True), (51, False)])
-    def fits_cx_pred_fixture(self, request, _rendered_size_):
-        rendered_width, expected_value = request.param
-        text_fitter = TextFitter(None, (50, None), 'foobar.ttf')
-        point_size, line = 12, _Line('foobar', None)
-        _rendered_size_.return_value = (rendered_width, None)
-        return (
-            text_fitter, point_size, line, _rendered_size_, expected_value
-        )
+    @pytest.fixture(params=[
+        ('Supercalifragilistic', (0, 914400)),
+        ('Supercalifragilistic', (914400, 0)),
+        ('Supercalifragilistic', (-137160, -45720)),
+    ])
+    def empty_fixture(self, request):
+        text, extents = request.param
+        return text, extents
 
     @pytest.fixture(params=[
-        ((66,  99), 6, ('foo', 'bar'), False),
-        ((66, 100), 6, ('foo', 'bar'), True),
-        ((66, 101), 6, ('foo', 'bar'), True),
+        (99,  2,    False),
+        (100, 2,    True),
+        (101, 2,    True),
+        (101, None, False),
     ])
-    def fits_pred_fixture(
-            self, request, line_source_, _wrap_lines_, _rendered_size_):
-        extents, point_size, text_lines, expected_value = request.param
-        text_fitter = TextFitter(line_source_, extents, 'foobar.ttf')
-        _wrap_lines_.return_value = text_lines
-        _rendered_size_.return_value = (None, 50)
-        return text_fitter, point_size, _rendered_size_, expected_value
+    def fits_pred_fixture(self, request, font_metrics_, _line_count_):
+        height, line_count, expected_value = request.param
+        text_fitter = TextFitter('foo bar', (66, height), font_metrics_)
+        point_size = 6
+        _line_count_.return_value = line_count
+        font_metrics_.line_height.return_value = 50
+        return text_fitter, point_size, _line_count_, expected_value
 
-    @pytest.fixture
-    def wrap_fixture(self, _break_line_):
-        text_fitter = TextFitter(None, (None, None), None)
-        point_size = 21
-        line_source, remainder = _LineSource('foo bar'), _LineSource('bar')
-        _break_line_.side_effect = [
-            ('foo', remainder),
-            ('bar', _LineSource('')),
-        ]
-        return text_fitter, line_source, point_size, remainder
+    @pytest.fixture(params=[
+        ('foo ba bazz', 600, 2),
+        ('foo ba bazz', 500, 3),
+        ('foo ba bazz', 399, None),
+        ('foo ba bazz', 1100, 1),
+        ('   ',         100, 0),
+        ('foo ba bazz', 0,   None),
+        ('foo ba bazz', -1080, None),
+    ])
+    def line_count_fixture(self, request, font_metrics):
+        text, width_in_units, expected_value = request.param
+        point_size = 10
+        # at 10pt with 1000 units per em, a font unit is 127 EMU
+        width = width_in_units * 127
+        text_fitter = TextFitter(text, (width, None), font_metrics)
+        return text_fitter, point_size, expected_value
 
     # fixture components -----------------------------------
 
@@ -182,44 +160,30 @@ class DescribeTextFitter(object):
     def _BinarySearchTree_(self, request):
         return class_mock(request, 'pptx.text.layout._BinarySearchTree')
 
-    @pytest.fixture
-    def _break_line_(self, request):
-        return method_mock(request, TextFitter, '_break_line')
-
-    @pytest.fixture
-    def bst_(self, request):
-        return instance_mock(request, _BinarySearchTree)
-
-    @pytest.fixture
-    def _fits_in_width_predicate_(self, request):
-        return method_mock(request, TextFitter, '_fits_in_width_predicate')
-
     @pytest.fixture
     def _fits_inside_predicate_(self, request):
         return property_mock(request, TextFitter, '_fits_inside_predicate')
 
     @pytest.fixture
-    def _init_(self, request):
-        return initializer_mock(request, TextFitter)
+    def font_metrics(self):
+        advance_widths = dict((ord(c), 100) for c in 'abfoz ')
+        return _FontMetrics(advance_widths, 100, 1200, 1000)
 
     @pytest.fixture
-    def _LineSource_(self, request, line_source_):
-        return class_mock(
-            request, 'pptx.text.layout._LineSource',
-            return_value=line_source_
-        )
+    def _FontMetrics_(self, request):
+        return class_mock(request, 'pptx.text.layout._FontMetrics')
 
     @pytest.fixture
-    def line_source_(self, request):
-        return instance_mock(request, _LineSource)
+    def font_metrics_(self, request):
+        return instance_mock(request, _FontMetrics)
 
     @pytest.fixture
-    def _rendered_size_(self, request):
-        return function_mock(request, 'pptx.text.layout._rendered_size')
+    def _init_(self, request):
+        return initializer_mock(request, TextFitter)
 
     @pytest.fixture
-    def _wrap_lines_(self, request):
-        return method_mock(request, TextFitter, '_wrap_lines')
+    def _line_count_(self, request):
+        return method_mock(request, TextFitter, '_line_count')
 
 
 class Describe_BinarySearchTree(object):
@@ -262,36 +226,27 @@ class Describe_BinarySearchTree(object):
         return bst, predicate, expected_value
 
 
-class Describe_LineSource(object):
-
-    def it_generates_text_remainder_pairs(self):
-        line_source = _LineSource('foo bar baz')
-        expected = (
-            ('foo',         _LineSource('bar baz')),
-            ('foo bar',     _LineSource('baz')),
-            ('foo bar baz', _LineSource('')),
-        )
-        assert all((a == b) for a, b in zip(expected, line_source))
+class Describe_FontMetrics(object):
 
+    def it_loads_the_metrics_of_a_font_file_once(self):
+        font_file = testfile('calibriz.ttf')
+        font_metrics = _FontMetrics.from_font_file(font_file)
+        assert font_metrics.text_width('T') == 1014
+        assert _FontMetrics.from_font_file(font_file) is font_metrics
 
-# produces different results on Linux, fails Travis-CI
+    def it_measures_the_width_of_text(self, font_metrics):
+        assert font_metrics.text_width('abc') == 100 + 200 + 150
+        assert font_metrics.space_width == 50
 
-# from pptx.text.layout import _rendered_size
-# from ..unitutil.file import testfile
-# class Describe_rendered_size(object):
+    def it_knows_the_height_of_a_line(self, font_metrics):
+        assert font_metrics.line_height(10) == 152400
 
-#     def it_calculates_the_rendered_size_of_text_at_point_size(self, fixture):
-#         text, point_size, font_file, expected_value = fixture
-#         extents = _rendered_size(text, point_size, font_file)
-#         assert extents == expected_value
+    def it_converts_emu_to_font_units(self, font_metrics):
+        assert font_metrics.to_units(127000, 10) == 1000.0
 
-#     # fixtures ---------------------------------------------
+    # fixtures ---------------------------------------------
 
-#     @pytest.fixture(params=[
-#         ('Typical',     18, (673100, 254000)),
-#         ('foo bar baz', 12, (698500, 165100)),
-#     ])
-#     def fixture(self, request):
-#         text, point_size, expected_value = request.param
-#         font_file = testfile('calibriz.ttf')
-#         return text, point_size, font_file, expected_value
+    @pytest.fixture
+    def font_metrics(self):
+        advance_widths = {ord('a'): 100, ord('b'): 200, ord(' '): 50}
+        return _FontMetrics(advance_widths, 150, 1200, 1000)
@@ -9,22 +9,69 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.compat import is_unicode
-from pptx.dml.color import ColorFormat
+from pptx.dml.color import ColorFormat, RGBColor
 from pptx.dml.fill import FillFormat
 from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, MSO_UNDERLINE, PP_ALIGN
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.shapes.autoshape import Shape
-from pptx.text.text import Font, _Hyperlink, _Paragraph, _Run, TextFrame
+from pptx.text.text import (
+    fit_text_frames, Font, _Hyperlink, _Paragraph, _Run, TextFrame
+)
 from pptx.util import Inches, Pt
 
 from ..oxml.unitdata.text import a_p, a_t, an_hlinkClick, an_r, an_rPr
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import (
-    class_mock, instance_mock, loose_mock, method_mock, property_mock
+    call, class_mock, instance_mock, loose_mock, method_mock, property_mock
 )
 
 
+class DescribeFitTextFrames(object):
+
+    def it_fits_text_frames_grouped_by_extents(self, fit_fixture):
+        text_frames, FontFiles_, TextFitter_ = fit_fixture
+        font_sizes = fit_text_frames(text_frames, 'Family', 42, True, False)
+        FontFiles_.find.assert_called_once_with('Family', True, False)
+        assert TextFitter_.best_fit_font_sizes.call_args_list == [
+            call(['foo', 'baz'], (10, 20), 42, 'f.ttf'),
+            call(['bar'], (30, 40), 42, 'f.ttf'),
+        ]
+        assert font_sizes == [8, 9, 6]
+        for text_frame, font_size in zip(text_frames, font_sizes):
+            text_frame._apply_fit.assert_called_once_with(
+                'Family', font_size, True, False
+            )
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def fit_fixture(self, request, FontFiles_, TextFitter_):
+        text_frames = []
+        for text, extents in (
+                ('foo', (10, 20)), ('bar', (30, 40)), ('baz', (10, 20))):
+            text_frame_ = instance_mock(request, TextFrame)
+            text_frame_.text, text_frame_._extents = text, extents
+            text_frames.append(text_frame_)
+        FontFiles_.find.return_value = 'f.ttf'
+        best_fit_sizes = {(10, 20): [8, 6], (30, 40): [9]}
+        TextFitter_.best_fit_font_sizes.side_effect = (
+            lambda texts, extents, max_size, font_file:
+            best_fit_sizes[extents]
+        )
+        return text_frames, FontFiles_, TextFitter_
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def FontFiles_(self, request):
+        return class_mock(request, 'pptx.text.text.FontFiles')
+
+    @pytest.fixture
+    def TextFitter_(self, request):
+        return class_mock(request, 'pptx.text.text.TextFitter')
+
+
 class DescribeTextFrame(object):
 
     def it_knows_its_autosize_setting(self, autosize_get_fixture):
@@ -72,6 +119,13 @@ class DescribeTextFrame(object):
             assert isinstance(paragraph, _Paragraph)
             assert paragraph._element is ps[idx]
 
+    def it_provides_the_same_paragraph_object_on_each_access(self):
+        text_frame = TextFrame(element('p:txBody/(a:p,a:p)'), None)
+        paragraphs = text_frame.paragraphs
+        assert text_frame.paragraphs == paragraphs
+        paragraph = text_frame.add_paragraph()
+        assert text_frame.paragraphs == paragraphs + (paragraph,)
+
     def it_can_add_a_paragraph_to_itself(self, add_paragraph_fixture):
         text_frame, expected_xml = add_paragraph_fixture
         text_frame.add_paragraph()
@@ -86,6 +140,16 @@ class DescribeTextFrame(object):
         text_frame.text = text
         assert text_frame._element.xml == expected_xml
 
+    def it_can_replace_its_paragraphs(self, set_paragraphs_fixture):
+        text_frame, paragraphs, expected_xml = set_paragraphs_fixture
+        text_frame.set_paragraphs(paragraphs)
+        assert text_frame._element.xml == expected_xml
+
+    def it_raises_on_an_unsupported_paragraph(self, bad_paragraph_fixture):
+        text_frame, paragraph = bad_paragraph_fixture
+        with pytest.raises(ValueError):
+            text_frame.set_paragraphs([paragraph])
+
     def it_raises_on_attempt_to_set_margin_to_non_int(self):
         text_frame = TextFrame(element('p:txBody/a:bodyPr'), None)
         with pytest.raises(TypeError):
@@ -219,6 +283,17 @@ class DescribeTextFrame(object):
         expected_xml = xml(expected_cxml)
         return text_frame, value, expected_xml
 
+    @pytest.fixture(params=[
+        {'text': 'foo', 'runs': ['bar']},
+        {'text': 'foo', 'colour': RGBColor(1, 2, 3)},
+        {'runs': [{'text': 'foo', 'font': 'Arial'}]},
+        {'text': 'foo', 'level': 9},
+    ])
+    def bad_paragraph_fixture(self, request):
+        paragraph = request.param
+        text_frame = TextFrame(element('p:txBody/(a:bodyPr,a:p)'), None)
+        return text_frame, paragraph
+
     @pytest.fixture
     def fit_text_fixture(self, _best_fit_font_size_, _apply_fit_):
         text_frame = TextFrame(None, None)
@@ -297,6 +372,30 @@ class DescribeTextFrame(object):
         expected_xml = xml(expected_cxml)
         return text_frame, family, size, bold, italic, expected_xml
 
+    @pytest.fixture(params=[
+        (['foo', 'bar'],
+         'p:txBody/(a:bodyPr,a:p/a:r/a:t"foo",a:p/a:r/a:t"bar")'),
+        ([],
+         'p:txBody/(a:bodyPr,a:p)'),
+        ([{'text': 'a\nb', 'level': 2, 'bold': True}],
+         'p:txBody/(a:bodyPr,a:p/(a:pPr{lvl=2},a:r/(a:rPr{b=1},a:t"a"),a:br/'
+         'a:rPr{b=1},a:r/(a:rPr{b=1},a:t"b")))'),
+        ([{'runs': ['x', {'text': 'y', 'italic': False, 'size': Pt(12),
+                          'underline': True}], 'bold': True}],
+         'p:txBody/(a:bodyPr,a:p/(a:r/(a:rPr{b=1},a:t"x"),a:r/(a:rPr{sz=1200'
+         ',b=1,i=0,u=sng},a:t"y")))'),
+        ([{'runs': [{'text': 'z', 'name': 'Arial',
+                     'color': RGBColor(0x12, 0x34, 0x56)}]}],
+         'p:txBody/(a:bodyPr,a:p/a:r/(a:rPr/(a:solidFill/a:srgbClr{val=12345'
+         '6},a:latin{typeface=Arial}),a:t"z"))'),
+    ])
+    def set_paragraphs_fixture(self, request):
+        paragraphs, expected_cxml = request.param
+        txBody = element('p:txBody/(a:bodyPr,a:p/a:r/a:t"old",a:p)')
+        text_frame = TextFrame(txBody, None)
+        expected_xml = xml(expected_cxml)
+        return text_frame, paragraphs, expected_xml
+
     @pytest.fixture
     def size_font_fixture(
             self, FontFiles_, TextFitter_, text_prop_, _extents_prop_):